@@ -10,14 +10,22 @@
 
 import logging
 
+from pydicom.rawtransforms import RawTransforms
+
 # Set the type used to hold DS values
 #    default False; was decimal-based in pydicom 0.9.7
 use_DS_decimal = False
 
+raw_transforms = RawTransforms()
+"""The pipeline of functions applied to each RawDataElement before it is
+converted to a DataElement, unless other transforms were given to
+read_file. See pydicom.rawtransforms.RawTransforms.
+"""
+
 data_element_callback = None
 """Set data_element_callback to a function to be called from read_dataset
 every time a RawDataElement has been returned, before it is added
-to the dataset.
+to the dataset. Superseded by raw_transforms, which is applied after it.
 """
 
 data_element_callback_kwargs = {}
@@ -26,10 +34,12 @@ function"""
 
 
 def reset_data_element_callback():
+    """Remove the data_element_callback and all the raw_transforms"""
     global data_element_callback
     global data_element_callback_kwargs
     data_element_callback = None
     data_element_callback_kwargs = {}
+    raw_transforms.clear()
 
 
 def DS_decimal(use_Decimal_boolean=True):
@@ -60,6 +70,13 @@ datetime_conversion = False
 datetime.date, datetime.datetime and datetime.time respectively. Default: False
 """
 
+lazy_multivalue_conversion = False
+"""Set lazy_multivalue_conversion to True to defer converting the items of
+multi-valued elements read from file (e.g. to DS, IS, UID, PersonName) until
+each item is first accessed. Has no effect if enforce_valid_values is True,
+as invalid values must then raise errors when read. Default: False
+"""
+
 
 # Logging system and debug function to change logging level
 logger = logging.getLogger('pydicom')
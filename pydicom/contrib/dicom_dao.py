@@ -31,9 +31,9 @@ Tested with:
 #    available at https://github.com/darcymason/pydicom
 #
 
+import base64
 import hashlib
 import os
-import string
 import couchdb
 import pydicom
 
@@ -62,6 +62,9 @@ class DicomCouch(dict):
     use any DICOM UID. Unfortunately I have written this code under the
     assumption that SeriesInstanceUID will always be used. This will be fixed.
 
+    Storing many objects at once, in one request per batch:
+        db.save_many(dcms)
+
     Retrieving object with key 'foo':
         dcm = db['foo']
 
@@ -81,7 +84,7 @@ class DicomCouch(dict):
         server = couchdb.Server(server)
         try:
             self._db = server[db]
-        except couchdb.client.ResourceNotFound:
+        except couchdb.ResourceNotFound:
             self._db = server.create(db)
 
     def __getitem__(self, key):
@@ -102,40 +105,103 @@ class DicomCouch(dict):
 
     def __setitem__(self, key, dcm):
         """ Write the supplied DICOM object to the database """
-        try:
-            dcm.PixelData = dcm.pixel_array.tostring()
-        except AttributeError:
-            pass  # Silently ignore errors due to pixel_array not existing
-        except NotImplementedError:
-            pass  # Silently ignore attempts to modify compressed pixel data
-        except TypeError:
-            pass  # Silently ignore errors due to PixelData not existing
-
-        jsn, binary_elements, file_meta_binary_elements = pydicom2json(dcm)
-        _strip_elements(jsn, binary_elements)
-        _strip_elements(jsn['file_meta'], file_meta_binary_elements)
-        if dcm.SeriesInstanceUID in self._meta:
-            self.__set_meta_info_jsn(jsn, dcm)
-
-        try:  # Actually write to the db
-            self._db[key] = jsn
-        except TypeError as type_error:
-            if str(type_error) == 'string indices must be integers, not str':
-                pass
+        success, key, error = self.__save([(key, dcm)])[0]
+        if not success:
+            raise error
 
-        if dcm.SeriesInstanceUID not in self._meta:
-            self._meta[dcm.SeriesInstanceUID] = {}
-            self._meta[dcm.SeriesInstanceUID]['hashes'] = {}
+    def save_many(self, dcms, batch_size=100):
+        """ Write the supplied DICOM objects to the database
+
+        Each object is stored under its SeriesInstanceUID. The objects are
+        sent in batches of batch_size to the couchdb _bulk_docs API, with
+        their new and modified binary elements as inline attachments, so
+        there is one HTTP request per batch (over the server connection
+        that is reused for all requests), and no request to read back the
+        revisions.
+
+        Returns a list of (success, key, revision or exception) tuples, one
+        for each object, as python-couchdb's Database.update() does.
+
+        """
+        results = []
+        batch = []
+        for dcm in dcms:
+            batch.append((uid2str(dcm.SeriesInstanceUID), dcm))
+            if len(batch) == batch_size:
+                results.extend(self.__save(batch))
+                batch = []
+        if batch:
+            results.extend(self.__save(batch))
+        return results
+
+    def __save(self, items):
+        """ Write a batch of (key, DICOM object) with a single request """
+        docs = []
+        uploads = []
+        for key, dcm in items:
+            # Only if the pixel data was decoded, it may have been modified
+            # (it is stored from a clone, leaving the caller's dataset as is)
+            pixel_array = getattr(dcm, '_pixel_array', None)
+            if pixel_array is not None:
+                dcm = dcm.clone()
+                dcm.PixelData = pixel_array.tobytes()
+
+            jsn, binary_elements, file_meta_binary_elements = \
+                pydicom2json(dcm)
+            _strip_elements(jsn, binary_elements)
+            _strip_elements(jsn['file_meta'], file_meta_binary_elements)
+            jsn['_id'] = key
+            if dcm.SeriesInstanceUID in self._meta:
+                jsn['_rev'] = \
+                    self._meta[dcm.SeriesInstanceUID]['doc']['_rev']
+            jsn['_attachments'], uploaded = \
+                self.__attachments(dcm, binary_elements)
+            docs.append(jsn)
+            uploads.append(uploaded)
+
+        results = self._db.update(docs)
+
+        # Keep a local copy of each stored document for the next save and
+        # for DELETE operations, with the attachments as stubs
+        for (key, dcm), jsn, uploaded, (success, id, rev) in \
+                zip(items, docs, uploads, results):
+            if not success:
+                continue
+            jsn['_rev'] = rev
+            jsn['_attachments'] = dict((id, {'stub': True})
+                                       for id in jsn['_attachments'])
+            if dcm.SeriesInstanceUID not in self._meta:
+                self._meta[dcm.SeriesInstanceUID] = {}
+                self._meta[dcm.SeriesInstanceUID]['hashes'] = {}
+            self._meta[dcm.SeriesInstanceUID]['hashes'].update(uploaded)
+            self._meta[dcm.SeriesInstanceUID]['doc'] = jsn
+        return results
+
+    def __attachments(self, dcm, binary_elements):
+        """ Return the _attachments of the document of the DICOM object
+
+        New and modified binary elements are included inline; the others
+        are stubs, which keep the attachments already stored. Also returns
+        the hashes of the included elements.
 
-        self.__put_attachments(dcm, binary_elements, jsn)
-        # Get a local copy of the document
-        # We get this from couch because we get the _id, _rev and _attachments
-        # keys which will ensure we don't overwrite the attachments we just
-        # uploaded.
-        # I don't really like the extra HTTP GET and I think we can generate
-        # what we need without doing it. Don't have time to work out how yet.
-        self._meta[dcm.SeriesInstanceUID]['doc'] = \
-            self._db[dcm.SeriesInstanceUID]
+        """
+        try:
+            stored = self._meta[dcm.SeriesInstanceUID]['doc']['_attachments']
+        except KeyError:
+            stored = {}
+        attachments = {}
+        uploaded = {}
+        for tagstack, element in binary_elements:
+            id = _tagstack2id(tagstack + [element.tag])
+            if id in stored and \
+                    not self.__attachment_update_needed(dcm, id, element):
+                attachments[id] = {'stub': True}
+            else:
+                attachments[id] = {
+                    'content_type': 'application/octet-stream',
+                    'data': base64.b64encode(element.value).decode('ascii')}
+                uploaded[id] = hashlib.md5(element.value)
+        return attachments, uploaded
 
     def __str__(self):
         """ Return the string representation of the couchdb client """
@@ -157,32 +223,11 @@ class DicomCouch(dict):
             _add_element(dcm, tagstack, value)
             self._meta[dcm.SeriesInstanceUID]['hashes'][id] = hashlib.md5(value)
 
-    def __put_attachments(self, dcm, binary_elements, jsn):
-        """ Upload all new and modified attachments """
-        elements_to_update = \
-            [(tagstack, item)
-             for tagstack, item in binary_elements
-             if self.__attachment_update_needed(dcm,
-                                                _tagstack2id(tagstack + [item.tag]), item)
-            ]  # nopep8
-        for tagstack, element in elements_to_update:
-            id = _tagstack2id(tagstack + [element.tag])
-            self._db.put_attachment(jsn, element.value, id)
-            self._meta[dcm.SeriesInstanceUID]['hashes'][id] = \
-                hashlib.md5(element.value)
-
     def delete(self, dcm):
         """ Delete from database and remove meta info from the DAO """
         self._db.delete(self._meta[dcm.SeriesInstanceUID]['doc'])
         self._meta.pop(dcm.SeriesInstanceUID)
 
-    def __set_meta_info_jsn(self, jsn, dcm):
-        """ Set the couch-specific meta data for supplied dict """
-        jsn['_rev'] = self._meta[dcm.SeriesInstanceUID]['doc']['_rev']
-        if '_attachments' in self._meta[dcm.SeriesInstanceUID]['doc']:
-            jsn['_attachments'] = \
-                self._meta[dcm.SeriesInstanceUID]['doc']['_attachments']
-
     def __attachment_update_needed(self, dcm, id, binary_element):
         """ Compare hashes for binary element and return true if different """
         try:
@@ -213,7 +258,7 @@ def _add_element(dcm, tagstack, value):
 
 def _tagstack2id(tagstack):
     """ Convert a list of tags to a unique (within document) attachment id """
-    return string.join([str(tag) for tag in tagstack], ':')
+    return ':'.join([str(tag) for tag in tagstack])
 
 
 def _strip_elements(jsn, elements):
@@ -278,7 +323,11 @@ def pydicom2json(dcm):
     retrieve the attachment we can then insert it at the appropriate point in
     the tree.
 
+    The supplied object is not changed; its private tags are removed and its
+    values decoded in a clone.
+
     """
+    dcm = dcm.clone()
     dcm.remove_private_tags()  # No support for now
     dcm.decode()               # Convert to unicode
     binary_elements = []
@@ -327,6 +376,8 @@ def __typemap(value):
         return uid2str(value)
     elif isinstance(value, pydicom.tag.BaseTag):
         return int(value)
+    elif isinstance(value, pydicom.valuerep.PersonName3):
+        return str(value)  # Not a str subclass on Python 3
     else:
         return value
 
@@ -394,7 +445,7 @@ if __name__ == '__main__':
     couch = couchdb.Server(SERVER)
     try:
         couch.delete(TESTDB)
-    except couchdb.client.ResourceNotFound:
+    except couchdb.ResourceNotFound:
         pass  # Don't worry if it didn't exist
 
     db = DicomCouch(SERVER, TESTDB)
@@ -404,6 +455,4 @@ if __name__ == '__main__':
     testfiles = [x for x in testfiles if x.endswith('dcm')]
     testfiles = [os.path.join('../testfiles', x) for x in testfiles]
 
-    for dcmfile in testfiles:
-        dcm = pydicom.read_file(dcmfile)
-        db[dcm.SeriesInstanceUID] = dcm
+    db.save_many(pydicom.read_file(dcmfile) for dcmfile in testfiles)
@@ -21,6 +21,8 @@ and Python Imaging Library:   http://www.pythonware.com/products/pil/
 # Tested on Python 2.5.4 (32-bit) on Mac OS X 10.6
 #    using numpy 1.3.0 and PIL 1.1.7b1
 
+from collections import OrderedDict
+
 have_PIL = True
 try:
     import PIL.Image
@@ -34,21 +36,93 @@ except ImportError:
     have_numpy = False
 
 
+def _window_value(value, index):
+    """Return window `index` of a (possibly multi-valued) WindowWidth or
+    WindowCenter value, as a float."""
+    if isinstance(value, list):
+        value = value[index]
+    return float(value)
+
+
+# The most recently used Look-Up Tables, by (type code, window, level),
+# from the least to the most recently used
+_LUTs = OrderedDict()
+_max_LUTs = 16
+
+
+def _LUT(kind, itemsize, window, level):
+    """Return the uint8 Look-Up Table of the window/level for every value of
+    an integer type of at most 16 bits, indexed by the unsigned value with
+    the same bits (so signed data must be viewed as unsigned)."""
+    key = (kind, itemsize, window, level)
+    LUT = _LUTs.pop(key, None)
+    if LUT is None:
+        values = np.arange(2 ** (8 * itemsize), dtype='u%d' % itemsize)
+        values = values.view('%s%d' % (kind, itemsize)).astype(np.float32)
+        LUT = get_LUT_value(values, window, level)
+        if len(_LUTs) >= _max_LUTs:
+            _LUTs.popitem(last=False)  # the least recently used
+    _LUTs[key] = LUT
+    return LUT
+
+
 def get_LUT_value(data, window, level):
-    """Apply the RGB Look-Up Table for the given data and window/level value."""
+    """Apply the RGB Look-Up Table for the given data and window/level value.
+
+    Returns a uint8 array of the shape of `data` (which may hold several
+    frames). Integer data of at most 16 bits is mapped through a table with
+    an entry for every stored value; other data is windowed in float32.
+    """
     if not have_numpy:
         raise ImportError("Numpy is not available. See http://numpy.scipy.org/"
                           " to download and install")
 
-    return np.piecewise(data,
-                        [data <= (level - 0.5 - (window - 1) / 2),
-                         data > (level - 0.5 + (window - 1) / 2)],
-                        [0, 255, lambda data: ((data - (level - 0.5)) /
-                         (window - 1) + 0.5) * (255 - 0)])
-
-
-def get_PIL_image(dataset):
-    """Get Image object from Python Imaging Library(PIL)"""
+    data = np.asarray(data)
+    window, level = float(window), float(level)
+    kind, itemsize = data.dtype.kind, data.dtype.itemsize
+    if kind in 'iu' and itemsize <= 2:
+        LUT = _LUT(kind, itemsize, window, level)
+        if kind == 'i':
+            # Same bits as unsigned (and same byte order)
+            data = data.view(data.dtype.str.replace('i', 'u'))
+        return LUT[data]
+    if window <= 1:
+        # No values between 0 and 255
+        return np.where(data > level - 0.5, 255, 0).astype(np.uint8)
+
+    # Same as 0 up to, and 255 from the edges of the window, linear between
+    image = data.astype(np.float32)
+    image -= level - 0.5
+    image *= 255.0 / (window - 1)
+    image += 255 * 0.5
+    np.clip(image, 0, 255, out=image)
+    image += 0.5  # round when truncating to uint8
+    return image.astype(np.uint8)
+
+
+def _get_LUT_frames(dataset, window_index):
+    """Return the pixel data of `dataset` with its window applied, as a uint8
+    array of frames (even if the dataset has a single frame)."""
+    frames = get_LUT_value(dataset.pixel_array,
+                           _window_value(dataset.WindowWidth, window_index),
+                           _window_value(dataset.WindowCenter, window_index))
+    # A single frame has no frame axis, whatever its samples per pixel
+    if int(dataset.get('NumberOfFrames', 1)) == 1:
+        frames = frames[np.newaxis]
+    return frames
+
+
+def _LUT_image(frame):
+    """Return the PIL image of a frame with its window applied.
+
+    The LUT has only 256 values, so the image is mode L, or RGB if the frame
+    has three samples per pixel:
+      http://www.pythonware.com/library/pil/handbook/image.htm
+    """
+    return PIL.Image.fromarray(frame, 'RGB' if frame.ndim == 3 else 'L')
+
+
+def _check_dataset(dataset):
     if not have_PIL:
         raise ImportError("Python Imaging Library is not available. "
                           "See http://www.pythonware.com/products/pil/ "
@@ -56,6 +130,16 @@ def get_PIL_image(dataset):
     if ('PixelData' not in dataset):
         raise TypeError("Cannot show image -- DICOM dataset does not have "
                         "pixel data")
+
+
+def get_PIL_image(dataset, window_index=0):
+    """Get Image object from Python Imaging Library(PIL)
+
+    If the dataset has several windows (multi-valued WindowWidth and
+    WindowCenter), window `window_index` is used. Of a multi-frame dataset,
+    the first frame is returned; see get_PIL_images for all of them.
+    """
+    _check_dataset(dataset)
     # can only apply LUT if these window info exists
     if ('WindowWidth' not in dataset) or ('WindowCenter' not in dataset):
         bits = dataset.BitsAllocated
@@ -82,15 +166,23 @@ def get_PIL_image(dataset):
                                   "raw", mode, 0, 1)
 
     else:
-        image = get_LUT_value(dataset.pixel_array, dataset.WindowWidth,
-                              dataset.WindowCenter)
-        # Convert mode to L since LUT has only 256 values:
-        #   http://www.pythonware.com/library/pil/handbook/image.htm
-        im = PIL.Image.fromarray(image).convert('L')
+        im = _LUT_image(_get_LUT_frames(dataset, window_index)[0])
 
     return im
 
 
+def get_PIL_images(dataset, window_index=0):
+    """Get a list of PIL Image objects, one for each frame of the dataset,
+    which must have a WindowWidth and WindowCenter. The window is applied
+    to all frames at once; see get_PIL_image for `window_index`."""
+    _check_dataset(dataset)
+    if ('WindowWidth' not in dataset) or ('WindowCenter' not in dataset):
+        raise TypeError("Cannot apply LUT -- DICOM dataset does not have "
+                        "WindowWidth and WindowCenter")
+    return [_LUT_image(frame)
+            for frame in _get_LUT_frames(dataset, window_index)]
+
+
 def show_PIL(dataset):
     """Display an image using the Python Imaging Library (PIL)"""
     im = get_PIL_image(dataset)
@@ -39,13 +39,18 @@ from __future__ import print_function
 # - Deferred loading of data, warm: 3 sec
 
 
+from collections import OrderedDict
 import os
+import pickle
+import sys
+import tempfile
 import time
-import gc
+from multiprocessing.pool import ThreadPool
 
 import pydicom
 from pydicom.sequence import Sequence
 from pydicom import compat
+from pydicom.util.extract import _plain_value
 
 # Try importing numpy
 try:
@@ -142,170 +147,376 @@ def _listFiles(files, path):
             files.append(item)
 
 
-def _splitSerieIfRequired(serie, series):
-    """ _splitSerieIfRequired(serie, series)
-    Split the serie in multiple series if this is required.
-    The choice is based on examing the image position relative to
-    the previous image. If it differs too much, it is assumed
-    that there is a new dataset. This can happen for example in
-    unspitted gated CT data.
-    """
+# Tags of the elements used to order the slices and check the series
+_instanceNumberTag = pydicom.tag.Tag(0x0020, 0x0013)
+_imagePositionTag = pydicom.tag.Tag(0x0020, 0x0032)
+_imageOrientationTag = pydicom.tag.Tag(0x0020, 0x0037)
+_rowsTag = pydicom.tag.Tag(0x0028, 0x0010)
+_columnsTag = pydicom.tag.Tag(0x0028, 0x0011)
+_pixelSpacingTag = pydicom.tag.Tag(0x0028, 0x0030)
 
-    # Sort the original list and get local name
-    serie._sort()
-    L = serie._datasets
-
-    # Init previous slice
-    ds1 = L[0]
+# Positions (in mm) and direction cosines closer than this are the same
+_geometryTolerance = 1e-4
 
-    # Check whether we can do this
-    if "ImagePositionPatient" not in ds1:
-        return
 
-    # Initialize a list of new lists
-    L2 = [[ds1]]
+def _getValue(ds, tag, default=None):
+    """ Get the value of an element by tag, or default if it is absent. """
+    try:
+        return ds[tag].value
+    except KeyError:
+        return default
 
-    # Init slice distance estimate
-    distance = 0
 
-    for index in range(1, len(L)):
+def _instanceNumber(ds):
+    """ The instance number of a dataset, as a float (0 if absent). """
+    return float(_getValue(ds, _instanceNumberTag) or 0)
 
-        # Get current slice
-        ds2 = L[index]
 
-        # Get positions
-        pos1 = float(ds1.ImagePositionPatient[2])
-        pos2 = float(ds2.ImagePositionPatient[2])
-
-        # Get distances
-        newDist = abs(pos1 - pos2)
-        # deltaDist = abs(firstPos-pos2)
-
-        # If the distance deviates more than 2x from what we've seen,
-        # we can agree it's a new dataset.
-        if distance and newDist > 2.1 * distance:
-            L2.append([])
-            distance = 0
-        else:
-            # Test missing file
-            if distance and newDist > 1.5 * distance:
-                print('Warning: missing file after "%s"' % ds1.filename)
-            distance = newDist
-
-        # Add to last list
-        L2[-1].append(ds2)
+def _getGeometry(datasets):
+    """ _getGeometry(datasets)
+    Gather the instance numbers, image positions and image orientations
+    of the datasets in numpy arrays of shape (n,), (n, 3) and (n, 6).
+    Returns None if a dataset does not have a valid position and
+    orientation.
+    """
+    n = len(datasets)
+    numbers = np.empty(n)
+    positions = np.empty((n, 3))
+    orientations = np.empty((n, 6))
+    try:
+        for i, ds in enumerate(datasets):
+            position = _getValue(ds, _imagePositionTag)
+            orientation = _getValue(ds, _imageOrientationTag)
+            if position is None or orientation is None:
+                return None
+            positions[i] = [float(v) for v in position]
+            orientations[i] = [float(v) for v in orientation]
+            numbers[i] = _instanceNumber(ds)
+    except ValueError:
+        return None
+    return numbers, positions, orientations
+
+
+def _splitStacks(datasets):
+    """ _splitStacks(datasets)
+    Split the datasets of a serie in stacks of parallel slices.
+
+    Each slice position is projected on the normal of its slice, which
+    gives the distance between slices also for gantry tilted data. In
+    the order of the instance numbers, a new stack starts where the
+    orientation changes, or where the step to the next slice reverses
+    or is more than 2.1 times the typical step. This can happen for
+    example in unsplitted gated CT data. Slices at the same position
+    (e.g. the timepoints of dynamic data) stay in the same stack.
+
+    Returns a list with an array of dataset indices and an array of
+    slice positions for each stack, sorted along the slice normal, or
+    None if the datasets do not all have a position and orientation.
+    """
+    geometry = _getGeometry(datasets)
+    if geometry is None:
+        return None
+    numbers, positions, orientations = geometry
+    normals = np.cross(orientations[:, :3], orientations[:, 3:])
+    distances = np.einsum('ij,ij->i', positions, normals)
+
+    order = np.argsort(numbers, kind='mergesort')
+    steps = np.diff(distances[order])
+    stepSizes = np.abs(steps)
+    moving = stepSizes > _geometryTolerance
+
+    # Orientation changes always start a new stack
+    turns = np.abs(np.diff(orientations[order], axis=0))
+    breaks = turns.max(axis=1) > _geometryTolerance
+    # Steps to another orientation do not count for the typical step
+    counted = moving & ~breaks
+    if counted.any():
+        # A stack is made of steps of about the same size and direction;
+        # zero steps (repeated positions) do not break it
+        typical = np.median(stepSizes[counted])
+        direction = np.sign(np.median(steps[counted]))
+        if direction == 0:
+            # As many steps forward as back: take that of the first step
+            direction = np.sign(steps[counted][0])
+        breaks |= moving & ((stepSizes > 2.1 * typical) |
+                            (np.sign(steps) != direction))
+        # Test missing files
+        for index in np.flatnonzero(~breaks & (stepSizes > 1.5 * typical)):
+            print('Warning: missing file after "%s"' %
+                  datasets[order[index]].filename)
+
+    stacks = []
+    for stack in np.split(order, np.flatnonzero(breaks) + 1):
+        stack = stack[np.argsort(distances[stack], kind='mergesort')]
+        stacks.append((stack, distances[stack]))
+    return stacks
 
-        # Store previous
-        ds1 = ds2
 
-    # Split if we should
-    if len(L2) > 1:
+def _splitSerieIfRequired(serie, series):
+    """ _splitSerieIfRequired(serie, series)
+    Sort the slices of the serie along the slice normal, and split the
+    serie in multiple series if this is required (see _splitStacks).
+    Without numpy, or if the slice positions are not known, the slices
+    are sorted by instance number.
+    """
 
-        # At what position are we now?
-        i = series.index(serie)
+    stacks = None
+    if have_numpy:
+        stacks = _splitStacks(serie._datasets)
+    if stacks is None:
+        serie._sort()
+        return
+    L = serie._datasets
 
-        # Create new series
-        series2insert = []
-        for L in L2:
-            newSerie = DicomSeries(serie.suid, serie._showProgress)
-            newSerie._datasets = Sequence(L)
-            series2insert.append(newSerie)
+    # Create a serie for each stack
+    series2insert = []
+    for stack, distances in stacks:
+        newSerie = DicomSeries(serie.suid, serie._showProgress)
+        newSerie._datasets = Sequence([L[index] for index in stack])
+        newSerie._distances = distances
+        series2insert.append(newSerie)
 
-        # Insert series and remove self
-        for newSerie in reversed(series2insert):
-            series.insert(i, newSerie)
-        series.remove(serie)
+    # Replace the serie by the new series, at the same position
+    i = series.index(serie)
+    series[i:i + 1] = series2insert
 
 
 pixelDataTag = pydicom.tag.Tag(0x7fe0, 0x0010)
 
 
-def _getPixelDataFromDataset(ds):
-    """ Get the pixel data from the given dataset. If the data
-    was deferred, make it deferred again, so that memory is
-    preserved. Also applies RescaleSlope and RescaleIntercept
-    if available. """
-
-    # Get original element
-    el = dict.__getitem__(ds, pixelDataTag)
-
-    # Get data
-    data = ds.pixel_array
-
-    # Remove data (mark as deferred)
-    dict.__setitem__(ds, pixelDataTag, el)
-    del ds._pixel_array
-
-    # Obtain slope and offset
-    slope = 1
-    offset = 0
-    needFloats = False
-    needApplySlopeOffset = False
-    if 'RescaleSlope' in ds:
-        needApplySlopeOffset = True
-        slope = ds.RescaleSlope
-    if 'RescaleIntercept' in ds:
-        needApplySlopeOffset = True
-        offset = ds.RescaleIntercept
+def _readHeader(filename, readPixelData, force, specific_tags=None):
+    """ Read a dicom file for read_files, stopping before the pixel
+    data unless readPixelData is True, and reading only specific_tags
+    if given. Returns (dataset, None), or (None, None) if the file is
+    not dicom, or (None, error) if it could not be read. This is called
+    in the worker threads, so it does not print or report progress. """
+    try:
+        dcm = pydicom.read_file(filename, stop_before_pixels=not readPixelData,
+                                force=force, specific_tags=specific_tags)
+    except pydicom.filereader.InvalidDicomError:
+        return None, None  # skip non-dicom file
+    except Exception as why:
+        return None, why
+    return dcm, None
+
+
+# The elements kept in a read_files cache: those needed to group, sort,
+# split and check the series, and to load and describe the pixel data
+_cachedTags = sorted(pydicom.datadict.tag_for_keyword(keyword) for keyword in [
+    'SOPClassUID', 'SOPInstanceUID', 'StudyDate', 'SeriesDate', 'Modality',
+    'StudyDescription', 'SeriesDescription', 'PatientName', 'PatientID',
+    'SliceThickness', 'StudyInstanceUID', 'SeriesInstanceUID',
+    'SeriesNumber', 'AcquisitionNumber', 'InstanceNumber',
+    'ImagePositionPatient', 'ImageOrientationPatient', 'SliceLocation',
+    'ImageComments', 'SamplesPerPixel', 'PhotometricInterpretation', 'Rows',
+    'Columns', 'PixelSpacing', 'BitsAllocated', 'BitsStored', 'HighBit',
+    'PixelRepresentation', 'WindowCenter', 'WindowWidth',
+    'RescaleIntercept', 'RescaleSlope'])
+
+
+def _loadCache(filename):
+    """ Load the entries of a read_files cache: a dict that maps the
+    absolute file names to (size, mtime, record) tuples. Returns an
+    empty dict if there is no cache yet, or if it cannot be used. """
+    try:
+        with open(filename, 'rb') as f:
+            tags, entries = pickle.load(f)
+    except (IOError, OSError):
+        return {}
+    except Exception as why:
+        print('Warning: ignoring cache "%s": %s' % (filename, why))
+        return {}
+    if tags != [int(tag) for tag in _cachedTags]:
+        return {}  # made by a version that cached other elements
+    return entries
+
+
+def _saveCache(filename, entries):
+    """ Save the entries of a read_files cache. The file is replaced
+    at once, so that a cache is never left half written. """
+    tmpFilename = filename + '.tmp'
+    with open(tmpFilename, 'wb') as f:
+        pickle.dump(([int(tag) for tag in _cachedTags], entries), f,
+                    pickle.HIGHEST_PROTOCOL)
+    if os.path.exists(filename) and not hasattr(os, 'replace'):
+        os.remove(filename)  # Python 2 can't rename over a file on Windows
+    getattr(os, 'replace', os.rename)(tmpFilename, filename)
+
+
+def _cachedValue(value):
+    """ Get an element value as a plain python value for the cache.
+    Numbers read from a decimal or integer string keep their original
+    string, so that they are the same when the dataset is recreated. """
+    if isinstance(value, (list, tuple)):
+        return [_cachedValue(val) for val in value]
+    original = getattr(value, 'original_string', None)
+    if original is not None:
+        return original
+    return _plain_value(value)
+
+
+def _recordFromDataset(ds):
+    """ Get the cache record of a dataset: a list of (tag, VR, value)
+    for the cached elements it has, with plain python values. """
+    record = []
+    for tag in _cachedTags:
+        if tag in ds:
+            el = ds[tag]
+            record.append((int(tag), el.VR, _cachedValue(el.value)))
+    return record
+
+
+def _datasetFromRecord(filename, record):
+    """ Create a dataset with the elements of a cache record, which
+    reads its pixel data from the given file when needed. """
+    ds = pydicom.dataset.Dataset()
+    for tag, VR, value in record:
+        ds.add_new(tag, VR, value)
+    ds.filename = filename
+    return ds
+
+
+def _readCached(filename, force, entries):
+    """ Read the cached elements of a dicom file for read_files, or take
+    them from the cache entries if the size and modification time of
+    the file did not change. Returns (dataset, why, entry) where
+    dataset and why are as for _readHeader, and entry is the new cache
+    entry of the file, or None if it could not be read. """
+    try:
+        stat = os.stat(filename)
+    except OSError as why:
+        return None, why, None
+    key = stat.st_size, stat.st_mtime
+    entry = entries.get(filename)
+    if entry is None or entry[:2] != key:
+        dcm, why = _readHeader(filename, False, force, _cachedTags)
+        if why is not None:
+            return None, why, None
+        record = None if dcm is None else _recordFromDataset(dcm)
+        entry = key + (record,)
+    if entry[2] is None:
+        return None, None, entry  # not dicom
+    return _datasetFromRecord(filename, entry[2]), None, entry
+
+
+def _rescaleParameters(ds):
+    """ Return (slope, offset, needFloats) for the RescaleSlope and
+    RescaleIntercept of the given dataset, or None if it has neither. """
+    if 'RescaleSlope' not in ds and 'RescaleIntercept' not in ds:
+        return None
+    slope = ds.get('RescaleSlope', 1)
+    offset = ds.get('RescaleIntercept', 0)
     if int(slope) != slope or int(offset) != offset:
-        needFloats = True
-    if not needFloats:
-        slope, offset = int(slope), int(offset)
-
-    # Apply slope and offset
-    if needApplySlopeOffset:
-
-        # Maybe we need to change the datatype?
-        if data.dtype in [np.float32, np.float64]:
-            pass
-        elif needFloats:
-            data = data.astype(np.float32)
+        return float(slope), float(offset), True
+    return int(slope), int(offset), False
+
+
+def _getDtype(ds):
+    """ Get the data type of the (rescaled) pixel data of the given
+    dataset. It is decided from the range of values the header allows
+    (BitsStored and PixelRepresentation) and the RescaleSlope and
+    RescaleIntercept, not from the data, so that it is the same for
+    all slices of a series. Returns None if no rescaling is needed,
+    in which case the data type is that of the pixel data itself. """
+
+    rescale = _rescaleParameters(ds)
+    if rescale is None:
+        return None
+    slope, offset, needFloats = rescale
+    if needFloats:
+        return np.float32
+
+    # Range of the stored values
+    bits = ds.get('BitsStored', ds.get('BitsAllocated', 16))
+    if ds.get('PixelRepresentation', 0) == 1:
+        minStored, maxStored = -2 ** (bits - 1), 2 ** (bits - 1) - 1
+    else:
+        minStored, maxStored = 0, 2 ** bits - 1
+
+    # Determine required range, including the stored values and the
+    # values after applying the slope, as rescaling is done in place
+    values = [minStored, maxStored, minStored * slope, maxStored * slope,
+              minStored * slope + offset, maxStored * slope + offset]
+    minReq, maxReq = min(values), max(values)
+
+    # Determine required datatype from that
+    if minReq < 0:
+        # Signed integer type
+        maxReq = max([-minReq, maxReq])
+        if maxReq < 2 ** 7:
+            return np.int8
+        elif maxReq < 2 ** 15:
+            return np.int16
+        elif maxReq < 2 ** 31:
+            return np.int32
         else:
-            # Determine required range
-            minReq, maxReq = data.min(), data.max()
-            minReq = min([minReq, minReq * slope + offset, maxReq * slope + offset])
-            maxReq = max([maxReq, minReq * slope + offset, maxReq * slope + offset])
-
-            # Determine required datatype from that
-            dtype = None
-            if minReq < 0:
-                # Signed integer type
-                maxReq = max([-minReq, maxReq])
-                if maxReq < 2 ** 7:
-                    dtype = np.int8
-                elif maxReq < 2 ** 15:
-                    dtype = np.int16
-                elif maxReq < 2 ** 31:
-                    dtype = np.int32
-                else:
-                    dtype = np.float32
-            else:
-                # Unsigned integer type
-                if maxReq < 2 ** 8:
-                    dtype = np.uint8
-                elif maxReq < 2 ** 16:
-                    dtype = np.uint16
-                elif maxReq < 2 ** 32:
-                    dtype = np.uint32
-                else:
-                    dtype = np.float32
+            return np.float32
+    else:
+        # Unsigned integer type
+        if maxReq < 2 ** 8:
+            return np.uint8
+        elif maxReq < 2 ** 16:
+            return np.uint16
+        elif maxReq < 2 ** 32:
+            return np.uint32
+        else:
+            return np.float32
+
 
-            # Change datatype
-            if dtype != data.dtype:
-                data = data.astype(dtype)
+def _getPixelDataFromDataset(ds, dtype=None, out=None):
+    """ Get the pixel data from the given dataset. If only the
+    header was read, only the pixel data element is read from the
+    file, and not kept, so that memory is preserved. Also applies
+    RescaleSlope and RescaleIntercept if available, using the
+    given data type (by default that given by _getDtype). If out
+    is given, the data is stored in it and it is returned. """
 
-        # Apply slope and offset
-        data *= slope
-        data += offset
+    if pixelDataTag in ds:
+        # Get original element
+        el = dict.__getitem__(ds, pixelDataTag)
+
+        # Get data
+        data = ds.pixel_array
+
+        # Remove data (mark as deferred)
+        dict.__setitem__(ds, pixelDataTag, el)
+        del ds._pixel_array
+    else:
+        # Read only the pixel data element (and the file meta info), and
+        # take the elements that describe it from the header
+        pixelDs = pydicom.read_file(ds.filename, force=True,
+                                    specific_tags=[pixelDataTag])
+        for tag in ds.keys():
+            if tag not in pixelDs:
+                pixelDs[tag] = dict.__getitem__(ds, tag)
+        data = pixelDs.pixel_array
+
+    rescale = _rescaleParameters(ds)
+    if dtype is None:
+        dtype = _getDtype(ds)
+
+    # Apply slope and offset, converting to the data type first
+    if out is None:
+        if rescale is not None and data.dtype != dtype:
+            data = data.astype(dtype)
+        out = data
+    else:
+        out[...] = data
+    if rescale is not None:
+        slope, offset, needFloats = rescale
+        out *= slope
+        out += offset
 
     # Done
-    return data
+    return out
 
 
 # The public functions and classes
 
-def read_files(path, showProgress=False, readPixelData=False, force=False):
-    """ read_files(path, showProgress=False, readPixelData=False)
+def read_files(path, showProgress=False, readPixelData=False, force=False,
+               workers=4, cache=None):
+    """ read_files(path, showProgress=False, readPixelData=False,
+                   force=False, workers=4, cache=None)
 
     Reads dicom files and returns a list of DicomSeries objects, which
     contain information about the data, and can be used to load the
@@ -321,9 +532,22 @@ def read_files(path, showProgress=False, readPixelData=False, force=False):
     to stdout. By default, no progress is shown.
 
     if readPixelData is True, the pixel data of all series is read. By
-    default the loading of pixeldata is deferred until it is requested
-    using the DicomSeries.get_pixel_array() method. In general, both
-    methods should be equally fast.
+    default only the headers are read (up to the pixel data), and the
+    pixel data is read from the files when it is requested using the
+    DicomSeries.get_pixel_array() method.
+
+    The files are read by a pool of "workers" threads, which mostly
+    helps when the files are on a network file system. The series
+    are put together in the calling thread, in the order of the files,
+    so the result does not depend on the number of workers.
+
+    If "cache" is the name of a file, the elements needed to make up
+    the series are stored in it for each file, with its size and
+    modification time. Calling read_files again with the same cache
+    only reads the files that are new or changed since, which makes
+    scanning a growing directory cheap, and makes up the same series.
+    The datasets of such series (and their info attribute) only have
+    the cached elements, and readPixelData is ignored.
     """
 
     # Init list of files
@@ -357,49 +581,67 @@ def read_files(path, showProgress=False, readPixelData=False, force=False):
     if not hasattr(showProgress, '__call__'):
         showProgress = _dummyProgressCallback
 
-    # Set defer size
-    deferSize = 16383  # 128**2-1
-    if readPixelData:
-        deferSize = None
+    # Skip DICOMDIR files
+    nfiles = len(files)
+    files = [filename for filename in files if not filename.count("DICOMDIR")]
+
+    # Read the files (or take them from the cache), in order
+    if cache is not None:
+        files = [os.path.abspath(filename) for filename in files]
+        entries = _loadCache(cache)
+        newEntries = {}
+
+        def read(filename):
+            dcm, why, entry = _readCached(filename, force, entries)
+            if entry is not None:
+                newEntries[filename] = entry
+            return dcm, why
+    else:
+        def read(filename):
+            return _readHeader(filename, readPixelData, force)
+    pool = None
+    if workers > 1:
+        # Using worker threads
+        pool = ThreadPool(workers)
+        results = pool.imap(read, files)
+    else:
+        results = (read(filename) for filename in files)
 
     # Gather file data and put in DicomSeries
     series = {}
     count = 0
     showProgress('Loading series information:')
-    for filename in files:
-
-        # Skip DICOMDIR files
-        if filename.count("DICOMDIR"):
-            continue
-
-        # Try loading dicom ...
-        try:
-            dcm = pydicom.read_file(filename, deferSize, force=force)
-        except pydicom.filereader.InvalidDicomError:
-            continue  # skip non-dicom file
-        except Exception as why:
-            if showProgress is _progressCallback:
-                _progressBar.PrintMessage(str(why))
-            else:
-                print('Warning:', why)
-            continue
-
-        # Get SUID and register the file with an existing or new series object
-        try:
-            suid = dcm.SeriesInstanceUID
-        except AttributeError:
-            continue  # some other kind of dicom file
-        if suid not in series:
-            series[suid] = DicomSeries(suid, showProgress)
-        series[suid]._append(dcm)
-
-        # Show progress (note that we always start with a 0.0)
-        showProgress(float(count) / len(files))
-        count += 1
+    try:
+        for dcm, why in results:
+            if why is not None:
+                if showProgress is _progressCallback:
+                    _progressBar.PrintMessage(str(why))
+                else:
+                    print('Warning:', why)
+
+            # Get SUID and register the file with an existing or new series
+            # object (skipping some other kind of dicom file)
+            suid = None if dcm is None else dcm.get('SeriesInstanceUID')
+            if suid is not None:
+                if suid not in series:
+                    series[suid] = DicomSeries(suid, showProgress)
+                series[suid]._append(dcm)
+
+            # Show progress (note that we always start with a 0.0)
+            showProgress(float(count) / nfiles)
+            count += 1
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
 
     # Finish progress
     showProgress(None)
 
+    # Store the cache, without the files that are gone
+    if cache is not None and newEntries != entries:
+        _saveCache(cache, newEntries)
+
     # Make a list and sort, so that the order is deterministic
     series = list(series.values())
     series.sort(key=lambda x: x.suid)
@@ -433,7 +675,8 @@ class DicomSeries(object):
 
     # To create a DicomSeries object, start by making an instance and
     # append files using the "_append" method. When all files are
-    # added, call "_sort" to sort the files, and then "_finish" to evaluate
+    # added, call "_sort" to sort the files (or let _splitSerieIfRequired
+    # sort them along the slice normal), and then "_finish" to evaluate
     # the data, perform some checks, and set the shape and sampling
     # attributes of the instance.
 
@@ -448,6 +691,9 @@ class DicomSeries(object):
         self._shape = None
         self._sampling = None
 
+        # The slice positions along the normal, if sorted geometrically
+        self._distances = None
+
     @property
     def suid(self):
         """ The Series Instance UID. """
@@ -508,8 +754,8 @@ class DicomSeries(object):
         adr = hex(id(self)).upper()
         return "<DicomSeries with %i images at %s>" % (len(self._datasets), adr)
 
-    def get_pixel_array(self):
-        """ get_pixel_array()
+    def get_pixel_array(self, workers=4):
+        """ get_pixel_array(workers=4)
 
         Get (load) the data that this DicomSeries represents, and return
         it as a numpy array. If this serie contains multiple images, the
@@ -517,8 +763,11 @@ class DicomSeries(object):
 
         If RescaleSlope and RescaleIntercept are present in the dicom info,
         the data is rescaled using these parameters. The data type is chosen
-        depending on the range of the (rescaled) data.
+        depending on the range of values allowed by BitsStored and
+        PixelRepresentation after rescaling.
 
+        The slices are read and decoded by a pool of "workers" threads,
+        straight into the volume.
         """
 
         # Can we do this?
@@ -541,28 +790,65 @@ class DicomSeries(object):
         # Set callback to update progress
         showProgress = self._showProgress
 
-        # Init data (using what the dicom packaged produces as a reference)
+        # Decide the data type once for all slices, and init the volume
+        # with the first slice (using what the dicom packaged produces
+        # as a reference for the shape of a slice)
         ds = self._datasets[0]
-        slice = _getPixelDataFromDataset(ds)
-        # vol = Aarray(self.shape, self.sampling, fill=0, dtype=slice.dtype)
-        vol = np.zeros(self.shape, dtype=slice.dtype)
+        dtype = _getDtype(ds)
+        slice = _getPixelDataFromDataset(ds, dtype)
+        ll = self.shape[0]
+        vol = np.empty((ll,) + slice.shape, dtype=slice.dtype)
         vol[0] = slice
 
+        def loadSlice(z):
+            _getPixelDataFromDataset(self._datasets[z], dtype, vol[z])
+            return z
+
         # Fill volume
         showProgress('Loading data:')
-        ll = self.shape[0]
-        for z in range(1, ll):
-            ds = self._datasets[z]
-            vol[z] = _getPixelDataFromDataset(ds)
-            showProgress(float(z) / ll)
+        if workers > 1:
+            pool = ThreadPool(workers)
+            try:
+                for count, z in enumerate(pool.imap_unordered(loadSlice,
+                                                              range(1, ll))):
+                    showProgress(float(count + 1) / ll)
+            finally:
+                pool.terminate()
+                pool.join()
+        else:
+            for z in range(1, ll):
+                loadSlice(z)
+                showProgress(float(z) / ll)
 
         # Finish
         showProgress(None)
 
         # Done
-        gc.collect()
         return vol
 
+    def as_lazy_volume(self, cacheSize=64, scratchFile=None):
+        """ as_lazy_volume(cacheSize=64, scratchFile=None)
+
+        Get the data that this DicomSeries represents as a LazyVolume:
+        an array-like object which only loads (and rescales) the slices
+        that are indexed, so that series too large for memory can be
+        used. Always 3D, with the slices along the first axis.
+
+        At most cacheSize loaded slices are kept in memory, those used
+        least recently being dropped first. If scratchFile is given (a
+        file name, or True for a temporary file), loaded slices are
+        also stored in a numpy.memmap of the whole volume in that file,
+        so that a dropped slice is not decoded again.
+        """
+        if not have_numpy:
+            msg = "The Numpy package is required to use as_lazy_volume.\n"
+            raise ImportError(msg)
+        if len(self._datasets) == 0:
+            raise ValueError('Serie does not contain any files.')
+        if self.info is None and len(self._datasets) > 1:
+            raise RuntimeError("Cannot return volume if series not finished.")
+        return LazyVolume(self._datasets, cacheSize, scratchFile)
+
     def _append(self, dcm):
         """ _append(dcm)
         Append a dicomfile (as a pydicom.dataset.FileDataset) to the series.
@@ -573,7 +859,8 @@ class DicomSeries(object):
         """ sort()
         Sort the datasets by instance number.
         """
-        self._datasets.sort(key=lambda k: k.InstanceNumber)
+        self._datasets.sort(key=_instanceNumber)
+        self._distances = None
 
     def _finish(self):
         """ _finish()
@@ -591,57 +878,51 @@ class DicomSeries(object):
 
         """
 
-        # The datasets list should be sorted by instance number
+        # The datasets list should be sorted (along the slice normal, or
+        # by instance number)
         L = self._datasets
         if len(L) == 0:
             return
-        elif len(L) < 2:
+
+        # Gather the measures to check (these are in 2D) at once
+        dimensions = [(ds[_rowsTag].value, ds[_columnsTag].value)
+                      for ds in L]
+        samplings = [tuple(float(v) for v in ds[_pixelSpacingTag].value)
+                     for ds in L]
+        rows, columns = dimensions[0]
+        sampling = samplings[0]  # row, column
+        if len(L) < 2:
             # Set attributes
-            ds = self._datasets[0]
-            self._info = self._datasets[0]
-            self._shape = [ds.Rows, ds.Columns]
-            self._sampling = [float(ds.PixelSpacing[0]), float(ds.PixelSpacing[1])]
+            self._info = L[0]
+            self._shape = [rows, columns]
+            self._sampling = list(sampling)
             return
 
-        # Get previous
-        ds1 = L[0]
-
-        # Init measures to calculate average of
-        distance_sum = 0.0
-
-        # Init measures to check (these are in 2D)
-        dimensions = ds1.Rows, ds1.Columns
-        sampling = float(ds1.PixelSpacing[0]), float(ds1.PixelSpacing[1])  # row, column
-
-        for index in range(len(L)):
-            # The first round ds1 and ds2 will be the same, for the
-            # distance calculation this does not matter
-
-            # Get current
-            ds2 = L[index]
-
-            # Get positions
-            pos1 = float(ds1.ImagePositionPatient[2])
-            pos2 = float(ds2.ImagePositionPatient[2])
-
-            # Update distance_sum to calculate distance later
-            distance_sum += abs(pos1 - pos2)
-
-            # Test measures
-            dimensions2 = ds2.Rows, ds2.Columns
-            sampling2 = float(ds2.PixelSpacing[0]), float(ds2.PixelSpacing[1])
-            if dimensions != dimensions2:
-                # We cannot produce a volume if the dimensions match
-                raise ValueError('Dimensions of slices does not match.')
-            if sampling != sampling2:
-                # We can still produce a volume, but we should notify the user
-                msg = 'Warning: sampling does not match.'
-                if self._showProgress is _progressCallback:
-                    _progressBar.PrintMessage(msg)
-                else:
-                    print(msg)
-            # Store previous
-            ds1 = ds2
+        if len(set(dimensions)) > 1:
+            # We cannot produce a volume if the dimensions match
+            raise ValueError('Dimensions of slices does not match.')
+        if len(set(samplings)) > 1:
+            # We can still produce a volume, but we should notify the user
+            msg = 'Warning: sampling does not match.'
+            if self._showProgress is _progressCallback:
+                _progressBar.PrintMessage(msg)
+            else:
+                print(msg)
+
+        # Calculate the average distance between the slices
+        # (Note that there are len(L)-1 distances)
+        if self._distances is not None:
+            # Positions along the slice normal, in order; repeated
+            # positions (e.g. dynamic data) are not steps
+            locations = np.count_nonzero(
+                np.diff(self._distances) > _geometryTolerance)
+            distance_mean = ((self._distances[-1] - self._distances[0]) /
+                             max(locations, 1))
+        else:
+            positions = [float(ds[_imagePositionTag].value[2]) for ds in L]
+            distance_mean = (sum(abs(pos2 - pos1) for pos1, pos2 in
+                                 zip(positions[:-1], positions[1:])) /
+                             (len(L) - 1))
 
         # Create new dataset by making a deep copy of the first
         info = pydicom.dataset.Dataset()
@@ -651,22 +932,134 @@ class DicomSeries(object):
                 el = firstDs[key]
                 info.add_new(el.tag, el.VR, el.value)
 
-        # Finish calculating average distance
-        # (Note that there are len(L)-1 distances)
-        distance_mean = distance_sum / (len(L) - 1)
-
         # Store information that is specific for the serie
-        self._shape = [len(L), ds2.Rows, ds2.Columns]
-        self._sampling = [distance_mean, float(ds2.PixelSpacing[0]),
-                          float(ds2.PixelSpacing[1])]
+        self._shape = [len(L), rows, columns]
+        self._sampling = [float(distance_mean), sampling[0], sampling[1]]
 
         # Store
         self._info = info
 
 
-if __name__ == '__main__':
-    import sys
+class LazyVolume(object):
+    """ LazyVolume
+    An array-like object for the volume of a DicomSeries, which loads
+    the slices when they are indexed, and keeps the most recently used
+    ones in memory. Index it like a numpy array, where the first index
+    selects the slices (an integer, a slice or a list of integers), for
+    example vol[10], vol[::2, 100:200, 100:200] or vol[[3, 5], 256].
+    The arrays returned must not be changed, as they may be shared with
+    the cache. Use numpy.asarray(vol) to load the whole volume.
 
+    Created by DicomSeries.as_lazy_volume().
+    """
+
+    def __init__(self, datasets, cacheSize=64, scratchFile=None):
+        self._datasets = datasets
+        self._cacheSize = max(1, cacheSize)
+        self._cache = OrderedDict()
+
+        # Load the first slice to decide the data type and slice shape
+        self._dtype = _getDtype(datasets[0])
+        first = _getPixelDataFromDataset(datasets[0], self._dtype)
+        self._shape = (len(datasets),) + first.shape
+        self._dtype = first.dtype
+
+        # Optional scratch file holding each slice once loaded
+        self._scratch = None
+        if scratchFile is not None and scratchFile is not False:
+            if scratchFile is True:
+                scratchFile = tempfile.TemporaryFile()
+            self._scratch = np.memmap(scratchFile, dtype=self._dtype,
+                                      mode='w+', shape=self._shape)
+            self._inScratch = np.zeros(len(datasets), dtype=bool)
+        self._store(0, first)
+
+    @property
+    def shape(self):
+        """ The shape of the volume (nz, ny, nx). """
+        return self._shape
+
+    @property
+    def dtype(self):
+        """ The data type of the (rescaled) volume. """
+        return self._dtype
+
+    @property
+    def ndim(self):
+        return len(self._shape)
+
+    def __len__(self):
+        return self._shape[0]
+
+    def __repr__(self):
+        return "<LazyVolume %s of %s, %i slices loaded>" % (
+            'x'.join(str(d) for d in self._shape), self._dtype,
+            len(self._cache))
+
+    def _store(self, z, data):
+        """ Put a loaded slice in the cache (and scratch file). """
+        if self._scratch is not None and not self._inScratch[z]:
+            self._scratch[z] = data
+            self._inScratch[z] = True
+        data.flags.writeable = False
+        self._cache[z] = data
+        while len(self._cache) > self._cacheSize:
+            self._cache.popitem(last=False)
+
+    def get_slice(self, z):
+        """ get_slice(z)
+        Get slice z of the volume, loading it if it isn't cached.
+        """
+        if z < 0:
+            z += self._shape[0]
+        if not 0 <= z < self._shape[0]:
+            raise IndexError("Slice index out of range")
+        data = self._cache.pop(z, None)
+        if data is not None:
+            # Move to the end, as the most recently used
+            self._cache[z] = data
+            return data
+        if self._scratch is not None and self._inScratch[z]:
+            data = np.array(self._scratch[z])
+        else:
+            data = _getPixelDataFromDataset(self._datasets[z], self._dtype)
+            if data.dtype != self._dtype:
+                data = data.astype(self._dtype)
+        self._store(z, data)
+        return data
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        if not key or key[0] is Ellipsis:
+            # Indexing the whole volume
+            key = (slice(None),) + key
+        first, rest = key[0], key[1:]
+        if isinstance(first, slice):
+            zs = range(*first.indices(self._shape[0]))
+        elif np.ndim(first) == 1:
+            zs = np.asarray(first)
+            if zs.dtype == bool:
+                # A mask of the slices to take
+                if len(zs) != self._shape[0]:
+                    raise IndexError('The mask has %d values for %d slices'
+                                     % (len(zs), self._shape[0]))
+                zs = np.flatnonzero(zs)
+        else:
+            return self.get_slice(int(first))[rest]
+        vol = np.empty((len(zs),) + self._shape[1:], dtype=self._dtype)
+        for i, z in enumerate(zs):
+            vol[i] = self.get_slice(int(z))
+        return vol[(slice(None),) + rest]
+
+    def __array__(self, dtype=None):
+        vol = self[:]
+        if dtype is not None:
+            vol = vol.astype(dtype)
+        return vol
+
+
+if __name__ == '__main__':
     if len(sys.argv) != 2:
         print("Expected a single argument: a directory with dicom files in it")
     else:
@@ -8,14 +8,220 @@
 #    available at https://github.com/darcymason/pydicom
 #
 
+import marshal
+import os
+import sys
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # Python 2
+    from collections import MutableMapping
+
 from pydicom.config import logger
-from pydicom.tag import Tag
-from pydicom._dicom_dict import DicomDictionary  # the actual dict of {tag: (VR, VM, name, is_retired, keyword), ...}
-from pydicom._dicom_dict import RepeatersDictionary  # those with tags like "(50xx, 0005)"
-from pydicom._private_dict import private_dictionaries
+from pydicom.tag import Tag, BaseTag
 import warnings
 from pydicom.compat import in_py2
 
+
+# The dictionaries are generated python modules which are slow to import
+#   when they can't be loaded from bytecode, so a marshal of their contents
+#   is cached beside the bytecode and used when it is up to date.
+# Change the format version whenever what is cached changes
+_dictionary_cache_format = 1
+
+
+def _dictionary_cache_path(source):
+    """Return the path of the cache file for the dictionary module `source`.
+
+    Returns None if there is nowhere to put the cache (e.g. on Python 2).
+    """
+    try:
+        from importlib.util import cache_from_source
+        return os.path.splitext(cache_from_source(source))[0] + '.dict'
+    except (ImportError, NotImplementedError):
+        return None
+
+
+def _load_dictionary(module_name, build):
+    """Return the contents of the dictionary module `module_name`.
+
+    Parameters
+    ----------
+    module_name : str
+        The name of the dictionary module within pydicom, e.g. '_dicom_dict'.
+    build : callable
+        Imports the module and returns its contents as a tuple. Only called
+        if the cache is missing or out of date, after which the cache is
+        written (unless writing bytecode has been disabled).
+
+    Returns
+    -------
+    tuple
+        The value returned by `build`.
+    """
+    source = os.path.join(os.path.dirname(__file__), module_name + '.py')
+    cache_path = _dictionary_cache_path(source)
+    try:
+        source_stat = os.stat(source)
+    except OSError:  # no source, e.g. if installed as bytecode only
+        return build()
+    key = (_dictionary_cache_format, marshal.version,
+           source_stat.st_mtime, source_stat.st_size)
+
+    if cache_path is not None:
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                cached_key, contents = marshal.loads(cache_file.read())
+            if cached_key == key:
+                return contents
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            pass
+
+    contents = build()
+    if cache_path is not None and not sys.dont_write_bytecode:
+        temp_path = "{0}.{1}".format(cache_path, os.getpid())
+        try:
+            if not os.path.isdir(os.path.dirname(cache_path)):
+                os.makedirs(os.path.dirname(cache_path))
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(marshal.dumps((key, contents)))
+            os.rename(temp_path, cache_path)
+        except (IOError, OSError) as e:
+            logger.debug("Unable to cache {0}: {1}".format(module_name, e))
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    return contents
+
+
+def _build_dicom_dict():
+    from pydicom._dicom_dict import DicomDictionary, RepeatersDictionary
+    return DicomDictionary, RepeatersDictionary
+
+
+def _build_private_dict():
+    # Each private creator's dictionary is kept marshalled, and only loaded
+    #   the first time that private creator is looked up
+    from pydicom._private_dict import private_dictionaries
+    return (dict((private_creator, marshal.dumps(private_dict))
+                 for private_creator, private_dict
+                 in private_dictionaries.items()), )
+
+
+# the actual dict of {tag: (VR, VM, name, is_retired, keyword), ...}
+#   and RepeatersDictionary, those with tags like "(50xx, 0005)"
+DicomDictionary, RepeatersDictionary = _load_dictionary('_dicom_dict',
+                                                        _build_dicom_dict)
+_private_dictionary_chunks = None  # {private_creator: marshalled dict}
+_private_masked_entries = {}  # {private_creator: [(mask, {tag: entry})]}
+
+
+def _get_private_dictionary_chunks():
+    """Return the marshalled private dictionaries, keyed by private creator."""
+    global _private_dictionary_chunks
+    if _private_dictionary_chunks is None:
+        _private_dictionary_chunks = _load_dictionary('_private_dict',
+                                                      _build_private_dict)[0]
+    return _private_dictionary_chunks
+
+
+class _PrivateDictionaries(MutableMapping):
+    """The private dictionaries, {private_creator: {tag: entry, ...}, ...}
+
+    Each private creator's dictionary is only unmarshalled the first time it
+    is accessed. Private creators can be added or replaced by setting them,
+    which get_private_entry() then uses, but a dictionary which has already
+    been looked up must be set again after it has been changed.
+    """
+    def __init__(self):
+        self._dictionaries = {}  # those loaded or set, by private creator
+        self._removed = set()
+
+    def __getitem__(self, private_creator):
+        try:
+            return self._dictionaries[private_creator]
+        except KeyError:
+            if private_creator in self._removed:
+                raise
+        chunk = _get_private_dictionary_chunks()[private_creator]
+        return self._dictionaries.setdefault(private_creator,
+                                             marshal.loads(chunk))
+
+    def __setitem__(self, private_creator, private_dict):
+        self._dictionaries[private_creator] = private_dict
+        self._removed.discard(private_creator)
+        _private_masked_entries.pop(private_creator, None)
+
+    def __delitem__(self, private_creator):
+        if private_creator not in self:
+            raise KeyError(private_creator)
+        self._dictionaries.pop(private_creator, None)
+        self._removed.add(private_creator)
+        _private_masked_entries.pop(private_creator, None)
+
+    def __contains__(self, private_creator):
+        return (private_creator in self._dictionaries or
+                (private_creator not in self._removed and
+                 private_creator in _get_private_dictionary_chunks()))
+
+    def __iter__(self):
+        for private_creator in _get_private_dictionary_chunks():
+            if private_creator not in self._removed:
+                yield private_creator
+        for private_creator in self._dictionaries:
+            if private_creator not in _get_private_dictionary_chunks():
+                yield private_creator
+
+    def __len__(self):
+        return sum(1 for private_creator in self)
+
+
+private_dictionaries = _PrivateDictionaries()
+
+
+def get_private_dictionaries():
+    """Return all the private dictionaries.
+
+    Unlike private_dictionaries, all of them are loaded at once.
+
+    Returns
+    -------
+    dict
+        {private_creator: {tag: (VR, VM, name, is_retired), ...}, ...} where
+        each tag is a str such as '0019xx10', with 'x' for any hex digit.
+    """
+    return dict(private_dictionaries.items())
+
+
+def _private_masked_entries_for(private_creator):
+    """Return the private dictionary entries for `private_creator`.
+
+    Returns
+    -------
+    list of (int, dict)
+        For each bit mask used by the dictionary's tags, the mask and
+        {tag & mask: (VR, VM, name, is_retired)}, in the order to try them.
+        E.g. the entry for '0019xx10' has the mask 0xFFFF00FF and key
+        0x00190010.
+    """
+    try:
+        return _private_masked_entries[private_creator]
+    except KeyError:
+        pass
+    entries_by_mask = {}
+    for key, entry in private_dictionaries[private_creator].items():
+        mask = int("".join(["F0"[c == "x"] for c in key]), 16)
+        masked_tag = int(key.replace("x", "0"), 16)
+        entries_by_mask.setdefault(mask, {})[masked_tag] = entry
+    # Exact tags, then "xx" in the block position, then any other masks
+    masked_entries = sorted(entries_by_mask.items(),
+                            key=lambda item: (item[0] != 0xFFFFFFFF,
+                                              item[0] != 0xFFFF00FF,
+                                              -bin(item[0]).count("1")))
+    _private_masked_entries[private_creator] = masked_entries
+    return masked_entries
+
+
 # Generate mask dict for checking repeating groups etc.
 # Map a true bitwise mask to the DICOM mask with "x"'s in it.
 masks = {}
@@ -26,10 +232,25 @@ for mask_x in RepeatersDictionary:
     mask2 = int("".join(["F0"[c == "x"] for c in mask_x]), 16)
     masks[mask_x] = (mask1, mask2)
 
-    
+# Index the masks by mask2, so a tag is matched with one lookup of
+#   tag & mask2 for each of the few different "x" positions used,
+#   rather than by testing it against every mask
+_masks_by_mask2 = {}
+for mask_x, (mask1, mask2) in masks.items():
+    _masks_by_mask2.setdefault(mask2, {})[mask1] = mask_x
+_masks_by_mask2 = list(_masks_by_mask2.items())
+
+_repeater_keywords = frozenset(val[4] for val in RepeatersDictionary.values())
+
+
 def mask_match(tag):
-    for mask_x, (mask1, mask2) in masks.items():
-        if (tag ^ mask1) & mask2 == 0:
+    """Return the repeaters dictionary key (e.g. '60xx0010') matching `tag`.
+
+    Returns None if `tag` is not a repeating group element.
+    """
+    for mask2, masked_tags in _masks_by_mask2:
+        mask_x = masked_tags.get(tag & mask2)
+        if mask_x is not None:
             return mask_x
     return None
 
@@ -117,6 +338,8 @@ def add_dict_entries(new_entries_dict):
     new_names_dict = dict([(val[4], tag) for tag, val in
                        new_entries_dict.items()])
     keyword_dict.update(new_names_dict)
+    # A keyword may now map to a different tag
+    _keyword_tags.clear()
 
 
 def get_entry(tag):
@@ -185,21 +408,51 @@ def keyword_for_tag(tag):
 
 # Provide for the 'reverse' lookup. Given the keyword, what is the tag?
 logger.debug("Reversing DICOM dictionary so can look up tag from a keyword...")
-keyword_dict = dict([(dictionary_keyword(tag), tag) for tag in DicomDictionary])
+keyword_dict = dict((entry[4], tag) for tag, entry in DicomDictionary.items())
 
 
 def tag_for_keyword(keyword):
     """Return the dicom tag corresponding to keyword, or None if none exist."""
     return keyword_dict.get(keyword)
 
+
+# BaseTag instances for the DICOM dictionary tags, created on first use and
+#   shared by all the data elements read with that tag
+_dictionary_tags = {}
+
+
+def _dictionary_basetag(tag):
+    """Return a BaseTag for the int `tag`, shared if it is in the dictionary."""
+    basetag = _dictionary_tags.get(tag)
+    if basetag is None:
+        basetag = BaseTag(tag)
+        if tag in DicomDictionary:
+            _dictionary_tags[tag] = basetag
+    return basetag
+
+
+# BaseTag for each keyword looked up so far by Dataset attribute access,
+#   so repeated ds.PatientName etc. don't create and check a new Tag each time
+_keyword_tags = {}
+
+
+def _basetag_for_keyword(keyword):
+    """Return the BaseTag for the DICOM `keyword`, or None if not a keyword."""
+    tag = _keyword_tags.get(keyword)
+    if tag is None:
+        tag = keyword_dict.get(keyword)
+        if tag is not None:
+            tag = _keyword_tags[keyword] = _dictionary_basetag(tag)
+    return tag
+
+
 def repeater_has_tag(tag):
     """Return True if the DICOM repeaters dictionary has an entry for `tag`."""
     return (mask_match(tag) in RepeatersDictionary)
 
 def repeater_has_keyword(keyword):
     """Return True if the DICOM repeaters element exists with `keyword`."""
-    repeater_keywords = [val[4] for val in RepeatersDictionary.values()]
-    return (keyword in repeater_keywords)
+    return (keyword in _repeater_keywords)
 
 # PRIVATE DICTIONARY handling
 # functions in analogy with those of main DICOM dict
@@ -207,24 +460,20 @@ def get_private_entry(tag, private_creator):
     """Return the tuple (VR, VM, name, is_retired) from a private dictionary"""
     tag = Tag(tag)
     try:
-        private_dict = private_dictionaries[private_creator]
+        masked_entries = _private_masked_entries_for(private_creator)
     except KeyError:
         raise KeyError("Private creator {0} not in private dictionary".format(private_creator))
 
     # private elements are usually agnostic for "block" (see PS3.5-2008 7.8.1 p44)
     # Some elements in _private_dict are explicit; most have "xx" for high-byte of element
-    # Try exact key first, but then try with "xx" in block position
-    try:
-        dict_entry = private_dict[tag]
-    except KeyError:
-        #     so here put in the "xx" in the block position for key to look up
-        group_str = "%04x" % tag.group
-        elem_str = "%04x" % tag.elem
-        key = "%sxx%s" % (group_str, elem_str[-2:])
-        if key not in private_dict:
-            raise KeyError("Tag {0} not in private dictionary for private creator {1}".format(key, private_creator))
-        dict_entry = private_dict[key]
-    return dict_entry
+    # Try exact key first, then with the "x"s masked out of the tag
+    for mask, entries in masked_entries:
+        try:
+            return entries[tag & mask]
+        except KeyError:
+            pass
+    key = "%04xxx%02x" % (tag.group, tag.elem & 0xFF)
+    raise KeyError("Tag {0} not in private dictionary for private creator {1}".format(key, private_creator))
 
 
 def private_dictionary_VR(tag, private_creator):
@@ -9,7 +9,7 @@ and a value.
 #    available at https://github.com/darcymason/pydicom
 #
 from __future__ import absolute_import
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 
 from pydicom import config  # don't import datetime_conversion directly
 from pydicom import compat
@@ -56,6 +56,25 @@ def isStringOrStringList(val):
 _backslash = "\\"  # double '\' because it is used as escape chr in Python
 
 
+class _DisplayOption(object):
+    """A DataElement display option, with a class-level default which can
+    be changed for a single element; the changed value is held in a slot."""
+    def __init__(self, slot, default):
+        self.slot = slot
+        self.default = default
+
+    def __get__(self, elem, cls):
+        if elem is None:
+            return self.default
+        return getattr(elem, self.slot, self.default)
+
+    def __set__(self, elem, value):
+        setattr(elem, self.slot, value)
+
+    def __delete__(self, elem):
+        delattr(elem, self.slot)
+
+
 class DataElement(object):
     """Contain and manipulate a DICOM Element.
 
@@ -108,9 +127,14 @@ class DataElement(object):
     VR : str
         The Data Element's Value Representation value
     """
-    descripWidth = 35
-    maxBytesToDisplay = 16
-    showVR = True
+    # A large dataset holds many elements, so don't give each one a __dict__
+    __slots__ = ('tag', 'VR', '_value', 'file_tell', 'is_undefined_length',
+                 'private_creator', '_descripWidth', '_maxBytesToDisplay',
+                 '_showVR')
+
+    descripWidth = _DisplayOption('_descripWidth', 35)
+    maxBytesToDisplay = _DisplayOption('_maxBytesToDisplay', 16)
+    showVR = _DisplayOption('_showVR', True)
 
     # Python 2: Classes which define __eq__ should flag themselves as unhashable
     __hash__ = None
@@ -153,6 +177,18 @@ class DataElement(object):
         self.file_tell = file_value_tell
         self.is_undefined_length = is_undefined_length
 
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, '__slots__', ()):
+                if hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
     @property
     def value(self):
         """Return the element's `value`."""
@@ -358,6 +394,9 @@ class DataElement(object):
 
 class DeferredDataElement(DataElement):
     """Subclass of DataElement where value is not read into memory until needed"""
+    __slots__ = ('fp_is_implicit_VR', 'fp_is_little_endian', 'filepath',
+                 'file_mtime', 'data_element_tell', 'length')
+
     def __init__(self, tag, VR, fp, file_mtime, data_element_tell, length):
         """Store basic info for the data element but value will be read later
 
@@ -399,11 +438,92 @@ class DeferredDataElement(DataElement):
         DataElement.value.fset(self, val)
 
 
-RawDataElement = namedtuple('RawDataElement',
-                            'tag VR length value value_tell is_implicit_VR is_little_endian')
+_RawDataElement = namedtuple('RawDataElement',
+                             'tag VR length value value_tell')
+
 
+class RawDataElement(_RawDataElement):
+    """A data element as read from file, with its value not yet converted.
+
+    `is_implicit_VR` and `is_little_endian` are the same for every element
+    read from a dataset, so they are not stored in the tuple itself. Instead
+    each instance belongs to one of four subclasses (one per encoding) which
+    hold them as class attributes, leaving only the five per-element fields
+    (tag, VR, length, value, value_tell) in memory.
+
+    Constructing a RawDataElement returns an instance of the subclass that
+    matches the encoding. The instance still behaves as the 7-tuple
+    (tag, VR, length, value, value_tell, is_implicit_VR, is_little_endian)
+    when indexed, unpacked or compared.
+    """
+    __slots__ = ()
 
-def DataElement_from_raw(raw_data_element, encoding=None):
+    def __new__(cls, tag, VR, length, value, value_tell, is_implicit_VR,
+                is_little_endian):
+        cls = _raw_element_classes[is_implicit_VR, is_little_endian]
+        return tuple.__new__(cls, (tag, VR, length, value, value_tell))
+
+    def __iter__(self):
+        for field in tuple.__iter__(self):
+            yield field
+        yield self.is_implicit_VR
+        yield self.is_little_endian
+
+    def __len__(self):
+        return 7
+
+    def __getitem__(self, index):
+        if index.__class__ is int and 0 <= index < 5:
+            return tuple.__getitem__(self, index)
+        return tuple(self)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, tuple):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, tuple):
+            return tuple(self) != tuple(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return ("RawDataElement(tag=%r, VR=%r, length=%r, value=%r, "
+                "value_tell=%r, is_implicit_VR=%r, is_little_endian=%r)"
+                % tuple(self))
+
+    def __reduce__(self):
+        return (RawDataElement, tuple(self))
+
+    def _replace(self, **kwargs):
+        """Return a new RawDataElement with the given fields replaced."""
+        fields = dict(zip(self._fields + ('is_implicit_VR',
+                                          'is_little_endian'), self))
+        for name, value in kwargs.items():
+            if name not in fields:
+                raise ValueError("Got unexpected field name: %r" % name)
+            fields[name] = value
+        return RawDataElement(**fields)
+
+    def _asdict(self):
+        """Return an OrderedDict of the fields, including the encoding."""
+        return OrderedDict(zip(self._fields + ('is_implicit_VR',
+                                               'is_little_endian'), self))
+
+
+_raw_element_classes = dict(
+    ((is_implicit_VR, is_little_endian),
+     type('RawDataElement', (RawDataElement,),
+          {'__slots__': (), 'is_implicit_VR': is_implicit_VR,
+           'is_little_endian': is_little_endian}))
+    for is_implicit_VR in (True, False) for is_little_endian in (True, False)
+)
+
+
+def DataElement_from_raw(raw_data_element, encoding=None, transforms=None):
     """Return a DataElement created from the data in `raw_data_element`.
 
     Parameters
@@ -412,6 +532,9 @@ def DataElement_from_raw(raw_data_element, encoding=None):
         The raw data to convert to a DataElement
     encoding : str
         The encoding of the raw data
+    transforms : pydicom.rawtransforms.RawTransforms, optional
+        The raw transforms to apply before converting; if None (default),
+        those of config.raw_transforms
 
     Returns
     -------
@@ -424,6 +547,10 @@ def DataElement_from_raw(raw_data_element, encoding=None):
     if config.data_element_callback:
         raw = config.data_element_callback(raw_data_element,
                                            **config.data_element_callback_kwargs)
+    if transforms is None:
+        transforms = config.raw_transforms
+    if transforms:
+        raw = transforms(raw)
     VR = raw.VR
     if VR is None:  # Can be if was implicit VR
         try:
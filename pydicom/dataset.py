@@ -20,18 +20,22 @@ Dataset (dict subclass)
 #    available at https://github.com/darcymason/pydicom
 #
 
+from bisect import bisect_left
+import copy
 import inspect  # for __dir__
 import io
 import os.path
 import sys
+import threading
 
 from pydicom import compat
 from pydicom.charset import default_encoding, convert_encodings
 from pydicom.datadict import dictionary_VR
-from pydicom.datadict import tag_for_keyword, keyword_for_tag, repeater_has_keyword
+from pydicom.datadict import keyword_for_tag, repeater_has_keyword
+from pydicom.datadict import _basetag_for_keyword
 from pydicom.tag import Tag, BaseTag
 from pydicom.dataelem import DataElement, DataElement_from_raw, RawDataElement
-from pydicom.uid import NotCompressedPixelTransferSyntaxes, UncompressedPixelTransferSyntaxes
+from pydicom.uid import NotCompressedPixelTransferSyntaxSet, UncompressedPixelTransferSyntaxes
 from pydicom.tagtools import tag_in_exception
 import pydicom  # for write_file
 import pydicom.charset
@@ -40,6 +44,25 @@ import pydicom.encaps
 
 sys_is_little_endian = (sys.byteorder == 'little')
 
+# Guards the replacement of raw elements by converted ones
+_swap_lock = threading.Lock()
+# Deferred reads of a dataset's elements take the lock picked by its id()
+_deferred_read_locks = [threading.Lock() for _ in range(16)]
+
+
+def _copy_element(data_elem):
+    """Return a copy of the DataElement `data_elem` for Dataset.clone, with
+    copies of its list value, or clones of its sequence items."""
+    elem = copy.copy(data_elem)
+    value = data_elem.value
+    if elem.VR == 'SQ':
+        from pydicom.sequence import Sequence
+        elem._value = Sequence([item.clone() for item in value])
+        elem._value.__dict__.update(value.__dict__)
+    elif isinstance(value, list):
+        elem._value = copy.deepcopy(value)
+    return elem
+
 have_numpy = True
 try:
     import numpy
@@ -177,6 +200,13 @@ class Dataset(dict):
     def __init__(self, *args, **kwargs):
         """Create a new Dataset instance."""
         self._parent_encoding = kwargs.get('parent_encoding', default_encoding)
+        self._raw_transforms = kwargs.get('raw_transforms')
+        if args and isinstance(args[0], Dataset):
+            if self._raw_transforms is None:
+                self._raw_transforms = args[0]._raw_transforms
+            # Copy the elements as they are: given a Dataset, dict.__init__
+            #   would use __getitem__ and so convert every raw element
+            args = (dict.items(args[0]),) + args[1:]
         dict.__init__(self, *args)
 
     def __enter__(self):
@@ -222,6 +252,46 @@ class Dataset(dict):
         # use data_element.tag since DataElement verified it
         self[data_element.tag] = data_element
 
+    def clone(self):
+        """Return a copy-on-write copy of the Dataset.
+
+        Unlike copy.deepcopy, only the dictionary of elements (and the
+        instance attributes) is copied. Raw elements not converted yet are
+        immutable, so their values (e.g. large Pixel Data) are shared with
+        the clone. DataElements already converted are copied, with their
+        list values, and the items of their sequences are cloned in the same
+        way, so that changing one dataset never changes the other. A decoded
+        pixel_array is not shared either; the clone decodes its own.
+
+        Returns
+        -------
+        pydicom.dataset.Dataset
+            A Dataset of the same class as `self`.
+
+        Examples
+        --------
+        >>> ds = pydicom.read_file("CT_small.dcm")
+        >>> for destination in destinations:
+        >>>     copy = ds.clone()
+        >>>     copy.InstitutionName = destination.institution
+        >>>     destination.send(copy)
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.__dict__.pop('_pixel_array', None)
+        clone.__dict__.pop('_pixel_id', None)
+        with _swap_lock:
+            elements = list(dict.items(self))
+        dict.update(clone, ((tag, elem) if isinstance(elem, tuple)
+                            else (tag, _copy_element(elem))
+                            for tag, elem in elements))
+        if '_tags' in self.__dict__:
+            clone.__dict__['_tags'] = list(self.__dict__['_tags'])
+        file_meta = self.__dict__.get('file_meta')
+        if isinstance(file_meta, Dataset):
+            clone.__dict__['file_meta'] = file_meta.clone()
+        return clone
+
     def data_element(self, name):
         """Return the DataElement corresponding to the element keyword `name`.
 
@@ -236,7 +306,7 @@ class Dataset(dict):
             For the given DICOM element `keyword`, return the corresponding
             Dataset DataElement if present, None otherwise.
         """
-        tag = tag_for_keyword(name)
+        tag = _basetag_for_keyword(name)
         # Test against None as (0000,0000) is a possible tag
         if tag is not None:
             return self[tag]
@@ -259,8 +329,10 @@ class Dataset(dict):
         bool
             True if the DataElement is in the Dataset, False otherwise.
         """
+        if isinstance(name, BaseTag):
+            return dict.__contains__(self, name)
         if isinstance(name, (str, compat.text_type)):
-            tag = tag_for_keyword(name)
+            tag = _basetag_for_keyword(name)
         else:
             try:
                 tag = Tag(name)
@@ -312,9 +384,9 @@ class Dataset(dict):
             The keyword for the DICOM element or the class attribute to delete.
         """
         # First check if a valid DICOM keyword and if we have that data element
-        tag = tag_for_keyword(name)
-        if tag is not None and tag in self:
-            dict.__delitem__(self, tag)  # direct to dict as we know we have key
+        tag = _basetag_for_keyword(name)
+        if tag is not None and dict.__contains__(self, tag):
+            del self[tag]
         # If not a DICOM name in this dataset, check for regular instance name
         #   can't do delete directly, that will call __delattr__ again
         elif name in self.__dict__:
@@ -356,13 +428,20 @@ class Dataset(dict):
             for tag in self._slice_dataset(key.start, key.stop, key.step):
                 del self[tag]
         else:
-            # Assume is a standard tag (for speed in common case)
-            try:
-                dict.__delitem__(self, key)
-            # If not a standard tag, than convert to Tag and try again
-            except KeyError:
-                tag = Tag(key)
-                dict.__delitem__(self, tag)
+            # Under the lock of lazy conversion, like __setitem__
+            with _swap_lock:
+                tags = None
+                if '_tags' in self.__dict__:
+                    tags = self._sorted_tags()
+                # Assume is a standard tag (for speed in common case)
+                try:
+                    dict.__delitem__(self, key)
+                # If not a standard tag, than convert to Tag and try again
+                except KeyError:
+                    key = Tag(key)
+                    dict.__delitem__(self, key)
+                if tags is not None:
+                    del tags[bisect_left(tags, key)]
 
     def __dir__(self):
         """Give a list of attributes available in the Dataset.
@@ -430,11 +509,30 @@ class Dataset(dict):
             return True
 
         if isinstance(other, self.__class__):
-            # Compare Elements using values() and class variables using __dict__
-            # Convert values() to a list for compatibility between
-            #   python 2 and 3
-            return (list(self.values()) == list(other.values()) and
-                    self.__dict__ == other.__dict__)
+            # Compare Elements by tag and class variables using __dict__
+            #   (other than the sorted tag index, which follows the elements)
+            # The order of the elements can differ on python 2, e.g. in a
+            #   clone, so they are not compared as lists of values()
+            if dict.__len__(self) != dict.__len__(other):
+                return False
+            for tag, elem in dict.items(self):
+                other_elem = dict.get(other, tag)
+                if other_elem is None:
+                    return False
+                if elem is other_elem:
+                    continue
+                # Equal raw elements need no conversion; otherwise compare
+                #   the DataElements, as a raw element is never equal to one
+                if isinstance(elem, tuple) and isinstance(other_elem, tuple):
+                    if elem == other_elem:
+                        continue
+                if not self[tag] == other[tag]:
+                    return False
+            self_vars = dict(self.__dict__)
+            other_vars = dict(other.__dict__)
+            self_vars.pop('_tags', None)
+            other_vars.pop('_tags', None)
+            return self_vars == other_vars
 
         return NotImplemented
 
@@ -497,12 +595,11 @@ class Dataset(dict):
               DataElement's value. Otherwise returns the class attribute's value
               (if present).
         """
-        tag = tag_for_keyword(name)
+        tag = _basetag_for_keyword(name)
         if tag is None: # `name` isn't a DICOM element keyword
             # Try the base class attribute getter (fix for issue 332)
             return super(Dataset, self).__getattribute__(name)
-        tag = Tag(tag)
-        if tag not in self: # DICOM DataElement not in the Dataset
+        if not dict.__contains__(self, tag): # DICOM DataElement not in the Dataset
             # Try the base class attribute getter (fix for issue 332)
             return super(Dataset, self).__getattribute__(name)
         else:
@@ -559,42 +656,94 @@ class Dataset(dict):
             DataElement. If a slice is used then returns a Dataset object
             containing the corresponding DataElements.
         """
+        # Tags from keyword access and iteration are already BaseTags
+        if isinstance(key, BaseTag):
+            tag = key
         # If passed a slice, return a Dataset containing the corresponding
         #   DataElements
-        if isinstance(key, slice):
+        elif isinstance(key, slice):
             ds = Dataset()
             for tag in self._slice_dataset(key.start, key.stop, key.step):
                 ds.add(self[tag])
             return ds
-
-        tag = Tag(key)
+        else:
+            tag = Tag(key)
         data_elem = dict.__getitem__(self, tag)
 
-        if isinstance(data_elem, DataElement):
-            return data_elem
-        elif isinstance(data_elem, tuple):
-            # If a deferred read, then go get the value now
-            if data_elem.value is None:
-                from pydicom.filereader import read_deferred_data_element
-                data_elem = read_deferred_data_element(self.fileobj_type,
-                                                       self.filename,
-                                                       self.timestamp,
-                                                       data_elem)
-
-            if tag != (0x08, 0x05):
-                character_set = self._character_set
-            else:
-                character_set = default_encoding
+        if isinstance(data_elem, tuple):
             # Not converted from raw form read from file yet; do so now
-            self[tag] = DataElement_from_raw(data_elem, character_set)
+            return self._convert_raw(tag, data_elem)
+        return data_elem
 
-            # If the Element has an ambiguous VR, try to correct it
-            if 'or' in self[tag].VR:
-                from pydicom.filewriter import correct_ambiguous_vr_element
-                self[tag] = correct_ambiguous_vr_element(self[tag], self,
-                                                         data_elem[6])
+    def _convert_raw(self, tag, raw_data_elem):
+        """Convert the RawDataElement of `tag` and return its DataElement.
 
-        return dict.__getitem__(self, tag)
+        The DataElement is fully made (including any ambiguous VR
+        correction) before it replaces `raw_data_elem` in the dataset, and
+        only does so if another thread has not already converted it, so that
+        a Dataset can be shared between threads.
+        """
+        # If a deferred read, then go get the value now
+        if raw_data_elem.value is None:
+            # Only one thread reads the values of a dataset's elements at a
+            #   time; any others waiting for the same element then use it
+            with _deferred_read_locks[id(self) % len(_deferred_read_locks)]:
+                if dict.get(self, tag) is raw_data_elem:
+                    from pydicom.filereader import read_deferred_data_element
+                    data_elem = read_deferred_data_element(self.fileobj_type,
+                                                           self.filename,
+                                                           self.timestamp,
+                                                           raw_data_elem)
+                    self._swap_in(tag, raw_data_elem, data_elem)
+            return self[tag]
+
+        return self._swap_in(tag, raw_data_elem,
+                             self._element_from_raw(tag, raw_data_elem))
+
+    def _element_from_raw(self, tag, data_elem):
+        """Return the DataElement made from the raw `data_elem` of `tag`"""
+        if tag != 0x00080005:
+            character_set = self._character_set
+        else:
+            character_set = default_encoding
+        transforms = self._raw_transforms
+        elem = DataElement_from_raw(data_elem, character_set, transforms)
+        if transforms is not None and elem.VR == 'SQ':
+            # The items were read with the same transforms
+            for item in elem.value:
+                item._raw_transforms = transforms
+
+        # If the Element has an ambiguous VR, try to correct it
+        if 'or' in elem.VR:
+            from pydicom.filewriter import correct_ambiguous_vr_element
+            elem = correct_ambiguous_vr_element(elem, self,
+                                                data_elem.is_little_endian)
+        return self._with_private_creator(elem)
+
+    def _swap_in(self, tag, raw_data_elem, elem):
+        """Replace `raw_data_elem` with `elem` unless it was already replaced,
+        and return the element of `tag`."""
+        with _swap_lock:
+            if dict.get(self, tag) is raw_data_elem:
+                dict.__setitem__(self, tag, elem)
+                return elem
+        # Converted (or set) by another thread in the meantime
+        return self[tag]
+
+    def _with_private_creator(self, data_element):
+        """Return `data_element` with its private_creator set, if it is a
+        private element in a block with a Private Creator element."""
+        tag = data_element.tag
+        if tag.is_private:
+            # See PS 3.5-2008 section 7.8.1 (p. 44) for how blocks are reserved
+            private_block = tag.elem >> 8
+            private_creator_tag = Tag(tag.group, private_block)
+            if private_creator_tag in self and tag != private_creator_tag:
+                if isinstance(data_element, RawDataElement):
+                    data_element = DataElement_from_raw(data_element,
+                                                        self._character_set)
+                data_element.private_creator = self[private_creator_tag].value
+        return data_element
 
     def get_item(self, key):
         """Return the raw data element if possible.
@@ -614,7 +763,7 @@ class Dataset(dict):
         -------
         pydicom.dataelem.DataElement
         """
-        tag = Tag(key)
+        tag = key if isinstance(key, BaseTag) else Tag(key)
         data_elem = dict.__getitem__(self, tag)
         # If a deferred read, return using __getitem__ to read and convert it
         if isinstance(data_elem, tuple) and data_elem.value is None:
@@ -654,14 +803,36 @@ class Dataset(dict):
         # Note this is different than the underlying dict class,
         #        which returns the key of the key:value mapping.
         #   Here the value is returned (but data_element.tag has the key)
-        taglist = sorted(self.keys())
+        taglist = list(self._sorted_tags())
         for tag in taglist:
             yield self[tag]
 
+    def _sorted_tags(self):
+        """Return the Dataset's tags in increasing order.
+
+        The sorted list is created on first use and then kept up to date by
+        __setitem__ and __delitem__, rather than sorting the keys every time
+        the Dataset is iterated, sliced or written. The other methods which
+        change the keys (clear, pop, popitem and setdefault) drop the index,
+        so that it is created again on next use. It is also created again if
+        the number of elements no longer matches, e.g. if dict.__setitem__
+        has been called on the Dataset directly.
+
+        Returns
+        -------
+        list of pydicom.tag.Tag
+            The index itself, which must not be modified by the caller.
+        """
+        tags = self.__dict__.get('_tags')
+        if tags is None or len(tags) != dict.__len__(self):
+            tags = sorted(self.keys())
+            self.__dict__['_tags'] = tags
+        return tags
+
     def _is_uncompressed_transfer_syntax(self):
         """Return True if the TransferSyntaxUID is a compressed syntax."""
         # FIXME uses file_meta here, should really only be thus for FileDataset
-        return self.file_meta.TransferSyntaxUID in NotCompressedPixelTransferSyntaxes
+        return self.file_meta.TransferSyntaxUID in NotCompressedPixelTransferSyntaxSet
 
     def __ne__(self, other):
         """Compare `self` and `other` for inequality."""
@@ -874,9 +1045,9 @@ class Dataset(dict):
                    "format='%s', PixelRepresentation=%d, BitsAllocated=%d")
             raise TypeError(msg % (format_str, self.PixelRepresentation,
                                    self.BitsAllocated))
-        if self.file_meta.TransferSyntaxUID in pydicom.uid.PILSupportedCompressedPixelTransferSyntaxes:
+        if self.file_meta.TransferSyntaxUID in pydicom.uid.PILSupportedCompressedPixelTransferSyntaxSet:
             UncompressedPixelData = self._get_PIL_supported_compressed_pixeldata()
-        elif self.file_meta.TransferSyntaxUID in pydicom.uid.JPEGLSSupportedCompressedPixelTransferSyntaxes:
+        elif self.file_meta.TransferSyntaxUID in pydicom.uid.JPEGLSSupportedCompressedPixelTransferSyntaxSet:
             UncompressedPixelData = self._get_jpeg_ls_supported_compressed_pixeldata()
         else:
             msg = "The transfer syntax {0} is not currently supported.".format(self.file_meta.TransferSyntaxUID)
@@ -911,7 +1082,7 @@ class Dataset(dict):
                                               "Allocated = 8")
             else:
                 arr = arr.reshape(self.Rows, self.Columns)
-        if self.file_meta.TransferSyntaxUID in pydicom.uid.JPEG2000CompressedPixelTransferSyntaxes and self.BitsStored == 16:
+        if self.file_meta.TransferSyntaxUID in pydicom.uid.JPEG2000CompressedPixelTransferSyntaxSet and self.BitsStored == 16:
             # WHY IS THIS EVEN NECESSARY??
             arr &= 0x7FFF
         return arr
@@ -937,13 +1108,13 @@ class Dataset(dict):
                   "imported.".format(self.file_meta.TransferSyntaxUID)
             raise ImportError(msg)
         # decompress here
-        if self.file_meta.TransferSyntaxUID in pydicom.uid.JPEGLossyCompressedPixelTransferSyntaxes:
+        if self.file_meta.TransferSyntaxUID in pydicom.uid.JPEGLossyCompressedPixelTransferSyntaxSet:
             if self.BitsAllocated > 8:
                 raise NotImplementedError("JPEG Lossy only supported if Bits "
                                           "Allocated = 8")
             generic_jpeg_file_header = b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x01\x00\x01\x00\x01\x00\x00'
             frame_start_from = 2
-        elif self.file_meta.TransferSyntaxUID in pydicom.uid.JPEG2000CompressedPixelTransferSyntaxes:
+        elif self.file_meta.TransferSyntaxUID in pydicom.uid.JPEG2000CompressedPixelTransferSyntaxSet:
             generic_jpeg_file_header = b''
             # generic_jpeg_file_header = b'\x00\x00\x00\x0C\x6A\x50\x20\x20\x0D\x0A\x87\x0A'
             frame_start_from = 0
@@ -1217,6 +1388,24 @@ class Dataset(dict):
 
         pydicom.write_file(filename, self, write_like_original)
 
+    def to_json(self, fp=None, bulk_data_threshold=1024,
+                bulk_data_uri_handler=None):
+        """Return or write the Dataset in the DICOM JSON Model.
+
+        See pydicom.jsonrep.to_json for the parameters.
+        """
+        from pydicom.jsonrep import to_json
+        return to_json(self, fp, bulk_data_threshold, bulk_data_uri_handler)
+
+    @staticmethod
+    def from_json(json_dataset, bulk_data_uri_handler=None):
+        """Return a Dataset from the DICOM JSON Model.
+
+        See pydicom.jsonrep.from_json for the parameters.
+        """
+        from pydicom.jsonrep import from_json
+        return from_json(json_dataset, bulk_data_uri_handler)
+
     def __setattr__(self, name, value):
         """Intercept any attempts to set a value for an instance attribute.
 
@@ -1232,9 +1421,9 @@ class Dataset(dict):
         value
             The value for the attribute to be added/changed.
         """
-        tag = tag_for_keyword(name)
+        tag = _basetag_for_keyword(name)
         if tag is not None:  # successfully mapped name to a tag
-            if tag not in self:  # don't have this tag yet->create the data_element instance
+            if not dict.__contains__(self, tag):  # don't have this tag yet->create the data_element instance
                 VR = dictionary_VR(tag)
                 data_element = DataElement(tag, VR, value)
             else:  # already have this data_element, just changing its value
@@ -1276,22 +1465,23 @@ class Dataset(dict):
         # OK if is subclass, e.g. DeferredDataElement
         if not isinstance(value, (DataElement, RawDataElement)):
             raise TypeError("Dataset contents must be DataElement instances.")
-        tag = Tag(value.tag)
+        tag = value.tag
+        if not isinstance(tag, BaseTag):
+            tag = Tag(tag)
         if key != tag:
             raise ValueError("DataElement.tag must match the dictionary key")
 
         data_element = value
         if tag.is_private:
-            # See PS 3.5-2008 section 7.8.1 (p. 44) for how blocks are reserved
             logger.debug("Setting private tag %r" % tag)
-            private_block = tag.elem >> 8
-            private_creator_tag = Tag(tag.group, private_block)
-            if private_creator_tag in self and tag != private_creator_tag:
-                if isinstance(data_element, RawDataElement):
-                    data_element = DataElement_from_raw(data_element,
-                                                        self._character_set)
-                data_element.private_creator = self[private_creator_tag].value
-        dict.__setitem__(self, tag, data_element)
+            data_element = self._with_private_creator(data_element)
+        # Under the lock of lazy conversion, so that a raw element being
+        #   converted by another thread doesn't replace the new element
+        with _swap_lock:
+            if '_tags' in self.__dict__ and not dict.__contains__(self, tag):
+                tags = self._sorted_tags()
+                tags.insert(bisect_left(tags, tag), tag)
+            dict.__setitem__(self, tag, data_element)
 
     def _slice_dataset(self, start, stop, step):
         """Return the element tags in the Dataset that match the slice.
@@ -1310,25 +1500,17 @@ class Dataset(dict):
         list of pydicom.tag.Tag
             The tags in the Dataset that meet the conditions of the slice.
         """
-        # Check the starting/stopping Tags are valid when used
-        if start and Tag(start):
-            pass
-        if stop and Tag(stop):
-            pass
-
-        all_tags = sorted(self.keys())
-        # If the Dataset is empty, return an empty list
-        if not all_tags:
-            return []
-
-        # Ensure we have valid Tags when start/stop are None
-        if start is None:
-            start = all_tags[0]
-        if stop is None:
-            stop = all_tags[-1] + 1
-
-        slice_tags = [tag for tag in all_tags if Tag(start) <= tag < Tag(stop)]
-        return slice_tags[::step]
+        all_tags = self._sorted_tags()
+
+        # Find the positions of the starting/stopping Tags, if used
+        start_index = 0
+        if start is not None:
+            start_index = bisect_left(all_tags, Tag(start))
+        stop_index = len(all_tags)
+        if stop is not None:
+            stop_index = bisect_left(all_tags, Tag(stop))
+
+        return all_tags[start_index:stop_index][::step]
 
     def __str__(self):
         """Handle str(dataset)."""
@@ -1354,6 +1536,26 @@ class Dataset(dict):
             else:
                 self[Tag(key)] = value
 
+    def clear(self):
+        """Extend dict.clear() to drop the sorted tag index."""
+        self.__dict__.pop('_tags', None)
+        dict.clear(self)
+
+    def pop(self, key, *args):
+        """Extend dict.pop() to drop the sorted tag index."""
+        self.__dict__.pop('_tags', None)
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        """Extend dict.popitem() to drop the sorted tag index."""
+        self.__dict__.pop('_tags', None)
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        """Extend dict.setdefault() to drop the sorted tag index."""
+        self.__dict__.pop('_tags', None)
+        return dict.setdefault(self, key, default)
+
     def iterall(self):
         """Iterate through the Dataset, yielding all DataElements.
 
@@ -1391,7 +1593,7 @@ class Dataset(dict):
         recursive : bool
             Flag to indicate whether to recurse into Sequences.
         """
-        taglist = sorted(self.keys())
+        taglist = list(self._sorted_tags())
         for tag in taglist:
 
             with tag_in_exception(tag):
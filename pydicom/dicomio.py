@@ -1,4 +1,4 @@
 # dicomio.py
 """Many point of entry for pydicom read and write functions"""
-from pydicom.filereader import read_file, read_dicomdir
+from pydicom.filereader import read_file, read_dicomdir, iter_sequence_items
 from pydicom.filewriter import write_file
@@ -11,7 +11,7 @@ import warnings
 import zlib
 from io import BytesIO
 
-from pydicom.tag import TupleTag
+from pydicom.tag import Tag, TupleTag, BaseTag_base_class
 from pydicom.dataelem import RawDataElement
 from pydicom.util.hexutil import bytes2hex
 from pydicom.valuerep import extra_length_VRs
@@ -32,15 +32,24 @@ import pydicom.uid  # for Implicit/Explicit/Little/Big Endian transfer syntax UI
 from pydicom.filebase import DicomFile
 from pydicom.dataset import Dataset, FileDataset
 from pydicom.dicomdir import DicomDir
-from pydicom.datadict import dictionary_VR
-from pydicom.dataelem import DataElement
+from pydicom.datadict import dictionary_VR, tag_for_keyword
+from pydicom.datadict import _dictionary_tags, _dictionary_basetag
 from pydicom.tag import ItemTag, SequenceDelimiterTag
 from pydicom.sequence import Sequence
-from pydicom.fileutil import read_undefined_length_value
+from pydicom.fileutil import (read_undefined_length_value,
+                              skip_undefined_length_items)
 from struct import Struct, unpack
 from sys import byteorder
 sys_is_little_endian = (byteorder == 'little')
 
+# Plain int values of the tags checked for every element read, so that the
+#   checks are int comparisons rather than Tag comparisons
+_specific_character_set_tag = 0x00080005
+_item_tag = 0xFFFEE000
+_item_delimiter_tag = 0xFFFEE00D
+_sequence_delimiter_tag = 0xFFFEE0DD
+_pixel_data_tag = 0x7FE00010
+
 
 class DicomIter(object):
     """Iterator over DICOM data elements created from a file-like object
@@ -115,7 +124,8 @@ class DicomIter(object):
 
 
 def data_element_generator(fp, is_implicit_VR, is_little_endian,
-                           stop_when=None, defer_size=None, encoding=default_encoding):
+                           stop_when=None, defer_size=None, encoding=default_encoding,
+                           specific_tags=None):
     """Create a generator to efficiently return the raw data elements.
 
     Parameters
@@ -132,6 +142,10 @@ def data_element_generator(fp, is_implicit_VR, is_little_endian,
         See ``read_file`` for parameter info.
     encoding :
         Encoding scheme
+    specific_tags : set of int, optional
+        If given, only the elements with these tags are returned; the values
+        of all other elements are skipped over without being read, and
+        reading stops after the last of these tags.
 
     Returns
     -------
@@ -182,6 +196,9 @@ def data_element_generator(fp, is_implicit_VR, is_little_endian,
     logger_debug = logger.debug
     debugging = config.debugging
     element_struct_unpack = element_struct.unpack
+    dictionary_tags_get = _dictionary_tags.get
+    if specific_tags is not None:
+        last_specific_tag = max(specific_tags) if specific_tags else -1
 
     while True:
         # Read tag, VR, length, get ready to read value
@@ -217,7 +234,10 @@ def data_element_generator(fp, is_implicit_VR, is_little_endian,
 
         # Positioned to read the value, but may not want to -- check stop_when
         value_tell = fp_tell()
-        tag = TupleTag((group, elem))
+        tag_value = group << 16 | elem
+        tag = dictionary_tags_get(tag_value)
+        if tag is None:
+            tag = _dictionary_basetag(tag_value)
         if stop_when is not None:
             # XXX VR may be None here!! Should stop_when just take tag?
             if stop_when(tag, VR, length):
@@ -230,12 +250,24 @@ def data_element_generator(fp, is_implicit_VR, is_little_endian,
                 fp.seek(value_tell - rewind_length)
                 return
 
+        skip = specific_tags is not None and tag_value not in specific_tags
+        if skip and tag_value > last_specific_tag:
+            # Tags are in ascending order, so there are none left to read
+            rewind_length = 8
+            if not is_implicit_VR and VR in extra_length_VRs:
+                rewind_length += 4
+            fp.seek(value_tell - rewind_length)
+            return
+
         # Reading the value
         # First case (most common): reading a value with a defined length
         if length != 0xFFFFFFFF:
+            if skip:
+                fp.seek(value_tell + length)
+                continue
             # don't defer loading of Specific Character Set value as it is needed
             # immediately to get the character encoding for other tags
-            if defer_size is not None and length > defer_size and tag != (0x08, 0x05):
+            if defer_size is not None and length > defer_size and tag_value != _specific_character_set_tag:
                 # Flag as deferred by setting value to None, and skip bytes
                 value = None
                 logger_debug("Defer size exceeded. "
@@ -251,7 +283,7 @@ def data_element_generator(fp, is_implicit_VR, is_little_endian,
                                                            bytes2hex(value[:12]), dotdot, value[:12], dotdot))
 
             # If the tag is (0008,0005) Specific Character Set, then store it
-            if tag == (0x08, 0x05):
+            if tag_value == _specific_character_set_tag:
                 from pydicom.values import convert_string
                 encoding = convert_string(value, is_little_endian, encoding=default_encoding)
                 # Store the encoding value in the generator for use with future elements (SQs)
@@ -260,10 +292,10 @@ def data_element_generator(fp, is_implicit_VR, is_little_endian,
             yield RawDataElement(tag, VR, length, value, value_tell,
                                  is_implicit_VR, is_little_endian)
 
-        # Second case: undefined length - must seek to delimiter,
-        # unless is SQ type, in which case is easier to parse it, because
-        # undefined length SQs and items of undefined lengths can be nested
-        # and it would be error-prone to read to the correct outer delimiter
+        # Second case: undefined length - must seek to delimiter.
+        # If is SQ type, undefined length SQs and items of undefined lengths
+        # can be nested, so the item structure must be followed to find the
+        # correct outer delimiter
         else:
             # Try to look up type to see if is a SQ
             # if private tag, won't be able to look it up in dictionary,
@@ -281,22 +313,35 @@ def data_element_generator(fp, is_implicit_VR, is_little_endian,
                         VR = 'SQ'
 
             if VR == 'SQ':
+                # Only skim the items to find the matching delimiter; the
+                #   sequence is parsed from the raw bytes when first accessed
                 if debugging:
-                    msg = "{0:08x}: Reading/parsing undefined length sequence"
+                    msg = "{0:08x}: Skimming undefined length sequence"
                     logger_debug(msg.format(fp_tell()))
-                seq = read_sequence(fp, is_implicit_VR,
-                                    is_little_endian, length, encoding)
-                yield DataElement(tag, VR, seq, value_tell,
-                                  is_undefined_length=True)
+                value_end = skip_undefined_length_items(fp, is_implicit_VR,
+                                                        is_little_endian)
+                if skip:
+                    fp.seek(value_end + 8)
+                    continue
+                if defer_size is not None and value_end - value_tell > defer_size:
+                    value = None
+                else:
+                    fp.seek(value_tell)
+                    value = fp_read(value_end - value_tell)
+                    fp.seek(value_end + 8)  # past delimiter and its length
+                yield RawDataElement(tag, VR, length, value, value_tell,
+                                     is_implicit_VR, is_little_endian)
             else:
                 delimiter = SequenceDelimiterTag
                 if debugging:
                     logger_debug("Reading undefined length data element")
                 value = read_undefined_length_value(fp, is_little_endian,
                                                     delimiter, defer_size)
+                if skip:
+                    continue
 
                 # If the tag is (0008,0005) Specific Character Set, then store it
-                if tag == (0x08, 0x05):
+                if tag_value == _specific_character_set_tag:
                     from pydicom.values import convert_string
                     encoding = convert_string(value, is_little_endian, encoding=default_encoding)
                     # Store the encoding value in the generator for use with future elements (SQs)
@@ -307,7 +352,8 @@ def data_element_generator(fp, is_implicit_VR, is_little_endian,
 
 
 def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
-                 stop_when=None, defer_size=None, parent_encoding=default_encoding):
+                 stop_when=None, defer_size=None, parent_encoding=default_encoding,
+                 specific_tags=None, raw_transforms=None):
     """Return a Dataset instance containing the next dataset in the file.
 
     Parameters
@@ -329,6 +375,11 @@ def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
     parent_encoding :
         optional encoding to use as a default in case
         a Specific Character Set (0008,0005) isn't specified
+    specific_tags : set of int, optional
+        Only read the elements with these tags.
+        See help for data_element_generator for details
+    raw_transforms : pydicom.rawtransforms.RawTransforms, optional
+        See ``read_file`` for parameter info.
 
     Returns
     -------
@@ -342,14 +393,15 @@ def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
     raw_data_elements = dict()
     fpStart = fp.tell()
     de_gen = data_element_generator(fp, is_implicit_VR, is_little_endian,
-                                    stop_when, defer_size, parent_encoding)
+                                    stop_when, defer_size, parent_encoding,
+                                    specific_tags)
     try:
         while (bytelength is None) or (fp.tell() - fpStart < bytelength):
             raw_data_element = next(de_gen)
             # Read data elements. Stop on some errors, but return what was read
             tag = raw_data_element.tag
             # Check for ItemDelimiterTag --dataset is an item in a sequence
-            if tag == (0xFFFE, 0xE00D):
+            if tag == _item_delimiter_tag:
                 break
             raw_data_elements[tag] = raw_data_element
     except StopIteration:
@@ -361,34 +413,39 @@ def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
     except NotImplementedError as details:
         logger.error(details)
 
-    return Dataset(raw_data_elements)
+    return Dataset(raw_data_elements, raw_transforms=raw_transforms)
 
 
 def read_sequence(fp, is_implicit_VR, is_little_endian, bytelength, encoding,
                   offset=0):
     """Read and return a Sequence -- i.e. a list of Datasets"""
-
-    seq = []  # use builtin list to start for speed, convert to Sequence at end
-    is_undefined_length = False
-    if bytelength != 0:  # SQ of length 0 possible (PS 3.5-2008 7.5.1a (p.40)
-        if bytelength == 0xffffffff:
-            is_undefined_length = True
-            bytelength = None
-        fp_tell = fp.tell  # for speed in loop
-        fpStart = fp_tell()
-        while (not bytelength) or (fp_tell() - fpStart < bytelength):
-            file_tell = fp.tell()
-            dataset = read_sequence_item(fp, is_implicit_VR, is_little_endian,
-                                         encoding, offset)
-            if dataset is None:  # None is returned if hit Sequence Delimiter
-                break
-            dataset.file_tell = file_tell + offset
-            seq.append(dataset)
+    # use builtin list to start for speed, convert to Sequence at end
+    seq = list(_sequence_items(fp, is_implicit_VR, is_little_endian,
+                               bytelength, encoding, offset))
     seq = Sequence(seq)
-    seq.is_undefined_length = is_undefined_length
+    seq.is_undefined_length = (bytelength == 0xffffffff)
     return seq
 
 
+def _sequence_items(fp, is_implicit_VR, is_little_endian, bytelength,
+                    encoding, offset=0):
+    """Yield the items (Datasets) of a sequence value one at a time."""
+    if bytelength == 0:  # SQ of length 0 possible (PS 3.5-2008 7.5.1a (p.40)
+        return
+    if bytelength == 0xffffffff:
+        bytelength = None
+    fp_tell = fp.tell  # for speed in loop
+    fpStart = fp_tell()
+    while (not bytelength) or (fp_tell() - fpStart < bytelength):
+        file_tell = fp_tell()
+        dataset = read_sequence_item(fp, is_implicit_VR, is_little_endian,
+                                     encoding, offset)
+        if dataset is None:  # None is returned if hit Sequence Delimiter
+            break
+        dataset.file_tell = file_tell + offset
+        yield dataset
+
+
 def read_sequence_item(fp, is_implicit_VR, is_little_endian, encoding, offset=0):
     """Read and return a single sequence item, i.e. a Dataset"""
     seq_item_tell = fp.tell() + offset
@@ -402,14 +459,14 @@ def read_sequence_item(fp, is_implicit_VR, is_little_endian, encoding, offset=0)
     except:
         raise IOError("No tag to read at file position "
                       "{0:05x}".format(fp.tell() + offset))
-    tag = (group, element)
-    if tag == SequenceDelimiterTag:  # No more items, time to stop reading
+    tag = group << 16 | element
+    if tag == _sequence_delimiter_tag:  # No more items, time to stop reading
         logger.debug("{0:08x}: {1}".format(fp.tell() - 8 + offset, "End of Sequence"))
         if length != 0:
             logger.warning("Expected 0x00000000 after delimiter, found 0x%x, "
                            "at position 0x%x" % (length, fp.tell() - 4 + offset))
         return None
-    if tag != ItemTag:
+    if tag != _item_tag:
         logger.warning("Expected sequence item with tag %s at file position "
                        "0x%x" % (ItemTag, fp.tell() - 4 + offset))
     else:
@@ -567,47 +624,29 @@ def read_preamble(fp, force):
 
 
 def _at_pixel_data(tag, VR, length):
-    return tag == (0x7fe0, 0x0010)
+    return tag == _pixel_data_tag
 
 
-def read_partial(fileobj, stop_when=None, defer_size=None, force=False):
-    """Parse a DICOM file until a condition is met.
+def _dataset_encoding(fileobj, transfer_syntax):
+    """Return the VR and endianness used to encode the dataset in `fileobj`.
 
     Parameters
     ----------
-    fileobj : a file-like object
-        Note that the file will not close when the function returns.
-    stop_when :
-        Stop condition. See ``read_dataset`` for more info.
-    defer_size : int, str, None, optional
-        See ``read_file`` for parameter info.
-    force : boolean
-        See ``read_file`` for parameter info.
-
-    Notes
-    -----
-    Use ``read_file`` unless you need to stop on some condition other than
-    reaching pixel data.
+    fileobj : file-like
+        Positioned at the start of the dataset, after any File Meta
+        Information and Command Set elements.
+    transfer_syntax : UID or None
+        The (0002,0010) Transfer Syntax UID, if available. If None then the
+        encoding is guessed from the first element.
 
     Returns
     -------
-    FileDataset instance or DicomDir instance.
-
-    See Also
-    --------
-    read_file
-        More generic file reading function.
+    fileobj : file-like
+        The file-like to read the dataset from. This is a new file-like for a
+        deflated transfer syntax, otherwise `fileobj` itself.
+    is_implicit_VR : bool
+    is_little_endian : bool
     """
-    ## Read File Meta Information
-    # Read preamble (if present)
-    preamble = read_preamble(fileobj, force)
-    # Read any File Meta Information group (0002,eeee) elements (if present)
-    file_meta_dataset = _read_file_meta_info(fileobj)
-
-    ## Read Dataset
-    # Read any Command Set group (0000,eeee) elements (if present)
-    command_set = _read_command_set_elements(fileobj)
-
     # Check to see if there's anything left to read
     peek = fileobj.read(1)
     fileobj.seek(-1, 1)
@@ -618,7 +657,6 @@ def read_partial(fileobj, stop_when=None, defer_size=None, force=False):
     #   transfer syntax of implicit VR little endian and correct it as necessary
     is_implicit_VR = True
     is_little_endian = True
-    transfer_syntax = file_meta_dataset.get("TransferSyntaxUID")
     if peek == b'': # EOF
         pass
     elif transfer_syntax is None:  # issue 258
@@ -669,12 +707,82 @@ def read_partial(fileobj, stop_when=None, defer_size=None, force=False):
         #        by Standard PS 3.5-2008 A.4 (p63)
         is_implicit_VR = False
 
+    return fileobj, is_implicit_VR, is_little_endian
+
+
+def _specific_tag_set(specific_tags):
+    """Return the set of int tags for the tags or keywords `specific_tags`.
+
+    (0008,0005) Specific Character Set is always included, as it is needed
+    to decode the values of the other elements.
+    """
+    tags = set([_specific_character_set_tag])
+    for tag in specific_tags:
+        if isinstance(tag, compat.string_types):
+            keyword_tag = tag_for_keyword(tag)
+            if keyword_tag is not None:
+                tag = keyword_tag
+        tags.add(BaseTag_base_class(Tag(tag)))
+    return tags
+
+
+def read_partial(fileobj, stop_when=None, defer_size=None, force=False,
+                 specific_tags=None, raw_transforms=None):
+    """Parse a DICOM file until a condition is met.
+
+    Parameters
+    ----------
+    fileobj : a file-like object
+        Note that the file will not close when the function returns.
+    stop_when :
+        Stop condition. See ``read_dataset`` for more info.
+    defer_size : int, str, None, optional
+        See ``read_file`` for parameter info.
+    force : boolean
+        See ``read_file`` for parameter info.
+    specific_tags : list or None
+        See ``read_file`` for parameter info.
+    raw_transforms : pydicom.rawtransforms.RawTransforms, optional
+        See ``read_file`` for parameter info.
+
+    Notes
+    -----
+    Use ``read_file`` unless you need to stop on some condition other than
+    reaching pixel data.
+
+    Returns
+    -------
+    FileDataset instance or DicomDir instance.
+
+    See Also
+    --------
+    read_file
+        More generic file reading function.
+    """
+    ## Read File Meta Information
+    # Read preamble (if present)
+    preamble = read_preamble(fileobj, force)
+    # Read any File Meta Information group (0002,eeee) elements (if present)
+    file_meta_dataset = _read_file_meta_info(fileobj)
+
+    ## Read Dataset
+    # Read any Command Set group (0000,eeee) elements (if present)
+    command_set = _read_command_set_elements(fileobj)
+
+    transfer_syntax = file_meta_dataset.get("TransferSyntaxUID")
+    fileobj, is_implicit_VR, is_little_endian = _dataset_encoding(
+        fileobj, transfer_syntax)
+
     # Try and decode the dataset
     #   By this point we should be at the start of the dataset and have
     #   the transfer syntax (whether read from the file meta or guessed at)
+    if specific_tags is not None:
+        specific_tags = _specific_tag_set(specific_tags)
     try:
         dataset = read_dataset(fileobj, is_implicit_VR, is_little_endian,
-                               stop_when=stop_when, defer_size=defer_size)
+                               stop_when=stop_when, defer_size=defer_size,
+                               specific_tags=specific_tags,
+                               raw_transforms=raw_transforms)
     except EOFError:
         pass  # error already logged in read_dataset
 
@@ -690,7 +798,105 @@ def read_partial(fileobj, stop_when=None, defer_size=None, force=False):
                            is_implicit_VR, is_little_endian)
 
 
-def read_file(fp, defer_size=None, stop_before_pixels=False, force=False):
+def iter_sequence_items(fp, sequence_tag, force=False):
+    """Yield the items of a top-level sequence in a DICOM file one at a time.
+
+    Unlike ``read_file``, the sequence is never built as a whole: each item
+    Dataset is read and yielded in turn, so very large sequences (e.g. the
+    Directory Record Sequence of a DICOMDIR, or the Control Point Sequence
+    of an RT Plan) can be processed in constant memory, and reading stops
+    early if the caller stops iterating. Elements before the sequence are
+    read (but not kept) only to find the character set; those after it are
+    never read.
+
+    Parameters
+    ----------
+    fp : str or file-like
+        Either a file-like object, or a string containing the file name. If a
+        file-like object, the caller is responsible for closing it.
+    sequence_tag : int or str or 2-tuple
+        The tag of the sequence element, in any form accepted by
+        pydicom.tag.Tag, or its element keyword.
+    force : bool
+        See ``read_file`` for parameter info.
+
+    Yields
+    ------
+    pydicom.dataset.Dataset
+        The sequence items, in file order. Nothing is yielded if the
+        sequence is not in the file or is empty.
+
+    Raises
+    ------
+    ValueError
+        If the element with `sequence_tag` is not a sequence.
+
+    Examples
+    --------
+    >>> for record in iter_sequence_items("DICOMDIR", "DirectoryRecordSequence"):
+    >>>     if record.DirectoryRecordType == "PATIENT":
+    >>>         print(record.PatientName)
+    """
+    if isinstance(sequence_tag, compat.string_types):
+        tag = tag_for_keyword(sequence_tag)
+        sequence_tag = Tag(sequence_tag if tag is None else tag)
+    else:
+        sequence_tag = Tag(sequence_tag)
+
+    caller_owns_file = True
+    if isinstance(fp, compat.string_types):
+        caller_owns_file = False
+        fp = open(fp, 'rb')
+
+    def _at_or_past_sequence(tag, VR, length):
+        return tag >= sequence_tag
+
+    try:
+        read_preamble(fp, force)
+        file_meta_dataset = _read_file_meta_info(fp)
+        _read_command_set_elements(fp)
+        transfer_syntax = file_meta_dataset.get("TransferSyntaxUID")
+        fp_ds, is_implicit_VR, is_little_endian = _dataset_encoding(
+            fp, transfer_syntax)
+        dataset = read_dataset(fp_ds, is_implicit_VR, is_little_endian,
+                               stop_when=_at_or_past_sequence)
+
+        # Read the header of the sequence element, if present
+        if is_little_endian:
+            endian_chr = "<"
+        else:
+            endian_chr = ">"
+        bytes_read = fp_ds.read(8)
+        if len(bytes_read) < 8:
+            return
+        if is_implicit_VR:
+            group, elem, length = unpack(endian_chr + "HHL", bytes_read)
+            try:
+                VR = dictionary_VR(sequence_tag)
+            except KeyError:  # e.g. private, so assume it is a sequence
+                VR = 'SQ'
+        else:
+            group, elem, VR, length = unpack(endian_chr + "HH2sH", bytes_read)
+            if not in_py2:
+                VR = VR.decode(default_encoding)
+            if VR in extra_length_VRs:
+                length = unpack(endian_chr + "L", fp_ds.read(4))[0]
+        if TupleTag((group, elem)) != sequence_tag:
+            return
+        if VR != 'SQ':
+            raise ValueError("Element {0} is not a sequence (VR is "
+                             "'{1}')".format(sequence_tag, VR))
+
+        for item in _sequence_items(fp_ds, is_implicit_VR, is_little_endian,
+                                    length, dataset._character_set):
+            yield item
+    finally:
+        if not caller_owns_file:
+            fp.close()
+
+
+def read_file(fp, defer_size=None, stop_before_pixels=False, force=False,
+              specific_tags=None, raw_transforms=None):
     """Read and parse a DICOM dataset stored in the DICOM File Format.
 
     Read a DICOM dataset stored in accordance with the DICOM File Format (DICOM
@@ -717,6 +923,17 @@ def read_file(fp, defer_size=None, stop_before_pixels=False, force=False):
         If False (default), raises an InvalidDicomError if the file is missing
         the File Meta Information header. Set to True to force reading even if
         no File Meta Information header is found.
+    specific_tags : list or None
+        If None (default), all elements are read. If a list of tags (in any
+        form accepted by pydicom.tag.Tag) or element keywords, only those
+        elements (and Specific Character Set) of the dataset are read; the
+        values of the others are skipped over, and reading stops after the
+        last of the given tags. The File Meta Information is always read.
+    raw_transforms : pydicom.rawtransforms.RawTransforms or None
+        If None (default), the raw transforms of config.raw_transforms are
+        applied to the elements (and those of sequence items) as they are
+        converted. Otherwise these transforms are applied instead; an empty
+        RawTransforms applies none.
 
     Returns
     -------
@@ -745,6 +962,15 @@ def read_file(fp, defer_size=None, stop_before_pixels=False, force=False):
     >>> ds = pydicom.read_file("rtplan.dcm", force=True)
     >>> ds.PatientName
 
+    Only read the Patient's Name and Study Date
+    >>> ds = pydicom.read_file("rtplan.dcm",
+    >>>                        specific_tags=["PatientName", 0x00080020])
+
+    Replace commas used as separators in DS and IS values
+    >>> transforms = RawTransforms()
+    >>> fix_separator(b",", transforms=transforms)
+    >>> ds = pydicom.read_file("rtplan.dcm", raw_transforms=transforms)
+
     Use within a context manager:
     >>> with pydicom.read_file("rtplan.dcm") as ds:
     >>>     ds.PatientName
@@ -764,8 +990,9 @@ def read_file(fp, defer_size=None, stop_before_pixels=False, force=False):
         logger.debug("\n" + "-" * 80)
         logger.debug("Call to read_file()")
         msg = ("filename:'%s', defer_size='%s', "
-               "stop_before_pixels=%s, force=%s")
-        logger.debug(msg % (fp.name, defer_size, stop_before_pixels, force))
+               "stop_before_pixels=%s, force=%s, specific_tags=%s")
+        logger.debug(msg % (fp.name, defer_size, stop_before_pixels, force,
+                            specific_tags))
         if caller_owns_file:
             logger.debug("Caller passed file object")
         else:
@@ -783,7 +1010,8 @@ def read_file(fp, defer_size=None, stop_before_pixels=False, force=False):
         stop_when = _at_pixel_data
     try:
         dataset = read_partial(fp, stop_when, defer_size=defer_size,
-                               force=force)
+                               force=force, specific_tags=specific_tags,
+                               raw_transforms=raw_transforms)
     finally:
         if not caller_owns_file:
             fp.close()
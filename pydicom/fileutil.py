@@ -5,9 +5,11 @@
 #    See the file license.txt included with this distribution, also
 #    available at https://github.com/darcymason/pydicom
 
-from struct import pack, unpack
+from struct import pack, unpack, Struct
 from pydicom.tag import TupleTag, Tag
 from pydicom.datadict import dictionary_description
+from pydicom.valuerep import extra_length_VRs
+from pydicom.compat import in_py2
 
 from pydicom.config import logger
 
@@ -160,6 +162,87 @@ def read_undefined_length_value(fp, is_little_endian, delimiter_tag, defer_size=
         return b"".join(value_chunks)
 
 
+def skip_undefined_length_items(fp, is_implicit_VR, is_little_endian):
+    """Skim over the items of an undefined length value without parsing them.
+
+    Starting at the first byte of the value of an undefined length element
+    (e.g. a sequence), walk only the item and data element headers to find the
+    Sequence Delimiter which matches it, skipping over any defined length values.
+    Items and elements of undefined length are followed recursively, so that
+    delimiters belonging to nested sequences are not mistaken for the end.
+    The contents of undefined length UN elements are always implicit VR
+    little endian (PS3.5 section 6.2.2), so are skimmed as implicit VR.
+
+    On completion, the file will be set to the first byte after the delimiter
+    and its following four zero bytes.
+
+    Parameters
+    ----------
+    fp : a file-like object
+        Positioned at the start of the value.
+    is_implicit_VR : boolean
+        True if the transfer syntax is implicit VR, else False.
+    is_little_endian : boolean
+        True if the transfer syntax is little endian, else False.
+
+    Returns
+    -------
+    int
+        The file position of the Sequence Delimiter, i.e. the value's end.
+
+    Raises
+    ------
+    EOFError
+        If EOF is reached before the delimiter is found.
+    """
+    endian_chr = "<" if is_little_endian else ">"
+    tag_length_unpack = Struct(endian_chr + "HHL").unpack
+    explicit_unpack = Struct(endian_chr + "HH2sH").unpack
+    extra_length_unpack = Struct(endian_chr + "L").unpack
+    fp_read = fp.read
+    fp_tell = fp.tell
+    fp_seek = fp.seek
+
+    def read_header(item_level, implicit):
+        """Return (group, elem, VR, length) of the next item or element header"""
+        bytes_read = fp_read(8)
+        if len(bytes_read) < 8:
+            raise EOFError("End of file reached before sequence "
+                           "delimiter found")
+        group, elem, length = tag_length_unpack(bytes_read)
+        # Item and delimiter tags never have a VR, even if explicit VR
+        if implicit or item_level or group == 0xFFFE:
+            return group, elem, None, length
+        group, elem, VR, length = explicit_unpack(bytes_read)
+        if not in_py2:
+            VR = VR.decode('iso8859')
+        if VR in extra_length_VRs:
+            length = extra_length_unpack(fp_read(4))[0]
+        return group, elem, VR, length
+
+    # Stack of nesting levels still waiting for their delimiters, each a
+    #   tuple of (item_level, implicit): item_level is True if reading the
+    #   items of a value, False if reading the data elements of an undefined
+    #   length item, and implicit is True if the level is implicit VR
+    levels = [(True, is_implicit_VR)]
+    while True:
+        item_level, implicit = levels[-1]
+        group, elem, VR, length = read_header(item_level, implicit)
+        if group == 0xFFFE and elem == 0xE0DD:  # Sequence Delimiter
+            levels.pop()
+            if not levels:
+                return fp_tell() - 8
+        elif group == 0xFFFE and elem == 0xE00D:  # Item Delimiter
+            if len(levels) > 1:
+                levels.pop()
+        elif length == 0xFFFFFFFF:
+            # An undefined length item contains data elements, while
+            #   an undefined length data element contains items
+            levels.append((group != 0xFFFE, implicit or VR == 'UN'))
+        else:
+            fp_seek(fp_tell() + length)
+
+
 def find_delimiter(fp, delimiter, is_little_endian, read_size=128, rewind=True):
     """Return file position where 4-byte delimiter is located.
 
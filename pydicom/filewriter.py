@@ -65,9 +65,10 @@ def correct_ambiguous_vr_element(elem, ds, is_little_endian):
                     if ds.BitsAllocated > 8:
                         elem.VR = 'OW'
                     else:
-                        if len(ds.PixelData) / (ds.Rows * ds.Columns) == 2:
+                        # `elem` may not be in `ds` yet, so use its value
+                        if len(elem.value) / (ds.Rows * ds.Columns) == 2:
                             elem.VR = 'OW'
-                        elif len(ds.PixelData) / (ds.Rows * ds.Columns) == 1:
+                        elif len(elem.value) / (ds.Rows * ds.Columns) == 1:
                             elem.VR = 'OB'
             except AttributeError:
                 pass
@@ -421,7 +422,7 @@ def write_dataset(fp, dataset, parent_encoding=default_encoding):
 
     fpStart = fp.tell()
     # data_elements must be written in tag order
-    tags = sorted(dataset.keys())
+    tags = dataset._sorted_tags()
 
     for tag in tags:
         with tag_in_exception(tag):
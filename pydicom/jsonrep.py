@@ -0,0 +1,291 @@
+# jsonrep.py
+"""Convert Datasets to and from the DICOM JSON Model (PS3.18 Annex F)"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, released under a modified MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+from array import array
+import base64
+import json
+
+from pydicom import compat
+from pydicom.charset import default_encoding
+from pydicom.datadict import dictionary_VR
+from pydicom.dataelem import DataElement
+from pydicom.dataset import Dataset
+from pydicom.sequence import Sequence
+from pydicom.tag import BaseTag
+
+# VRs whose values are given as InlineBinary or BulkDataURI, and the size
+#   of their words for byte swapping big endian values
+binary_VR_word_sizes = {
+    'OB': 1, 'UN': 1, 'OB or OW': 2, 'OW': 2, 'US or OW': 2,
+    'US or SS or OW': 2, 'OF': 4, 'OL': 4, 'OD': 8,
+}
+
+# VRs whose values are given as JSON numbers
+number_VRs = ['DS', 'FL', 'FD', 'IS', 'SL', 'SS', 'UL', 'US', 'US or SS']
+
+if compat.in_py2:
+    _int_types = (int, long)
+else:
+    _int_types = (int,)
+
+# Type codes of the array module for words of each size
+_array_types = {2: 'H', 4: 'L' if array('L').itemsize == 4 else 'I', 8: 'd'}
+
+_dumps = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def _little_endian(value, word_size):
+    """Return the bytes of a big endian binary value in little endian"""
+    words = array(_array_types[word_size])
+    if compat.in_py2:
+        words.fromstring(value)
+    else:
+        words.frombytes(value)
+    words.byteswap()
+    return words.tostring() if compat.in_py2 else words.tobytes()
+
+
+def _text(value):
+    """Return an element value as text for JSON"""
+    value = getattr(value, 'original_string', value)  # e.g. PersonName3
+    if isinstance(value, bytes):
+        return value.decode(default_encoding)
+    if isinstance(value, compat.text_type):
+        # A copy of the plain text; str() of a UID is its name
+        return value[:]
+    return compat.text_type(value)
+
+
+def _json_VR(VR, value):
+    """Return the VR to give for an element whose VR is still ambiguous"""
+    if VR in binary_VR_word_sizes:
+        return 'OW' if 'OW' in VR else VR
+    if VR == 'US or SS':
+        values = value if isinstance(value, list) else [value]
+        if any(val < 0 for val in values if val != ''):
+            return 'SS'
+        return 'US'
+    return VR.split(' or ')[0]
+
+
+def _json_values(VR, value):
+    """Return the JSON "Value" array of an element which is not binary"""
+    values = value if isinstance(value, list) else [value]
+    if VR == 'PN':
+        names = []
+        for val in values:
+            components = _text(val).split('=')
+            name = dict((group, component) for group, component in
+                        zip(('Alphabetic', 'Ideographic', 'Phonetic'),
+                            components) if component)
+            names.append(name or None)
+        return names
+    if VR == 'AT':
+        return ["{0:08X}".format(val) for val in values]
+    if VR in number_VRs:
+        numbers = []
+        for val in values:
+            if val == '' or val is None:
+                numbers.append(None)
+            elif VR == 'IS' or isinstance(val, _int_types):
+                numbers.append(int(val))
+            else:
+                numbers.append(float(val))
+        return numbers
+    return [_text(val) if val != '' else None for val in values]
+
+
+def _binary_json(tag, VR, value, bulk_data_threshold, bulk_data_uri_handler):
+    """Return the JSON of a binary element value, given in little endian"""
+    if bulk_data_uri_handler is not None and \
+            len(value) > bulk_data_threshold:
+        uri = bulk_data_uri_handler(tag, VR, value)
+        return '{{"vr":"{0}","BulkDataURI":{1}}}'.format(VR, _dumps(uri))
+    return '{{"vr":"{0}","InlineBinary":"{1}"}}'.format(
+        VR, base64.b64encode(value).decode('ascii'))
+
+
+def _dataset_chunks(dataset, is_little_endian, bulk_data_threshold,
+                    bulk_data_uri_handler):
+    """Yield the JSON of `dataset` in pieces"""
+    yield '{'
+    separator = ''
+    for tag in dataset._sorted_tags():
+        if tag & 0xFFFF == 0:
+            continue  # Group lengths are not part of the JSON model
+        key = '{0}"{1:08X}":'.format(separator, tag)
+        separator = ','
+
+        # Take binary values from the raw element as they are, rather than
+        #   converting the element in the dataset
+        data_element = dict.__getitem__(dataset, tag)
+        if isinstance(data_element, tuple) and data_element.value is not None:
+            VR = data_element.VR
+            if VR is None:
+                try:
+                    VR = dictionary_VR(tag)
+                except KeyError:
+                    VR = 'UN'
+            word_size = binary_VR_word_sizes.get(VR)
+            if word_size is not None and (word_size == 1 or
+                                          data_element.is_little_endian):
+                yield key + _binary_json(tag, _json_VR(VR, None),
+                                         data_element.value,
+                                         bulk_data_threshold,
+                                         bulk_data_uri_handler)
+                continue
+        data_element = dataset[tag]
+
+        VR = data_element.VR
+        value = data_element.value
+        if ' or ' in VR:
+            VR = _json_VR(VR, value)
+        if value is None or value == '' or value == b'' or (
+                isinstance(value, list) and not value):
+            yield key + '{{"vr":"{0}"}}'.format(VR)
+        elif VR == 'SQ':
+            yield key + '{"vr":"SQ","Value":['
+            item_separator = ''
+            for item in value:
+                yield item_separator
+                item_separator = ','
+                for chunk in _dataset_chunks(item, is_little_endian,
+                                             bulk_data_threshold,
+                                             bulk_data_uri_handler):
+                    yield chunk
+            yield ']}'
+        elif VR in binary_VR_word_sizes:
+            word_size = binary_VR_word_sizes[VR]
+            if word_size > 1 and not is_little_endian:
+                value = _little_endian(value, word_size)
+            yield key + _binary_json(tag, VR, value, bulk_data_threshold,
+                                     bulk_data_uri_handler)
+        else:
+            yield key + '{{"vr":"{0}","Value":{1}}}'.format(
+                VR, _dumps(_json_values(VR, value)))
+    yield '}'
+
+
+def to_json(dataset, fp=None, bulk_data_threshold=1024,
+            bulk_data_uri_handler=None):
+    """Return or write `dataset` in the DICOM JSON Model (PS3.18 Annex F).
+
+    The JSON is produced in pieces, so that writing it to `fp` does not
+    need it all in memory. Binary values (OB, OW, UN etc.) that were not
+    converted yet are taken from the raw element as they are, without
+    converting the element in the dataset; the other elements are converted
+    as by normal access. Group length elements are left out.
+
+    Parameters
+    ----------
+    dataset : pydicom.dataset.Dataset
+        The dataset to convert.
+    fp : file-like, optional
+        A text file-like to write the JSON to. If None (default), the JSON
+        is returned as a string.
+    bulk_data_threshold : int
+        Binary values longer than this (in bytes, default 1024) are given by
+        a BulkDataURI if `bulk_data_uri_handler` is given, rather than as
+        InlineBinary.
+    bulk_data_uri_handler : callable, optional
+        Called with the tag, VR and (little endian) value of each large
+        binary value, it must return the BulkDataURI to give for it.
+
+    Returns
+    -------
+    str or None
+        The JSON (unicode on Python 2), if `fp` is None.
+
+    Examples
+    --------
+    >>> with open("study.json", "w") as fp:
+    >>>     fp.write("[")
+    >>>     for i, ds in enumerate(datasets):
+    >>>         if i:
+    >>>             fp.write(",")
+    >>>         to_json(ds, fp)
+    >>>     fp.write("]")
+    """
+    chunks = _dataset_chunks(dataset,
+                             getattr(dataset, 'is_little_endian', True),
+                             bulk_data_threshold, bulk_data_uri_handler)
+    if compat.in_py2:
+        # Text like the values, for text files such as io.StringIO
+        chunks = (compat.text_type(chunk) for chunk in chunks)
+    if fp is None:
+        return ''.join(chunks)
+    for chunk in chunks:
+        fp.write(chunk)
+
+
+def _element_value(VR, json_element, bulk_data_uri_handler):
+    """Return the value of a DataElement for the JSON of an element"""
+    if 'Value' in json_element:
+        values = json_element['Value']
+        if VR == 'SQ':
+            return Sequence([_dataset(item, bulk_data_uri_handler)
+                             for item in values])
+        if VR == 'PN':
+            values = ['='.join(name.get(group, '') for group in
+                               ('Alphabetic', 'Ideographic', 'Phonetic')
+                               ).rstrip('=') if name else ''
+                      for name in values]
+        elif VR == 'AT':
+            values = [int(val, 16) for val in values]
+        elif VR in ('DS', 'IS'):
+            # As strings, as they would be in a file
+            values = [compat.text_type(val) if val is not None else ''
+                      for val in values]
+        else:
+            values = [val if val is not None else '' for val in values]
+        return values[0] if len(values) == 1 else values
+    if 'InlineBinary' in json_element:
+        return base64.b64decode(json_element['InlineBinary'])
+    if 'BulkDataURI' in json_element and bulk_data_uri_handler is not None:
+        return bulk_data_uri_handler(json_element['BulkDataURI'])
+    if VR == 'SQ':
+        return Sequence()
+    if VR in binary_VR_word_sizes:
+        return b''
+    return ''
+
+
+def _dataset(json_dataset, bulk_data_uri_handler):
+    """Return the Dataset for a parsed JSON dataset object"""
+    dataset = Dataset()
+    for key, json_element in json_dataset.items():
+        tag = BaseTag(int(key, 16))
+        VR = json_element['vr']
+        value = _element_value(VR, json_element, bulk_data_uri_handler)
+        dataset.add(DataElement(tag, VR, value))
+    return dataset
+
+
+def from_json(json_dataset, bulk_data_uri_handler=None):
+    """Return a Dataset from the DICOM JSON Model (PS3.18 Annex F).
+
+    Parameters
+    ----------
+    json_dataset : str, file-like or dict
+        The JSON of one dataset, as a string, a file-like to read it from
+        or a dict already parsed from it.
+    bulk_data_uri_handler : callable, optional
+        Called with the BulkDataURI of each element that has one, it must
+        return the value of the element as bytes. If None (default), such
+        elements are left empty.
+
+    Returns
+    -------
+    pydicom.dataset.Dataset
+    """
+    if isinstance(json_dataset, (compat.string_types, bytes)):
+        if isinstance(json_dataset, bytes):
+            json_dataset = json_dataset.decode('utf-8')
+        json_dataset = json.loads(json_dataset)
+    elif not isinstance(json_dataset, dict):
+        json_dataset = json.load(json_dataset)
+    return _dataset(json_dataset, bulk_data_uri_handler)
@@ -7,6 +7,8 @@ must all be the same type.
 #    See the file license.txt included with this distribution, also
 #    available at https://github.com/darcymason/pydicom
 #
+from pydicom import compat
+from pydicom import config
 
 
 class MultiValue(list):
@@ -65,3 +67,170 @@ class MultiValue(list):
         lines = [str(x) for x in self]
         return "['" + "', '".join(lines) + "']"
     __repr__ = __str__
+
+
+class _Unconverted(object):
+    """Placeholder for a LazyMultiValue item that has not been converted yet"""
+    __slots__ = ['raw']
+
+    def __init__(self, raw):
+        self.raw = raw
+
+
+class LazyMultiValue(MultiValue):
+    """A MultiValue which converts its initial items only when accessed.
+
+    The items passed on creation are stored unconverted, and the
+    type_constructor is applied to an item the first time it is indexed or
+    iterated over; the converted value is then cached in place of the raw one.
+    Worthwhile for large multi-valued elements of which only a few items
+    (or none) are ever used.
+
+    Items added later (append, extend, insert, or by index or slice) are
+    converted immediately, as for MultiValue. Operations which need every
+    item (comparison, membership, sort, etc.) convert them all first.
+    """
+
+    def __init__(self, type_constructor, iterable):
+        """Initialize the list of values, deferring their conversion
+
+        :param type_constructor: see MultiValue
+        :param iterable: an iterable of the raw (not yet converted) items
+        """
+        self.type_constructor = type_constructor
+        list.__init__(self, [_Unconverted(x) for x in iterable])
+
+    def _item(self, i):
+        """Return the item at int index `i`, converting it if necessary"""
+        val = list.__getitem__(self, i)
+        if val.__class__ is _Unconverted:
+            val = self.type_constructor(val.raw)
+            list.__setitem__(self, i, val)
+        return val
+
+    def _convert_all(self):
+        """Convert any items which have not been accessed yet"""
+        for i in range(len(self)):
+            self._item(i)
+
+    @property
+    def unconverted_count(self):
+        """Return the number of items still waiting to be converted"""
+        return sum(1 for val in list.__iter__(self)
+                   if val.__class__ is _Unconverted)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._item(j) for j in range(*i.indices(len(self)))]
+        return self._item(i)
+
+    if compat.in_py2:
+        # Python 2 slices with i:j through these, not __getitem__/__setitem__
+        def __getslice__(self, i, j):
+            return self.__getitem__(slice(max(0, i), max(0, j)))
+
+        def __setslice__(self, i, j, val):
+            self.__setitem__(slice(max(0, i), max(0, j)), val)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._item(i)
+
+    def __reversed__(self):
+        for i in range(len(self) - 1, -1, -1):
+            yield self._item(i)
+
+    def __contains__(self, val):
+        for item in self:
+            if item == val:
+                return True
+        return False
+
+    def __deepcopy__(self, memo):
+        # Unconverted items are shared; converted ones are rebuilt as usual
+        new = LazyMultiValue(self.type_constructor, [])
+        list.extend(new, [val if val.__class__ is _Unconverted
+                          else self.type_constructor(val)
+                          for val in list.__iter__(self)])
+        return new
+
+    def pop(self, i=-1):
+        val = self._item(i)
+        list.pop(self, i)
+        return val
+
+    def index(self, val, *args):
+        self._convert_all()
+        return list.index(self, val, *args)
+
+    def count(self, val):
+        self._convert_all()
+        return list.count(self, val)
+
+    def remove(self, val):
+        self._convert_all()
+        list.remove(self, val)
+
+    def sort(self, *args, **kwargs):
+        self._convert_all()
+        list.sort(self, *args, **kwargs)
+
+    def copy(self):
+        return list(self)
+
+    def __add__(self, other):
+        return list(self) + other
+
+    def __mul__(self, n):
+        return list(self) * n
+    __rmul__ = __mul__
+
+    def __eq__(self, other):
+        self._convert_all()
+        if isinstance(other, LazyMultiValue):
+            other._convert_all()
+        return list.__eq__(self, other)
+
+    def __ne__(self, other):
+        self._convert_all()
+        if isinstance(other, LazyMultiValue):
+            other._convert_all()
+        return list.__ne__(self, other)
+
+    def __lt__(self, other):
+        self._convert_all()
+        if isinstance(other, LazyMultiValue):
+            other._convert_all()
+        return list.__lt__(self, other)
+
+    def __le__(self, other):
+        self._convert_all()
+        if isinstance(other, LazyMultiValue):
+            other._convert_all()
+        return list.__le__(self, other)
+
+    def __gt__(self, other):
+        self._convert_all()
+        if isinstance(other, LazyMultiValue):
+            other._convert_all()
+        return list.__gt__(self, other)
+
+    def __ge__(self, other):
+        self._convert_all()
+        if isinstance(other, LazyMultiValue):
+            other._convert_all()
+        return list.__ge__(self, other)
+
+    __hash__ = None
+
+
+def multi_value(type_constructor, iterable):
+    """Return a MultiValue of the items in `iterable`.
+
+    If config.lazy_multivalue_conversion is True (and values are not being
+    validated on creation, see config.enforce_valid_values) then a
+    LazyMultiValue is returned, which converts items only when accessed.
+    """
+    if config.lazy_multivalue_conversion and not config.enforce_valid_values:
+        return LazyMultiValue(type_constructor, iterable)
+    return MultiValue(type_constructor, iterable)
@@ -0,0 +1,138 @@
+# rawtransforms.py
+"""A pipeline of functions applied to RawDataElements before conversion"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, released under a modified MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+from pydicom.tag import Tag
+
+
+class RawTransforms(object):
+    """A pipeline of raw transforms, each called with the RawDataElements
+    it applies to before they are converted to DataElements.
+
+    A transform is a function taking a RawDataElement (plus any keyword
+    arguments it was added with) and returning it, or a fixed copy made
+    with its ``_replace`` method. Each transform declares the VRs and/or
+    tags it applies to; they are kept in a table keyed by VR and tag, so
+    each element is dispatched with a lookup, and elements no transform
+    applies to are passed over without calling any.
+
+    The transforms used are those of ``pydicom.config.raw_transforms``,
+    unless other ones are given by the `raw_transforms` parameter of
+    ``read_file``.
+
+    Examples
+    --------
+    >>> def strip_nulls(raw_elem):
+    >>>     return raw_elem._replace(value=raw_elem.value.rstrip(b'\\0'))
+    >>> transforms = RawTransforms()
+    >>> transforms.add(strip_nulls, VRs=['LO', 'SH'])
+    >>> ds = pydicom.read_file("rtplan.dcm", raw_transforms=transforms)
+    """
+    def __init__(self):
+        self._transforms = []
+        self._build()
+
+    def add(self, transform, VRs=None, tags=None, **kwargs):
+        """Add `transform` to the end of the pipeline.
+
+        A transform is only in the pipeline once: adding one again replaces
+        its VRs, tags and keyword arguments, keeping its place.
+
+        Parameters
+        ----------
+        transform : callable
+            Called as ``transform(raw_elem, **kwargs)``, it must return the
+            RawDataElement to use in place of `raw_elem`.
+        VRs : list of str, optional
+            Only apply the transform to elements with these VRs. For
+            implicit VR elements the VR is looked up in the DICOM dictionary;
+            include None to also apply it to implicit VR elements that are
+            not in the dictionary (e.g. private elements).
+        tags : list, optional
+            Only apply the transform to elements with these tags (in any
+            form accepted by pydicom.tag.Tag). If both `VRs` and `tags` are
+            given, an element must match both. If neither is given, the
+            transform applies to every element.
+        kwargs
+            The keyword arguments to call `transform` with.
+        """
+        if VRs is not None:
+            VRs = frozenset(VRs)
+        if tags is not None:
+            tags = frozenset(Tag(tag) for tag in tags)
+        entry = (transform, VRs, tags, kwargs)
+        for index, (function, _, _, _) in enumerate(self._transforms):
+            if function is transform:
+                self._transforms[index] = entry
+                break
+        else:
+            self._transforms.append(entry)
+        self._build()
+
+    def remove(self, transform):
+        """Remove `transform` from the pipeline, if it is in it."""
+        self._transforms = [entry for entry in self._transforms
+                            if entry[0] is not transform]
+        self._build()
+
+    def clear(self):
+        """Remove all the transforms from the pipeline."""
+        self._transforms = []
+        self._build()
+
+    def __len__(self):
+        return len(self._transforms)
+
+    def __contains__(self, transform):
+        return any(entry[0] is transform for entry in self._transforms)
+
+    def _build(self):
+        """Precompute the dispatch tables of the transforms"""
+        # Transforms restricted to tags are looked up by tag (and VR, if
+        #   they are also restricted to VRs); all others by VR
+        self._tags = frozenset(tag for entry in self._transforms
+                               if entry[2] is not None for tag in entry[2])
+        self._by_VR = {}
+        self._by_tag_VR = {}
+        VRs = set(VR for entry in self._transforms if entry[1] is not None
+                  for VR in entry[1])
+        for VR in VRs:
+            self._by_VR[VR] = self._matching(None, VR)
+        self._any_VR = self._matching(None, object())
+        self._needs_VR = bool(VRs)
+
+    def _matching(self, tag, VR):
+        """Return the (transform, kwargs) which apply to `tag` and `VR`"""
+        return tuple((transform, kwargs)
+                     for transform, VRs, tags, kwargs in self._transforms
+                     if (VRs is None or VR in VRs) and
+                     (tags is None or tag in tags))
+
+    def __call__(self, raw_elem):
+        """Return `raw_elem` passed through the transforms which apply to it"""
+        tag = raw_elem.tag
+        VR = raw_elem.VR
+        if VR is None and self._needs_VR:
+            VR = _dictionary_VR(tag)
+        if tag in self._tags:
+            key = (tag, VR)
+            transforms = self._by_tag_VR.get(key)
+            if transforms is None:
+                transforms = self._by_tag_VR[key] = self._matching(tag, VR)
+        else:
+            transforms = self._by_VR.get(VR, self._any_VR)
+        for transform, kwargs in transforms:
+            raw_elem = transform(raw_elem, **kwargs)
+        return raw_elem
+
+
+def _dictionary_VR(tag):
+    """Return the dictionary VR of `tag`, or None if it isn't in it"""
+    from pydicom.datadict import dictionary_VR
+    try:
+        return dictionary_VR(tag)
+    except KeyError:
+        return None
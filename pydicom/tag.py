@@ -42,6 +42,10 @@ def Tag(arg, arg2=None):
     -------
     pydicom.tag.BaseTag
     """
+    # Already a tag (e.g. from the dictionary or a DataElement): no checks
+    if arg2 is None and isinstance(arg, BaseTag):
+        return arg
+
     if arg2 is not None:
         arg = (arg, arg2)  # act as if was passed a single tuple
 
@@ -89,8 +93,34 @@ if compat.in_py2:
     # In python 2.6, int is shorter and 0xFFFF << 16 gets converted to long,
     #   causing Overflow error in TupleTag
     BaseTag_base_class = long
+    _int_types = (int, long)
+
+    # long has no rich comparison methods in python 2, so compare its value
+    def _int_eq(tag, value):
+        return tag.real == value
+
+    def _int_lt(tag, value):
+        return tag.real < value
 else:
     BaseTag_base_class = int
+    _int_types = (int,)
+    _int_eq = int.__eq__
+    _int_lt = int.__lt__
+
+
+def _tag_value(other):
+    """Return `other` as an int tag value, or None if it is not an int or
+    (group, element) int tuple in range, so has to be checked by Tag()."""
+    other_type = type(other)
+    if other_type in _int_types:
+        if 0 <= other <= 0xFFFFFFFF:
+            return other
+    elif other_type is tuple and len(other) == 2:
+        group, elem = other
+        if (type(group) in _int_types and type(elem) in _int_types and
+                0 <= group <= 0xFFFF and 0 <= elem <= 0xFFFF):
+            return group << 16 | elem
+    return None
 
 
 class BaseTag(BaseTag_base_class):
@@ -116,6 +146,9 @@ class BaseTag(BaseTag_base_class):
         """Return True if `self` is less than `other`."""
         # Check if comparing with another Tag object; if not, create a temp one
         if not isinstance(other, BaseTag):
+            value = _tag_value(other)
+            if value is not None:
+                return _int_lt(self, value)
             try:
                 other = Tag(other)
             except:
@@ -133,16 +166,21 @@ class BaseTag(BaseTag_base_class):
     def __eq__(self, other):
         """Return True if `self` equals `other`."""
         # Check if comparing with another Tag object; if not, create a temp one
-        if not isinstance(other, BaseTag):
-            try:
-                other = Tag(other)
-            except:
-                raise TypeError("Cannot compare Tag with non-Tag item")
-        return BaseTag_base_class(self) == BaseTag_base_class(other)
+        #   unless `other` is a plain int or (group, element) tuple
+        if isinstance(other, BaseTag):
+            return _int_eq(self, other)
+        value = _tag_value(other)
+        if value is not None:
+            return _int_eq(self, value)
+        try:
+            other = Tag(other)
+        except:
+            raise TypeError("Cannot compare Tag with non-Tag item")
+        return _int_eq(self, other)
 
     def __ne__(self, other):
         """Return True if `self` does not equal `other`."""
-        return not (self == other)
+        return not self.__eq__(other)
 
     # For python 3, any override of __cmp__ or __eq__ immutable requires
     #   explicit redirect of hash function to the parent class
@@ -5,11 +5,13 @@
 #    See the file license.txt included with this distribution, also
 #    available at https://github.com/darcymason/pydicom
 
+from collections import OrderedDict
 import os
 import uuid
 import random
 import hashlib
 import re
+import weakref
 
 from pydicom._uid_dict import UID_dictionary
 from pydicom import compat
@@ -25,6 +27,27 @@ constraints.
 '''
 
 
+if compat.in_py2:
+    # str subclasses can't be weakly referenced in Python 2, so hold the
+    #   UIDs instead, limited to the _max_interned_uids most recently used
+    _interned_uids = OrderedDict()
+else:
+    _interned_uids = weakref.WeakValueDictionary()
+"""The UID instances currently in use, keyed by their value."""
+
+_max_interned_uids = 100000
+"""The number of UIDs interned in Python 2, where they are never freed."""
+
+_uids_for_name = {}
+"""The UID values in UID_dictionary, keyed by UID name. Some names (e.g. of
+retired SOP classes) are shared by more than one UID."""
+for _uid, _entry in UID_dictionary.items():
+    _uids_for_name.setdefault(_entry[0], set()).add(_uid)
+_uids_for_name = dict((_name, frozenset(_uids))
+                      for _name, _uids in _uids_for_name.items())
+del _uid, _entry
+
+
 class InvalidUID(Exception):
     '''
     Throw when DICOM UID is invalid
@@ -51,7 +74,16 @@ class UID(str):
 
     String representation (__str__) will be the name,
     __repr__ will be the full 1.2.840....
+
+    UIDs are interned: creating a UID with the same value as one that
+    already exists returns the existing instance, so the same Study or
+    Series Instance UID read from many files is only held in memory once.
+    The dictionary values are looked up when used rather than stored on
+    each instance.
     """
+    # Python 2 doesn't allow a __weakref__ slot on str subclasses
+    __slots__ = () if compat.in_py2 else ('__weakref__',)
+
     def __new__(cls, val):
         """Set up new instance of the class"""
         # Don't repeat if already a UID class -- then may get the name
@@ -60,49 +92,90 @@ class UID(str):
             return val
         else:
             if isinstance(val, compat.string_types):
-                return super(UID, cls).__new__(cls, val.strip())
+                val = val.strip()
+                if cls is not UID:
+                    return super(UID, cls).__new__(cls, val)
+                uid = _interned_uids.get(val)
+                if uid is None:
+                    uid = super(UID, cls).__new__(cls, val)
+                    if compat.in_py2 and \
+                            len(_interned_uids) >= _max_interned_uids:
+                        # The least recently used
+                        _interned_uids.popitem(last=False)
+                    _interned_uids[val] = uid
+                elif compat.in_py2:
+                    # Now the most recently used
+                    del _interned_uids[val]
+                    _interned_uids[val] = uid
+                return uid
             else:
                 raise TypeError("UID must be a string")
 
-    def __init__(self, val):
-        """Initialize the UID properties
+    def __reduce__(self):
+        return (self.__class__, (str.__str__(self),))
 
-        Sets name, type, info, is_retired, and is_transfer_syntax.
-        If UID is a transfer syntax, also sets is_little_endian,
-            is_implicit_VR, and is_deflated boolean values.
-        """
-        # Note normally use __new__ on subclassing an immutable, but here we
-        #   just want to do some pre-processing against the UID dictionary.
-        #   "My" string can never change (it is a python immutable), so is safe
-        if self in UID_dictionary:
-            self.name, self.type, self.info, retired = UID_dictionary[self]
-            self.is_retired = bool(retired)
-        else:
-            self.name = str.__str__(self)
-            self.type, self.info, self.is_retired = (None, None, None)
-
-        # If the UID represents a transfer syntax, store info about that syntax
-        self.is_transfer_syntax = (self.type == "Transfer Syntax")
-        if self.is_transfer_syntax:
-            # Assume a transfer syntax, correct it as necessary
-            self.is_implicit_VR = True
-            self.is_little_endian = True
-            self.is_deflated = False
-
-            if val == '1.2.840.10008.1.2':  # implicit VR little endian
-                pass
-            elif val == '1.2.840.10008.1.2.1':  # ExplicitVRLittleEndian
-                self.is_implicit_VR = False
-            elif val == '1.2.840.10008.1.2.2':  # ExplicitVRBigEndian
-                self.is_implicit_VR = False
-                self.is_little_endian = False
-            elif val == '1.2.840.10008.1.2.1.99':  # DeflatedExplicitVRLittleEndian:
-                self.is_deflated = True
-                self.is_implicit_VR = False
-            else:
-                # Any other syntax should be Explicit VR Little Endian,
-                #   e.g. all Encapsulated (JPEG etc) are ExplVR-LE by Standard PS 3.5-2008 A.4 (p63)
-                self.is_implicit_VR = False
+    def _dictionary_value(self, index, default=None):
+        """Return the UID_dictionary value at `index` for the UID."""
+        try:
+            return UID_dictionary[self][index]
+        except KeyError:
+            return default
+
+    @property
+    def name(self):
+        """The UID's name from the UID dictionary, or the UID itself."""
+        return self._dictionary_value(0, str.__str__(self))
+
+    @property
+    def type(self):
+        """The UID's type from the UID dictionary, or None."""
+        return self._dictionary_value(1)
+
+    @property
+    def info(self):
+        """The UID's info from the UID dictionary, or None."""
+        return self._dictionary_value(2)
+
+    @property
+    def is_retired(self):
+        """The UID's retired status from the UID dictionary, or None."""
+        retired = self._dictionary_value(3)
+        if retired is None:
+            return None
+        return bool(retired)
+
+    @property
+    def is_transfer_syntax(self):
+        """Return True if the UID is a transfer syntax."""
+        return self.type == "Transfer Syntax"
+
+    def _transfer_syntax_property(self, name):
+        """Raise AttributeError unless the UID is a transfer syntax."""
+        if not self.is_transfer_syntax:
+            raise AttributeError("'{0}' is not a transfer syntax UID, so has "
+                                 "no attribute '{1}'".format(
+                                     str.__str__(self), name))
+
+    @property
+    def is_implicit_VR(self):
+        """For a transfer syntax, return True if it uses implicit VR."""
+        self._transfer_syntax_property('is_implicit_VR')
+        return str.__eq__(self, '1.2.840.10008.1.2')  # implicit VR LE
+
+    @property
+    def is_little_endian(self):
+        """For a transfer syntax, return True if it is little endian."""
+        # Any syntax other than Explicit VR Big Endian is little endian,
+        #   e.g. all Encapsulated (JPEG etc) are ExplVR-LE by Standard
+        #   PS 3.5-2008 A.4 (p63)
+        self._transfer_syntax_property('is_little_endian')
+        return not str.__eq__(self, '1.2.840.10008.1.2.2')
+
+    @property
+    def is_deflated(self):
+        """For a transfer syntax, return True if it is deflated."""
+        self._transfer_syntax_property('is_deflated')
+        return str.__eq__(self, '1.2.840.10008.1.2.1.99')
 
     def __str__(self):
         """Return the human-friendly name for this UID"""
@@ -112,10 +185,23 @@ class UID(str):
         """Override string equality so either name or UID number match passes"""
         if str.__eq__(self, other) is True:  # 'is True' needed (issue 96)
             return True
-        if str.__eq__(self.name, other) is True:  # 'is True' needed (issue 96)
-            return True
+        if isinstance(other, compat.string_types):
+            return self in _uids_for_name.get(other, ())
         return False
 
+    def matches(self, name_or_uid):
+        """Return True if `name_or_uid` is either this UID or its name.
+
+        Unlike ==, this states explicitly that a name is acceptable.
+
+        Parameters
+        ----------
+        name_or_uid : str
+            A UID such as '1.2.840.10008.1.2' or a UID name such as
+            'Implicit VR Little Endian'.
+        """
+        return self == name_or_uid
+
     def __ne__(self, other):
         return not self == other
 
@@ -147,9 +233,33 @@ class UID(str):
     # For python 3, any override of __cmp__ or __eq__ immutable requires
     #   explicit redirect of hash function to the parent class
     #   See http://docs.python.org/dev/3.0/reference/datamodel.html#object.__hash__
+    __hash__ = str.__hash__
+
+
+class UIDSet(frozenset):
+    """An immutable set of UIDs whose membership test accepts UID names.
+
+    Membership is a hash lookup by UID value, then by UID name, rather than
+    a comparison against every UID in a list:
+        >>> ExplicitVRBigEndian in UncompressedPixelTransferSyntaxSet
+        True
+        >>> 'Explicit VR Big Endian' in UncompressedPixelTransferSyntaxSet
+        True
+    """
+    __slots__ = ()
+
+    def __contains__(self, name_or_uid):
+        try:
+            if frozenset.__contains__(self, name_or_uid):
+                return True
+            uids = _uids_for_name.get(name_or_uid, ())
+        except TypeError:  # unhashable
+            return False
+        for uid in uids:
+            if frozenset.__contains__(self, uid):
+                return True
+        return False
 
-    def __hash__(self):
-        return super(UID, self).__hash__()
 
 ExplicitVRLittleEndian = UID('1.2.840.10008.1.2.1')
 ImplicitVRLittleEndian = UID('1.2.840.10008.1.2')
@@ -185,6 +295,20 @@ NotCompressedPixelTransferSyntaxes = [ExplicitVRLittleEndian,
                                       DeflatedExplicitVRLittleEndian,
                                       ExplicitVRBigEndian]
 
+# The same transfer syntaxes as UIDSets, for fast membership tests
+UncompressedPixelTransferSyntaxSet = UIDSet(
+    UncompressedPixelTransferSyntaxes)
+JPEGLSSupportedCompressedPixelTransferSyntaxSet = UIDSet(
+    JPEGLSSupportedCompressedPixelTransferSyntaxes)
+PILSupportedCompressedPixelTransferSyntaxSet = UIDSet(
+    PILSupportedCompressedPixelTransferSyntaxes)
+JPEG2000CompressedPixelTransferSyntaxSet = UIDSet(
+    JPEG2000CompressedPixelTransferSyntaxes)
+JPEGLossyCompressedPixelTransferSyntaxSet = UIDSet(
+    JPEGLossyCompressedPixelTransferSyntaxes)
+NotCompressedPixelTransferSyntaxSet = UIDSet(
+    NotCompressedPixelTransferSyntaxes)
+
 # Many thanks to the Medical Connections for offering free valid UIDs (http://www.medicalconnections.co.uk/FreeUID.html)
 # Their service was used to obtain the following root UID for pydicom:
 pydicom_root_UID = '1.2.826.0.1.3680043.8.498.'
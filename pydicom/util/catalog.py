@@ -0,0 +1,297 @@
+# catalog.py
+"""Keep a catalog of the DICOM files in a directory tree in SQLite"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, released under a modified MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+from functools import partial
+from itertools import islice
+import os
+import os.path
+import sqlite3
+
+from pydicom import compat
+from pydicom.config import logger
+from pydicom.datadict import keyword_for_tag, tag_for_keyword
+from pydicom.errors import InvalidDicomError
+from pydicom.filereader import read_file, read_partial
+from pydicom.tag import Tag
+from pydicom.uid import DeflatedExplicitVRLittleEndian
+from pydicom.util.extract import _plain_value
+from pydicom.valuerep import extra_length_VRs
+
+# The keys of the Patient/Study/Series/Instance hierarchy, always catalogued
+key_tags = [Tag(0x00100020), Tag(0x0020000D), Tag(0x0020000E),
+            Tag(0x00080018)]
+pixel_data_tag = Tag(0x7FE00010)
+
+# Number of files read and committed to the database at a time
+batch_size = 1000
+
+
+def _column_name(tag):
+    """Return the catalog column name for `tag`: its keyword if it has one"""
+    return keyword_for_tag(tag) or "x{0:08x}".format(tag)
+
+
+def _column_value(value):
+    """Return an element value as a value SQLite can store"""
+    value = _plain_value(value)
+    if isinstance(value, list):
+        return "\\".join(compat.text_type(val) for val in value)
+    return value
+
+
+def _read_row(tags, path):
+    """Return the offset of the Pixel Data value and the values of `tags`
+    in the file `path`, or (None, None) if it isn't a readable DICOM file.
+    """
+    found = []
+
+    def at_pixel_data(tag, VR, length):
+        if tag == pixel_data_tag:
+            found.append(VR)
+            return True
+        return False
+
+    try:
+        with open(path, 'rb') as fp:
+            ds = read_partial(fp, stop_when=at_pixel_data,
+                              specific_tags=tags + [pixel_data_tag])
+            offset = None
+            transfer_syntax = ds.file_meta.get('TransferSyntaxUID')
+            if found and transfer_syntax != DeflatedExplicitVRLittleEndian:
+                # Reading stopped at the start of the Pixel Data element
+                VR = found[0]
+                header_length = 8
+                if VR is not None and VR in extra_length_VRs:
+                    header_length = 12
+                offset = fp.tell() + header_length
+    except (InvalidDicomError, IOError, OSError, EOFError) as details:
+        logger.warning("Could not read '{0}': {1}".format(path, details))
+        return None, None
+    values = []
+    for tag in tags:
+        try:
+            values.append(_column_value(ds[tag].value))
+        except KeyError:
+            values.append(None)
+    return offset, values
+
+
+class Catalog(object):
+    """A catalog of DICOM files, stored in an SQLite database.
+
+    The catalog has a row for each file, with its path, size, modification
+    time and the file offset of its Pixel Data value, the Patient ID and the
+    Study, Series and SOP Instance UIDs, and the values of the other `tags`
+    it was created with. Files which are not DICOM are kept with empty
+    values so that they aren't read again.
+
+    Examples
+    --------
+    >>> with Catalog("archive.db", tags=["Modality", "StudyDate"]) as catalog:
+    >>>     catalog.update(["/archive"], workers=8)
+    >>>     for ds in catalog.datasets(PatientID="12345", Modality="CT"):
+    >>>         print(ds.SeriesDescription)
+    """
+    def __init__(self, filename, tags=()):
+        """Open (or create) the catalog in the database file `filename`.
+
+        Parameters
+        ----------
+        filename : str
+            The SQLite database file.
+        tags : list
+            The tags (in any form accepted by pydicom.tag.Tag) or keywords
+            of the elements to catalog as well as the keys. If tags are
+            added to an existing catalog, all its files are read again by
+            the next update().
+        """
+        self.tags = list(key_tags)
+        for tag in tags:
+            if isinstance(tag, compat.string_types):
+                keyword_tag = tag_for_keyword(tag)
+                if keyword_tag is None:
+                    raise ValueError("'{0}' is not a DICOM element "
+                                     "keyword".format(tag))
+                tag = keyword_tag
+            tag = Tag(tag)
+            if tag not in self.tags:
+                self.tags.append(tag)
+        self.columns = [_column_name(tag) for tag in self.tags]
+
+        self.connection = sqlite3.connect(filename)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, "
+            "size INTEGER, mtime REAL, pixel_data_offset INTEGER)")
+        existing = set(row[1] for row in
+                       self.connection.execute("PRAGMA table_info(files)"))
+        new_columns = [column for column in self.columns
+                       if column not in existing]
+        for column in new_columns:
+            self.connection.execute(
+                'ALTER TABLE files ADD COLUMN "{0}"'.format(column))
+        if new_columns and len(existing) > 4:
+            # Existing rows don't have the new values, so read them again
+            self.connection.execute("UPDATE files SET size = NULL")
+        for column in self.columns[:len(key_tags)]:
+            self.connection.execute(
+                'CREATE INDEX IF NOT EXISTS "files_{0}" ON files '
+                '("{0}")'.format(column))
+        self.connection.commit()
+
+    def close(self):
+        """Close the database"""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _changed_files(self, directories, seen):
+        """Yield (path, size, mtime) of the files in `directories` which are
+        new or have changed since they were catalogued, and add the path of
+        every file found to the set `seen`."""
+        catalogued = self.connection.cursor()
+        for directory in directories:
+            for dirpath, dirnames, filenames in os.walk(directory):
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    seen.add(path)
+                    rows = catalogued.execute(
+                        "SELECT size, mtime FROM files WHERE path = ?",
+                        (path,)).fetchall()
+                    if rows != [(stat.st_size, stat.st_mtime)]:
+                        yield path, stat.st_size, stat.st_mtime
+
+    def _remove_missing(self, directories, seen):
+        """Remove the rows of files in `directories` which weren't `seen`"""
+        for directory in directories:
+            prefix = os.path.join(directory, '')
+            rows = self.connection.execute(
+                "SELECT path FROM files WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix)).fetchall()
+            missing = [(row[0],) for row in rows if row[0] not in seen]
+            self.connection.executemany("DELETE FROM files WHERE path = ?",
+                                        missing)
+        self.connection.commit()
+
+    def update(self, directories, workers=1):
+        """Catalog the files in `directories` and their subdirectories.
+
+        Only new files and files whose size or modification time have
+        changed are read; the rows of files which no longer exist are
+        removed.
+
+        Parameters
+        ----------
+        directories : list of str
+            The directories to catalog.
+        workers : int
+            The number of processes to read the files with. If 1 (default),
+            the files are read in the calling process. See
+            ``pydicom.util.extract.extract_table`` for a note on Windows.
+
+        Returns
+        -------
+        int
+            The number of files read.
+        """
+        directories = [os.path.abspath(directory)
+                       for directory in directories]
+        seen = set()
+        changed = self._changed_files(directories, seen)
+        read_row = partial(_read_row, self.tags)
+        columns = ", ".join('"{0}"'.format(column)
+                            for column in self.columns)
+        insert = ("INSERT OR REPLACE INTO files (path, size, mtime, "
+                  "pixel_data_offset, {0}) VALUES (?, ?, ?, ?, {1})".format(
+                      columns, ", ".join("?" * len(self.columns))))
+        pool = None
+        if workers > 1:
+            import multiprocessing
+            pool = multiprocessing.Pool(workers)
+            read_rows = partial(pool.map, read_row)
+        else:
+            read_rows = partial(map, read_row)
+        read_count = 0
+        try:
+            while True:
+                batch = list(islice(changed, batch_size))
+                if not batch:
+                    break
+                rows = read_rows([path for path, size, mtime in batch])
+                records = []
+                for (path, size, mtime), (offset, values) in zip(batch, rows):
+                    if values is None:
+                        values = [None] * len(self.columns)
+                    records.append([path, size, mtime, offset] + values)
+                self.connection.executemany(insert, records)
+                self.connection.commit()
+                read_count += len(batch)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+        self._remove_missing(directories, seen)
+        return read_count
+
+    def _where(self, criteria):
+        """Return the SQL WHERE clause and its parameters for `criteria`"""
+        clauses = ['"SOPInstanceUID" IS NOT NULL']
+        parameters = []
+        for keyword, value in sorted(criteria.items()):
+            if keyword not in self.columns:
+                raise ValueError("'{0}' is not a catalogued "
+                                 "element".format(keyword))
+            clauses.append('"{0}" = ?'.format(keyword))
+            parameters.append(_column_value(value))
+        return " AND ".join(clauses), parameters
+
+    def paths(self, **criteria):
+        """Return the paths of the catalogued DICOM files matching `criteria`.
+
+        Parameters
+        ----------
+        criteria
+            Catalogued element keywords and the values to match, e.g.
+            ``StudyInstanceUID="1.2.3"``. Multi-valued elements are stored
+            with backslash separated values.
+
+        Returns
+        -------
+        list of str
+            The matching paths, in sorted order.
+        """
+        where, parameters = self._where(criteria)
+        rows = self.connection.execute(
+            "SELECT path FROM files WHERE {0} ORDER BY path".format(where),
+            parameters)
+        return [row[0] for row in rows]
+
+    def datasets(self, stop_before_pixels=False, **criteria):
+        """Yield a FileDataset read from each catalogued DICOM file matching
+        `criteria`.
+
+        Parameters
+        ----------
+        stop_before_pixels : bool
+            See ``read_file`` for parameter info.
+        criteria
+            See ``paths``.
+
+        Yields
+        ------
+        pydicom.dataset.FileDataset
+            The datasets of the files, in order of their paths.
+        """
+        for path in self.paths(**criteria):
+            yield read_file(path, stop_before_pixels=stop_before_pixels)
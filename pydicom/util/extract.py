@@ -0,0 +1,232 @@
+# extract.py
+"""Extract a table of element values from many DICOM files"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, released under a modified MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+from collections import OrderedDict
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+
+from pydicom import compat
+from pydicom.config import logger
+from pydicom.datadict import get_entry, keyword_for_tag, tag_for_keyword
+from pydicom.filereader import read_file
+from pydicom.tag import Tag
+
+have_numpy = True
+try:
+    import numpy
+except ImportError:
+    have_numpy = False
+
+if compat.in_py2:
+    _int_types = (int, long)
+else:
+    _int_types = (int,)
+
+# numpy dtypes of the columns for elements with numeric VRs;
+#   elements with any other VR get object columns
+numeric_VR_dtypes = {
+    'US': 'uint16',
+    'SS': 'int16',
+    'US or SS': 'int32',
+    'UL': 'uint32',
+    'SL': 'int32',
+    'FL': 'float32',
+    'FD': 'float64',
+    'IS': 'int64',
+    'DS': 'float64',
+}
+
+
+def _plain_value(value):
+    """Return an element value as a plain python int, float, str or bytes
+    (or a list of them), which is cheap to pass between processes."""
+    if isinstance(value, (list, tuple)):
+        return [_plain_value(val) for val in value]
+    if isinstance(value, _int_types):
+        return int(value)
+    if isinstance(value, (float, Decimal)):
+        return float(value)
+    if isinstance(value, bytes) and not compat.in_py2:
+        return bytes(value)
+    if isinstance(value, compat.string_types):
+        # A plain copy, as str() of e.g. a UID gives its name
+        return value[:]
+    return compat.text_type(value)
+
+
+def _read_values(tags, read_tags, path):
+    """Return a list of the values of `tags` in the file `path`, with None
+    for the missing ones, or None if the file can't be read.
+
+    `read_tags` are the tags to read, which include any other elements
+    needed to decode those of `tags` with ambiguous VRs.
+    """
+    try:
+        ds = read_file(path, specific_tags=read_tags)
+        return [_plain_value(ds[tag].value) if tag in ds else None
+                for tag in tags]
+    except Exception as details:
+        # Not only InvalidDicomError and IO errors: a malformed element may
+        #   raise anything, and must not fail the other files of the batch
+        logger.warning("Could not read '{0}': {1}".format(path, details))
+        return None
+
+
+def _column(values, VR, VM):
+    """Return a numpy masked array of the values of one column.
+
+    Elements with a numeric VR and a fixed value multiplicity get a numeric
+    array, two-dimensional if the multiplicity is more than one. Values
+    which are missing, empty or don't fit the column are masked. Any other
+    elements, including those with a variable multiplicity such as '1-n',
+    get an array of objects, with only missing values masked.
+    """
+    dtype = numeric_VR_dtypes.get(VR)
+    if dtype is None or not VM.isdigit():
+        data = numpy.empty(len(values), dtype=object)
+        mask = numpy.ones(len(values), dtype=bool)
+        for i, value in enumerate(values):
+            if value is not None:
+                data[i] = value
+                mask[i] = False
+        return numpy.ma.MaskedArray(data, mask=mask)
+
+    multiplicity = int(VM)
+    shape = (len(values), multiplicity) if multiplicity > 1 else len(values)
+    data = numpy.zeros(shape, dtype=dtype)
+    mask = numpy.ones(shape, dtype=bool)
+    for i, value in enumerate(values):
+        if value is None or value == '':
+            continue
+        if multiplicity > 1 and (not isinstance(value, list) or
+                                 len(value) != multiplicity):
+            continue
+        try:
+            data[i] = value
+        except (TypeError, ValueError, OverflowError):
+            continue
+        mask[i] = False
+    return numpy.ma.MaskedArray(data, mask=mask)
+
+
+def _columns(rows, names, entries):
+    """Return an OrderedDict of the columns of a batch of `rows`."""
+    rows = [row if row is not None else [None] * len(names) for row in rows]
+    columns = OrderedDict()
+    for index, (name, entry) in enumerate(zip(names, entries)):
+        values = [row[index] for row in rows]
+        if have_numpy:
+            VR, VM = entry[:2] if entry else (None, '1')
+            values = _column(values, VR, VM)
+        columns[name] = values
+    return columns
+
+
+def extract_table(paths, tags, workers=1, batch_size=1000):
+    """Read the values of `tags` from each of the DICOM files `paths`, and
+    yield them in batches of table columns.
+
+    Only the requested elements are read from each file (see the
+    `specific_tags` parameter of ``read_file``), so no full Dataset is built
+    for any file, and only two batches are held in memory at a time.
+
+    Parameters
+    ----------
+    paths : iterable of str
+        The file names to read, which may be a generator.
+    tags : list
+        The elements to extract, as tags in any form accepted by
+        pydicom.tag.Tag or as element keywords.
+    workers : int
+        The number of processes to read the files with. If 1 (default), the
+        files are read in the calling process. Note that on Windows, a
+        script using more than one worker must only call extract_table from
+        within an ``if __name__ == "__main__":`` block.
+    batch_size : int
+        The number of files in each batch (default 1000).
+
+    Yields
+    ------
+    collections.OrderedDict
+        For each batch of files, in the order of `paths`, the column of
+        values of each of `tags`, keyed by the element keyword (or the tag
+        for elements that don't have one). If numpy is available each column
+        is a numpy masked array: of the numeric type of the VR (two
+        dimensional for a fixed multiplicity of more than one, e.g. Pixel
+        Spacing) for numeric VRs with a fixed multiplicity, otherwise of
+        objects (e.g. for Window Center, of VM 1-n); missing or invalid
+        values are masked. Without numpy, each column is a list of values,
+        with None for missing values. All the values of a file that can't
+        be read are missing.
+
+    Raises
+    ------
+    ValueError
+        If a tag is a keyword that is not in the DICOM dictionary, or is
+        for a sequence.
+
+    Examples
+    --------
+    >>> import glob
+    >>> import pandas
+    >>> paths = glob.glob("/data/**/*.dcm", recursive=True)
+    >>> tags = ["PatientID", "StudyDate", "SliceThickness", "PixelSpacing"]
+    >>> frames = [pandas.DataFrame({name: column.tolist()
+    ...                             for name, column in batch.items()})
+    ...           for batch in extract_table(paths, tags, workers=8)]
+    """
+    tag_list = []
+    for tag in tags:
+        if isinstance(tag, compat.string_types):
+            keyword_tag = tag_for_keyword(tag)
+            if keyword_tag is None:
+                raise ValueError("'{0}' is not a DICOM element "
+                                 "keyword".format(tag))
+            tag = keyword_tag
+        tag_list.append(Tag(tag))
+    names = [keyword_for_tag(tag) or tag for tag in tag_list]
+    entries = []
+    for tag in tag_list:
+        try:
+            entry = get_entry(tag)
+        except KeyError:
+            entry = None
+        if entry and entry[0] == 'SQ':
+            raise ValueError("Sequence elements such as {0} can't be "
+                             "extracted as a column".format(tag))
+        entries.append(entry)
+    read_tags = list(tag_list)
+    if any(entry and ' or ' in entry[0] for entry in entries):
+        # The VRs of 'US or SS' elements depend on Pixel Representation
+        read_tags.append(Tag(0x00280103))
+
+    read_values = partial(_read_values, tag_list, read_tags)
+    paths = iter(paths)
+    pool = None
+    if workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(workers)
+    try:
+        batch = list(islice(paths, batch_size))
+        if pool is not None:
+            pending = pool.map_async(read_values, batch)
+        while batch:
+            if pool is not None:
+                rows = pending.get()
+                # Read the next batch while the caller uses this one
+                batch = list(islice(paths, batch_size))
+                if batch:
+                    pending = pool.map_async(read_values, batch)
+            else:
+                rows = [read_values(path) for path in batch]
+                batch = list(islice(paths, batch_size))
+            yield _columns(rows, names, entries)
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
@@ -11,8 +11,21 @@ from pydicom import datadict
 from pydicom import values
 
 
+def _replace_separator(raw_elem, invalid_separator):
+    """The raw transform added by fix_separator"""
+    # Note value has not been decoded yet when this function called,
+    #    so need to replace backslash as bytes
+    if not raw_elem.value:  # e.g. empty or deferred read
+        return raw_elem
+    new_value = raw_elem.value.replace(invalid_separator, b"\\")
+    return raw_elem._replace(value=new_value)
+
+
 def fix_separator_callback(raw_elem, **kwargs):
-    """Used by fix_separator as the callback function from read_dataset
+    """A data_element_callback doing the replacement of fix_separator.
+
+    fix_separator itself adds a raw transform instead, which is only called
+    for the elements with the VRs it applies to.
     """
     return_val = raw_elem
     try_replace = False
@@ -23,24 +36,22 @@ def fix_separator_callback(raw_elem, **kwargs):
             VR = datadict.dictionary_VR(raw_elem.tag)
         # Not in the dictionary, process if flag says to do so
         except KeyError:
-            try_replace = kwargs['process_unkown_VR']
+            try_replace = kwargs.get('process_unknown_VRs', True)
         else:
             try_replace = VR in kwargs['for_VRs']
     else:
         try_replace = raw_elem.VR in kwargs['for_VRs']
 
     if try_replace:
-        # Note value has not been decoded yet when this function called,
-        #    so need to replace backslash as bytes
-        new_value = raw_elem.value.replace(kwargs['invalid_separator'], b"\\")
-        return_val = raw_elem._replace(value=new_value)
+        return_val = _replace_separator(raw_elem,
+                                        kwargs['invalid_separator'])
 
     return return_val
 
 
 def fix_separator(invalid_separator, for_VRs=["DS", "IS"],
-                  process_unknown_VRs=True):
-    """A callback function to fix RawDataElement values using
+                  process_unknown_VRs=True, transforms=None):
+    """Add a raw transform to fix RawDataElement values using
     some other separator than the dicom standard backslash character
 
     Parameters
@@ -54,17 +65,22 @@ def fix_separator(invalid_separator, for_VRs=["DS", "IS"],
         then process_unknown_VR is used to determine whether to replace or not.
     process_unknown_VRs: boolean, optional
         If True (default) then attempt the fix even if the VR is not known.
+    transforms : pydicom.rawtransforms.RawTransforms, optional
+        The pipeline to add the transform to, e.g. to pass to ``read_file``.
+        Default is config.raw_transforms, used for all reads.
 
     Returns
     -------
-    No return value.  However, the callback function will return either
+    No return value.  However, the transform will return either
     the original RawDataElement instance, or a fixed one.
     """
-    config.data_element_callback = fix_separator_callback
-    config.data_element_callback_kwargs = {
-        'invalid_separator': invalid_separator,
-        'for_VRs': for_VRs
-    }
+    if transforms is None:
+        transforms = config.raw_transforms
+    VRs = list(for_VRs)
+    if process_unknown_VRs:
+        VRs.append(None)
+    transforms.add(_replace_separator, VRs=VRs,
+                   invalid_separator=invalid_separator)
 
 
 def fix_mismatch_callback(raw_elem, **kwargs):
@@ -81,8 +97,8 @@ def fix_mismatch_callback(raw_elem, **kwargs):
     return raw_elem
 
 
-def fix_mismatch(with_VRs=['PN', 'DS', 'IS']):
-    """A callback function to check that RawDataElements are translatable
+def fix_mismatch(with_VRs=['PN', 'DS', 'IS'], for_VRs=None, transforms=None):
+    """Add a raw transform to check that RawDataElements are translatable
     with their provided VRs.  If not, re-attempt translation using
     some other translators.
 
@@ -91,13 +107,18 @@ def fix_mismatch(with_VRs=['PN', 'DS', 'IS']):
     with_VRs : list, [['PN', 'DS', 'IS']]
         A list of VR strings to attempt if the raw data element value cannot
         be translated with the raw data element's VR.
+    for_VRs : list, optional
+        Only check elements with these VRs, e.g. the VRs that are known to
+        be wrong in the files. Default is to check every element.
+    transforms : pydicom.rawtransforms.RawTransforms, optional
+        The pipeline to add the transform to, e.g. to pass to ``read_file``.
+        Default is config.raw_transforms, used for all reads.
 
     Returns
     -------
-    No return value.  The callback function will return either
+    No return value.  The transform will return either
     the original RawDataElement instance, or one with a fixed VR.
     """
-    config.data_element_callback = fix_mismatch_callback
-    config.data_element_callback_kwargs = {
-        'with_VRs': with_VRs,
-    }
+    if transforms is None:
+        transforms = config.raw_transforms
+    transforms.add(fix_mismatch_callback, VRs=for_VRs, with_VRs=with_VRs)
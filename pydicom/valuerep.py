@@ -9,7 +9,7 @@ from decimal import Decimal
 
 from pydicom import config  # don't import datetime_conversion directly
 from pydicom import compat
-from pydicom.multival import MultiValue
+from pydicom.multival import multi_value
 
 from datetime import date, datetime, time
 
@@ -508,7 +508,7 @@ def MultiString(val, valtype=str):
         val = splitup[0]
         return valtype(val) if val else val
     else:
-        return MultiValue(valtype, splitup)
+        return multi_value(valtype, splitup)
 
 
 class PersonName3(object):
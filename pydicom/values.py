@@ -19,7 +19,7 @@ if not in_py2:
 else:
     from pydicom.valuerep import PersonName  # NOQA
 
-from pydicom.multival import MultiValue
+from pydicom.multival import MultiValue, multi_value
 import pydicom.uid
 from pydicom.tag import Tag, TupleTag
 from pydicom.filereader import read_sequence
@@ -77,7 +77,7 @@ def convert_DA_string(byte_string, is_little_endian, struct_format=None):
         if len(splitup) == 1:
             return _DA_from_byte_string(splitup[0])
         else:
-            return MultiValue(_DA_from_byte_string, splitup)
+            return multi_value(_DA_from_byte_string, splitup)
     else:
         return convert_string(byte_string, is_little_endian, struct_format)
 
@@ -108,7 +108,7 @@ def convert_DT_string(byte_string, is_little_endian, struct_format=None):
         if len(splitup) == 1:
             return _DT_from_byte_string(splitup[0])
         else:
-            return MultiValue(_DT_from_byte_string, splitup)
+            return multi_value(_DT_from_byte_string, splitup)
     else:
         return convert_string(byte_string, is_little_endian, struct_format)
 
@@ -199,7 +199,7 @@ def convert_PN(byte_string, is_little_endian, struct_format=None, encoding=None)
     if len(splitup) == 1:
         return valtype(splitup[0])
     else:
-        return MultiValue(valtype, splitup)
+        return multi_value(valtype, splitup)
 
 
 def convert_string(byte_string, is_little_endian, struct_format=None, encoding=default_encoding):
@@ -245,7 +245,7 @@ def convert_TM_string(byte_string, is_little_endian, struct_format=None):
         if len(splitup) == 1:
             return _TM_from_byte_string(splitup[0])
         else:
-            return MultiValue(_TM_from_byte_string, splitup)
+            return multi_value(_TM_from_byte_string, splitup)
     else:
         return convert_string(byte_string, is_little_endian, struct_format)
 
@@ -312,6 +312,8 @@ def convert_value(VR, raw_data_element, encoding=default_encoding):
         else:
             value = convert_SQ(byte_string, is_implicit_VR, is_little_endian,
                                encoding, raw_data_element.value_tell)
+            if raw_data_element.length == 0xFFFFFFFF:
+                value.is_undefined_length = True
     except ValueError:
         if config.enforce_valid_values:
             # The user really wants an exception here
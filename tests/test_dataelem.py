@@ -7,6 +7,7 @@
 
 # Many tests of DataElement class are implied in test_dataset also
 
+import pickle
 import unittest
 
 from pydicom.dataelem import DataElement
@@ -196,6 +197,36 @@ class DataElementTests(unittest.TestCase):
         elem = DataElement(0x60023000, 'OB', b'\x00')
         self.assertTrue('Overlay Data' in elem.__str__())
 
+    def test_slots(self):
+        """DataElement: no per-instance __dict__..........................."""
+        elem = DataElement(0x00100010, 'PN', 'ANON')
+        self.assertFalse(hasattr(elem, '__dict__'))
+        self.assertFalse(hasattr(elem, 'private_creator'))
+        self.assertRaises(AttributeError, setattr, elem, 'unknown', 1)
+
+    def test_display_options(self):
+        """DataElement: display options set per element, with defaults....."""
+        elem = DataElement(0x00100010, 'PN', 'ANON')
+        elem.showVR = False
+        elem.descripWidth = 5
+        self.assertEqual("(0010, 0010) Patie 'ANON'", str(elem))
+        self.assertTrue(DataElement.showVR)
+        self.assertEqual(35, DataElement.descripWidth)
+        other = DataElement(0x00100010, 'PN', 'ANON')
+        self.assertTrue(other.showVR)
+        del elem.showVR
+        self.assertTrue(elem.showVR)
+
+    def test_pickling(self):
+        """DataElement: pickled element is read back properly.............."""
+        elem = DataElement(0x00091001, 'LO', 'Value', file_value_tell=12)
+        elem.private_creator = 'Creator'
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            elem2 = pickle.loads(pickle.dumps(elem, protocol))
+            self.assertEqual(elem, elem2)
+            self.assertEqual(12, elem2.file_tell)
+            self.assertEqual('Creator', elem2.private_creator)
+
 
 class RawDataElementTests(unittest.TestCase):
     def setUp(self):
@@ -209,6 +240,29 @@ class RawDataElementTests(unittest.TestCase):
         """RawDataElement: conversion of unknown tag throws KeyError........"""
         self.assertRaises(KeyError, DataElement_from_raw, self.raw1)
 
+    def test_encoding(self):
+        """RawDataElement: encoding is held by the class, not the tuple...."""
+        raw = RawDataElement(Tag(0x00100010), 'PN', 4, b'ANON', 0,
+                             False, False)
+        self.assertEqual(5, tuple.__len__(raw))
+        self.assertEqual(7, len(raw))
+        self.assertEqual((Tag(0x00100010), 'PN', 4, b'ANON', 0, False, False),
+                         raw)
+        self.assertFalse(raw.is_implicit_VR)
+        self.assertFalse(raw.is_little_endian)
+        self.assertTrue(isinstance(raw, RawDataElement))
+        self.assertTrue(type(raw) is not type(self.raw1))
+        fixed = raw._replace(VR='LO')
+        self.assertEqual('LO', fixed.VR)
+        self.assertFalse(fixed.is_little_endian)
+
+    def test_pickling(self):
+        """RawDataElement: pickled raw element is read back properly......."""
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            raw = pickle.loads(pickle.dumps(self.raw1, protocol))
+            self.assertEqual(self.raw1, raw)
+            self.assertTrue(type(raw) is type(self.raw1))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,17 +5,28 @@
 #    See the file license.txt included with this distribution, also
 #    available at https://github.com/darcymason/pydicom
 
+from io import BytesIO
+import copy
 import os
+import sys
+import threading
 import unittest
 
-from pydicom.dataset import Dataset, PropertyError
+from pydicom.dataset import Dataset, FileDataset, PropertyError
 from pydicom.dataelem import DataElement, RawDataElement
 from pydicom.dicomio import read_file
 from pydicom.filebase import DicomBytesIO
+from pydicom.filewriter import write_dataset
 from pydicom.tag import Tag
 from pydicom.sequence import Sequence
 from pydicom import compat
 
+have_numpy = True
+try:
+    import numpy  # NOQA
+except ImportError:
+    have_numpy = False
+
 
 class DatasetTests(unittest.TestCase):
     def failUnlessRaises(self, excClass, callableObj, *args, **kwargs):
@@ -714,6 +725,72 @@ class DatasetTests(unittest.TestCase):
         self.assertEqual(ds.data_element('BeamSequence'), next(elem_gen))
         self.assertEqual(ds.BeamSequence[0].data_element('PatientName'), next(elem_gen))
 
+    def test_sorted_tags(self):
+        """Test the sorted tag index follows insertion and deletion."""
+        ds = Dataset()
+        ds.PatientName = 'CITIZEN^Jan'  # 0010,0010
+        ds.CommandGroupLength = 120  # 0000,0000
+        self.assertEqual([0x00000000, 0x00100010], ds._sorted_tags())
+        ds.SOPInstanceUID = '1.2.3.4'  # 0008,0018
+        ds.add_new(0x00090001, 'PN', 'CITIZEN^1')
+        ds.PatientName = 'CITIZEN^Joan'  # replacing doesn't add a tag
+        self.assertEqual([0x00000000, 0x00080018, 0x00090001, 0x00100010],
+                         ds._sorted_tags())
+        del ds.SOPInstanceUID
+        del ds[(0x0009, 0x0001)]
+        self.assertEqual([0x00000000, 0x00100010], ds._sorted_tags())
+        self.assertEqual([0x00000000, 0x00100010],
+                         [elem.tag for elem in ds])
+
+        # Changes made directly to the dict are picked up
+        ds.pop(0x00100010)
+        ds.setdefault(Tag(0x00080016), DataElement(0x00080016, 'UI', '1.2'))
+        ds.setdefault(Tag(0x00080018), DataElement(0x00080018, 'UI', '1.3'))
+        self.assertEqual([0x00000000, 0x00080016, 0x00080018],
+                         [elem.tag for elem in ds])
+
+        # Including changes which leave the number of elements the same
+        ds.pop(0x00080016)
+        ds.setdefault(Tag(0x00100020), DataElement(0x00100020, 'LO', '12'))
+        self.assertEqual([0x00000000, 0x00080018, 0x00100020],
+                         [elem.tag for elem in ds])
+        tag, elem = ds.popitem()
+        ds.setdefault(Tag(0x00100030), DataElement(0x00100030, 'DA', ''))
+        self.assertEqual(sorted(set(ds.keys())), ds._sorted_tags())
+        ds.clear()
+        self.assertEqual([], ds._sorted_tags())
+        ds.PatientName = 'CITIZEN^Jan'
+        self.assertEqual([0x00100010], ds._sorted_tags())
+
+    def test_sorted_tags_equality(self):
+        """Test the sorted tag index doesn't affect Dataset equality."""
+        ds = Dataset()
+        ds.CommandGroupLength = 120
+        ds.PatientName = 'CITIZEN^Jan'
+        ds2 = Dataset()
+        ds2.CommandGroupLength = 120
+        ds2.PatientName = 'CITIZEN^Jan'
+        list(ds)
+        self.assertTrue(ds == ds2)
+        ds2.pop(0x00100010)
+        list(ds2)
+        ds2.PatientName = 'CITIZEN^Jan'
+        self.assertTrue(ds == ds2)
+
+    def test_slice_step(self):
+        """Test Dataset slicing with a step."""
+        ds = Dataset()
+        ds.CommandGroupLength = 120  # 0000,0000
+        ds.SOPInstanceUID = '1.2.3.4'  # 0008,0018
+        ds.PatientName = 'CITIZEN^Jan'  # 0010,0010
+        ds.PatientID = '12345'  # 0010,0020
+        self.assertEqual([0x00000000, 0x00100010],
+                         [elem.tag for elem in ds[::2]])
+        self.assertEqual([0x00080018, 0x00100020],
+                         [elem.tag for elem in ds[0x00080000::-2]])
+        self.assertEqual([0x00080018],
+                         [elem.tag for elem in ds[0x00080001:0x00100010]])
+
     def test_save_as(self):
         """Test Dataset.save_as"""
         fp = DicomBytesIO()
@@ -778,6 +855,261 @@ class FileDatasetTests(unittest.TestCase):
         e.filename = 'test_filename.dcm'
         self.assertFalse(d == e)
 
+    def testElementsLeftRaw(self):
+        """Dataset: reading a file leaves the elements unconverted.........."""
+        d = read_file(self.test_file)
+        raw = [tag for tag in d.keys()
+               if isinstance(dict.__getitem__(d, tag), RawDataElement)]
+        self.assertEqual(len(raw), len(d))
+
+    def testEqualityRawAndConverted(self):
+        """Dataset: raw and converted elements of the same value are equal.."""
+        d = read_file(self.test_file)
+        self.assertTrue(copy.deepcopy(d) == d)
+        e = read_file(self.test_file)
+        e.PatientName
+        e.ImagePositionPatient
+        self.assertTrue(d == e)
+        self.assertTrue(e == d)
+        self.assertFalse(d != e)
+        # Elements are only converted to compare them if they differ
+        self.assertTrue(isinstance(dict.__getitem__(d, 0x00100020),
+                                   RawDataElement))
+        e.PatientName = 'Other^Name'
+        self.assertFalse(d == e)
+        self.assertFalse(e == d)
+
+    def testUndefinedLengthSequenceLeftRaw(self):
+        """Dataset: read_file leaves undefined length sequences unparsed...."""
+        item = Dataset()
+        item.BeamNumber = '1'
+        ds = Dataset()
+        ds.PatientName = 'Test'
+        ds.BeamSequence = Sequence([item])
+        ds[0x300A00B0].is_undefined_length = True
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        fp.is_implicit_VR = True
+        write_dataset(fp, ds)
+
+        d = read_file(BytesIO(fp.getvalue()), force=True)
+        raw_seq = dict.__getitem__(d, 0x300A00B0)
+        self.assertTrue(isinstance(raw_seq, RawDataElement))
+        self.assertEqual(0xFFFFFFFF, raw_seq.length)
+        self.assertEqual(1, d.BeamSequence[0].BeamNumber)
+        self.assertTrue(d[0x300A00B0].is_undefined_length)
+
+
+class CloneTests(unittest.TestCase):
+    def setUp(self):
+        test_dir = os.path.dirname(__file__)
+        self.ct_name = os.path.join(test_dir, 'test_files', 'CT_small.dcm')
+        self.rtplan_name = os.path.join(test_dir, 'test_files', 'rtplan.dcm')
+
+    def testSharesRawElements(self):
+        """Dataset: clone shares raw elements and their values.............."""
+        ds = read_file(self.ct_name)
+        clone = ds.clone()
+        self.assertTrue(isinstance(clone, FileDataset))
+        self.assertEqual(ds, clone)
+        self.assertEqual(ds.filename, clone.filename)
+        self.assertFalse(clone.file_meta is ds.file_meta)
+        self.assertEqual(ds.file_meta, clone.file_meta)
+        raw = dict.__getitem__(ds, 0x7fe00010)
+        self.assertTrue(dict.__getitem__(clone, 0x7fe00010) is raw)
+        self.assertTrue(clone.PixelData is raw.value)
+
+    def testChangesNotShared(self):
+        """Dataset: changes to a clone or its original aren't shared........"""
+        ds = read_file(self.ct_name)
+        ds.PatientName
+        ds.ImagePositionPatient
+        clone = ds.clone()
+        # Converted elements are copied
+        self.assertFalse(dict.__getitem__(clone, 0x00100010) is
+                         dict.__getitem__(ds, 0x00100010))
+        clone.PatientName = 'Clone^Patient'
+        clone.ImagePositionPatient[0] = 0
+        clone.PatientID = 'Clone'
+        self.assertEqual('CompressedSamples^CT1', ds.PatientName)
+        self.assertNotEqual(0, ds.ImagePositionPatient[0])
+        self.assertNotEqual('Clone', ds.PatientID)
+
+        ds.PatientName = 'Original^Patient'
+        clone2 = ds.clone()
+        ds.PatientName = 'Changed^Patient'
+        self.assertEqual('Original^Patient', clone2.PatientName)
+        self.assertEqual('Clone^Patient', clone.PatientName)
+
+        del clone.PatientID
+        self.assertTrue('PatientID' in ds)
+        self.assertEqual(len(ds) - 1, len(clone))
+
+    def testElementsNotShared(self):
+        """Dataset: elements of a clone are not shared by any access........"""
+        ds = read_file(self.ct_name)
+        position = ds.data_element('ImagePositionPatient')
+        name = ds.data_element('PatientName')
+        clone = ds.clone()
+        # Changed through values() and items() of the clone
+        for elem in clone.values():
+            if elem.tag == 0x00100010:
+                elem.value = 'Clone^Patient'
+        for tag, elem in clone.items():
+            if tag == 0x00200032:
+                elem.value[0] = 0
+        self.assertEqual('CompressedSamples^CT1', ds.PatientName)
+        self.assertNotEqual(0, ds.ImagePositionPatient[0])
+        # Changed through references taken before the clone
+        name.value = 'Original^Patient'
+        position.value[1] = 0
+        self.assertEqual('Clone^Patient', clone.PatientName)
+        self.assertNotEqual(0, clone.ImagePositionPatient[1])
+
+    @unittest.skipUnless(have_numpy, "Numpy not installed")
+    def testPixelArrayNotShared(self):
+        """Dataset: clone decodes its own pixel_array......................."""
+        ds = read_file(self.ct_name)
+        value = ds.pixel_array[0, 0]
+        clone = ds.clone()
+        clone.pixel_array[0, 0] = value + 1
+        self.assertEqual(value, ds.pixel_array[0, 0])
+        self.assertEqual(value + 1, clone.pixel_array[0, 0])
+
+    def testSequences(self):
+        """Dataset: sequences of a clone have cloned items.................."""
+        ds = read_file(self.rtplan_name)
+        ds.BeamSequence
+        clone = ds.clone()
+        self.assertFalse(dict.__getitem__(clone, 0x300A00B0) is
+                         dict.__getitem__(ds, 0x300A00B0))
+        clone.BeamSequence[0].BeamName = 'Clone'
+        clone.BeamSequence.append(Dataset())
+        self.assertNotEqual('Clone', ds.BeamSequence[0].BeamName)
+        self.assertEqual(1, len(ds.BeamSequence))
+        self.assertEqual(2, len(clone.BeamSequence))
+        # The items are clones too, sharing their raw elements
+        self.assertTrue(dict.__getitem__(clone.BeamSequence[0], 0x300A00C0) is
+                        dict.__getitem__(ds.BeamSequence[0], 0x300A00C0))
+
+
+class ThreadSafetyTests(unittest.TestCase):
+    """Test sharing a Dataset read from file between threads"""
+    thread_count = 32
+
+    def setUp(self):
+        test_dir = os.path.dirname(__file__)
+        self.ct_name = os.path.join(test_dir, 'test_files', 'CT_small.dcm')
+        self.rtplan_name = os.path.join(test_dir, 'test_files', 'rtplan.dcm')
+        if hasattr(sys, 'setswitchinterval'):
+            # Switch threads often, so that they interleave in conversions
+            self.switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        if hasattr(sys, 'setswitchinterval'):
+            sys.setswitchinterval(self.switch_interval)
+
+    def access_all(self, filename, **kwargs):
+        """Access every element of a dataset read from `filename` from many
+        threads at once; return the elements each thread got and the
+        elements of the same file read and accessed in one thread."""
+        ds = read_file(filename, **kwargs)
+        start = threading.Event()
+        results = [None] * self.thread_count
+        errors = []
+
+        def access(index):
+            start.wait()
+            try:
+                if index % 2:
+                    # Half the threads start from the last element
+                    for tag in sorted(ds.keys(), reverse=True):
+                        ds[tag]
+                results[index] = dict((id(elem), elem)
+                                      for elem in ds.iterall())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=access, args=(i,))
+                   for i in range(self.thread_count)]
+        for thread in threads:
+            thread.start()
+        start.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        expected = list(read_file(filename, **kwargs).iterall())
+        return ds, results, expected
+
+    def check(self, filename, **kwargs):
+        ds, results, expected = self.access_all(filename, **kwargs)
+        # Every thread got the same element objects, which are those in ds
+        got = list(ds.iterall())
+        for elements in results:
+            self.assertEqual(set(id(elem) for elem in got), set(elements))
+        self.assertEqual([(elem.tag, elem.VR, elem.value)
+                          for elem in expected],
+                         [(elem.tag, elem.VR, elem.value) for elem in got])
+
+    def testConcurrentConversion(self):
+        """Dataset: converting elements from many threads at once..........."""
+        self.check(self.ct_name)
+        self.check(self.rtplan_name)
+
+    def testConcurrentSet(self):
+        """Dataset: setting and deleting while others convert..............."""
+        for _ in range(5):
+            ds = read_file(self.ct_name)
+            ds._sorted_tags()  # the index to keep up to date
+            tags = sorted(ds.keys())
+            new_elements = dict((tag, DataElement(tag, 'UN', b''))
+                                for tag in tags[::2])
+            added = [Tag(0x00420010 + i) for i in range(64)]
+            start = threading.Event()
+            errors = []
+
+            def convert():
+                start.wait()
+                try:
+                    for tag in tags:
+                        ds[tag]
+                except Exception as e:
+                    errors.append(e)
+
+            def set_elements():
+                start.wait()
+                for tag, elem in new_elements.items():
+                    ds[tag] = elem
+
+            def add_and_delete(index):
+                # Each thread adds its own tags, and deletes half of them
+                start.wait()
+                for tag in added[index::2]:
+                    ds[tag] = DataElement(tag, 'UN', b'')
+                for tag in added[index::4]:
+                    del ds[tag]
+
+            threads = [threading.Thread(target=convert) for _ in range(4)]
+            threads.append(threading.Thread(target=set_elements))
+            threads.extend(threading.Thread(target=add_and_delete, args=(i,))
+                           for i in range(2))
+            for thread in threads:
+                thread.start()
+            start.set()
+            for thread in threads:
+                thread.join()
+            self.assertEqual([], errors)
+            for tag, elem in new_elements.items():
+                self.assertTrue(dict.__getitem__(ds, tag) is elem)
+            self.assertEqual(sorted(tags + added[2::4] + added[3::4]),
+                             sorted(dict.keys(ds)))
+            self.assertEqual(sorted(dict.keys(ds)), ds.__dict__['_tags'])
+
+    def testConcurrentDeferredRead(self):
+        """Dataset: deferred reads from many threads at once................"""
+        self.check(self.ct_name, defer_size=256)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,192 @@
+# test_dicom_dao.py
+"""unittest cases for pydicom.contrib.dicom_dao, against a stand-in server"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, released under a modified MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import unittest
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:  # Python 2
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+from pydicom.dicomio import read_file
+
+have_couchdb = True
+try:
+    import couchdb
+    from pydicom.contrib.dicom_dao import DicomCouch
+except ImportError:
+    have_couchdb = False
+
+test_dir = os.path.dirname(__file__)
+test_files = os.path.join(test_dir, 'test_files')
+ct_name = os.path.join(test_files, "CT_small.dcm")
+mr_name = os.path.join(test_files, "MR_small.dcm")
+
+
+class CouchHandler(BaseHTTPRequestHandler):
+    """Just enough of the couchdb API for DicomCouch: databases, documents
+    and _bulk_docs, with inline and stub attachments and revision checks.
+    Each stored attachment records the revision it was uploaded in."""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, code, obj):
+        body = json.dumps(obj).encode('ascii')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length).decode('utf-8') or 'null')
+
+    def do_HEAD(self):
+        name = self.path.strip('/').split('/')[0]
+        self.send_response(200 if name in self.server.databases else 404)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        self.server.requests.append(('GET', self.path))
+        parts = self.path.strip('/').split('/')
+        if parts[0] not in self.server.databases:
+            return self.send(404, {'error': 'not_found', 'reason': 'no_db'})
+        if len(parts) == 1:
+            return self.send(200, {'db_name': parts[0]})
+        doc = self.server.databases[parts[0]].get(parts[1])
+        if doc is None:
+            return self.send(404, {'error': 'not_found', 'reason': 'missing'})
+        self.send(200, doc)
+
+    def do_PUT(self):
+        self.server.requests.append(('PUT', self.path))
+        self.read_body()
+        self.server.databases[self.path.strip('/')] = {}
+        self.send(201, {'ok': True})
+
+    def do_POST(self):
+        self.server.requests.append(('POST', self.path))
+        name, operation = self.path.strip('/').split('/')
+        database = self.server.databases[name]
+        results = []
+        for doc in self.read_body()['docs']:
+            current = database.get(doc['_id'])
+            if current is not None and current['_rev'] != doc.get('_rev'):
+                results.append({'id': doc['_id'], 'error': 'conflict',
+                                'reason': 'Document update conflict.'})
+                continue
+            attachments = {}
+            for id, attachment in doc.get('_attachments', {}).items():
+                if attachment.get('stub'):
+                    attachments[id] = current['_attachments'][id]
+                else:
+                    data = base64.b64decode(attachment['data'])
+                    attachments[id] = {
+                        'digest': hashlib.md5(data).hexdigest(),
+                        'uploaded_in': doc.get('_rev')}
+            doc['_attachments'] = attachments
+            number = int(current['_rev'].split('-')[0]) + 1 if current else 1
+            doc['_rev'] = '%d-%d' % (number, len(self.server.requests))
+            database[doc['_id']] = doc
+            results.append({'id': doc['_id'], 'rev': doc['_rev']})
+        self.send(201, results)
+
+
+class CouchServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@unittest.skipUnless(have_couchdb, "couchdb not installed")
+class SaveManyTests(unittest.TestCase):
+    def setUp(self):
+        self.server = CouchServer(('127.0.0.1', 0), CouchHandler)
+        self.server.databases = {}
+        self.server.requests = []
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  args=(0.05,))
+        thread.daemon = True
+        thread.start()
+        self.url = 'http://127.0.0.1:%d/' % self.server.server_port
+        self.db = DicomCouch(self.url, 'dicom')
+        self.dcms = [read_file(ct_name), read_file(mr_name)]
+        del self.server.requests[:]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def stored(self, dcm):
+        return self.server.databases['dicom'][str(dcm.SeriesInstanceUID)]
+
+    def testOneRequestPerBatch(self):
+        """DicomCouch.save_many: one _bulk_docs request per batch..........."""
+        results = self.db.save_many(self.dcms)
+        self.assertEqual([True, True], [success for success, _, _ in results])
+        self.assertEqual([('POST', '/dicom/_bulk_docs')],
+                         self.server.requests)
+        for dcm in self.dcms:
+            doc = self.stored(dcm)
+            self.assertEqual(hashlib.md5(dcm.PixelData).hexdigest(),
+                             doc['_attachments']['(7fe0, 0010)']['digest'])
+
+        del self.server.requests[:]
+        self.db.save_many(self.dcms, batch_size=1)
+        self.assertEqual([('POST', '/dicom/_bulk_docs')] * 2,
+                         self.server.requests)
+
+    def testAttachmentStubs(self):
+        """DicomCouch.save_many: only changed binary elements are sent......"""
+        self.db.save_many(self.dcms)
+        first_revisions = [self.stored(dcm)['_rev'] for dcm in self.dcms]
+
+        self.dcms[0].PatientName = 'Changed^Name'
+        self.dcms[1].PixelData = b'\0' * len(self.dcms[1].PixelData)
+        results = self.db.save_many(self.dcms)
+        self.assertEqual([True, True], [success for success, _, _ in results])
+        # Documents are keyed by the tag numbers
+        self.assertEqual('Changed^Name',
+                         self.stored(self.dcms[0])[str(0x00100010)])
+        uploaded_in = [
+            self.stored(dcm)['_attachments']['(7fe0, 0010)']['uploaded_in']
+            for dcm in self.dcms]
+        # Kept as a stub, and uploaded again
+        self.assertEqual([None, first_revisions[1]], uploaded_in)
+
+    def testConflict(self):
+        """DicomCouch: saving over a newer revision raises a conflict......."""
+        key = str(self.dcms[0].SeriesInstanceUID)
+        self.db[key] = self.dcms[0]
+        other = DicomCouch(self.url, 'dicom')
+        with self.assertRaises(couchdb.http.ResourceConflict):
+            other[key] = self.dcms[0]
+        results = other.save_many(self.dcms)
+        self.assertEqual([False, True], [success for success, _, _ in results])
+
+    def testDatasetUnchanged(self):
+        """DicomCouch.save_many: the datasets saved are not changed........."""
+        dcm = self.dcms[0]
+        private_tags = [tag for tag in dcm.keys() if tag.is_private]
+        self.assertTrue(private_tags)
+        self.db.save_many([dcm])
+        self.assertEqual(private_tags,
+                         [tag for tag in dcm.keys() if tag.is_private])
+        self.assertFalse(str(0x00090010) in self.stored(dcm))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,13 +5,20 @@
 #    See the file license.txt included with this distribution, also
 #    available at https://github.com/darcymason/pydicom
 
+import os
+import shutil
+import sys
+import tempfile
 import unittest
+import pydicom.datadict
 from pydicom.dataset import Dataset
 from pydicom.tag import Tag
 from pydicom.datadict import (keyword_for_tag, dictionary_description,
                               dictionary_has_tag, repeater_has_tag,
-                              repeater_has_keyword)
+                              repeater_has_keyword, mask_match)
 from pydicom.datadict import add_dict_entry, add_dict_entries
+from pydicom.datadict import get_private_dictionaries, private_dictionaries
+from pydicom.datadict import private_dictionary_VR
 
 
 class DictTests(unittest.TestCase):
@@ -40,6 +47,15 @@ class DictTests(unittest.TestCase):
         self.assertTrue(repeater_has_keyword('OverlayData'))
         self.assertFalse(repeater_has_keyword('PixelData'))
 
+    def test_mask_match(self):
+        """Test mask_match finds the repeater dictionary key"""
+        self.assertEqual('60xx3000', mask_match(0x60003000))
+        self.assertEqual('60xx3000', mask_match(0x601E3000))
+        self.assertEqual('50xx0005', mask_match(0x50020005))
+        self.assertEqual('002804x0', mask_match(0x00280410))
+        self.assertEqual(None, mask_match(0x00100010))
+        self.assertEqual(None, mask_match(0x61003000))
+
     def testAddEntry(self):
         """dicom_dictionary: Can add and use a single dictionary entry....."""
         add_dict_entry(0x10011001, "UL", "TestOne", "Test One")
@@ -59,6 +75,96 @@ class DictTests(unittest.TestCase):
         ds.TestOne = 'test'
         ds.TestTwo = ['1', '2', '3']
 
+    def testAddEntryMovesKeyword(self):
+        """dicom_dictionary: Keyword access follows a keyword given a new tag"""
+        add_dict_entry(0x10011003, "UL", "TestMoved", "Test Moved")
+        ds = Dataset()
+        ds.TestMoved = 1
+        self.assertTrue(0x10011003 in ds)
+        add_dict_entry(0x10011004, "UL", "TestMoved", "Test Moved")
+        ds = Dataset()
+        ds.TestMoved = 2
+        self.assertTrue(0x10011004 in ds)
+        self.assertFalse(0x10011003 in ds)
+
+
+class DictCacheTests(unittest.TestCase):
+    """Test the marshal cache of the dictionary modules"""
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.cache_dir, '_dicom_dict.dict')
+        self.original_cache_path = pydicom.datadict._dictionary_cache_path
+        pydicom.datadict._dictionary_cache_path = \
+            lambda source: self.cache_path
+        self.dont_write_bytecode = sys.dont_write_bytecode
+        sys.dont_write_bytecode = False
+        self.builds = 0
+
+    def tearDown(self):
+        pydicom.datadict._dictionary_cache_path = self.original_cache_path
+        sys.dont_write_bytecode = self.dont_write_bytecode
+        shutil.rmtree(self.cache_dir)
+
+    def build(self):
+        self.builds += 1
+        return ({0x00100010: ('PN', '1', "Patient's Name", '', 'PatientName')},
+                {'60xx0010': ('US', '1', "Overlay Rows", '', 'OverlayRows')})
+
+    def load(self):
+        return pydicom.datadict._load_dictionary('_dicom_dict', self.build)
+
+    def test_cache_written_and_used(self):
+        """Dictionary cache: is written, then used instead of the module..."""
+        self.assertEqual(self.build(), self.load())
+        self.assertEqual(2, self.builds)
+        self.assertTrue(os.path.exists(self.cache_path))
+        self.assertEqual(self.build(), self.load())
+        self.assertEqual(3, self.builds)  # only the call in this test
+
+    def test_corrupt_cache(self):
+        """Dictionary cache: a corrupt cache is replaced................."""
+        with open(self.cache_path, 'wb') as f:
+            f.write(b'\x00\x01')
+        self.assertEqual(self.build(), self.load())
+        self.assertEqual(2, self.builds)
+        self.load()
+        self.assertEqual(2, self.builds)
+
+    def test_no_write_bytecode(self):
+        """Dictionary cache: not written if writing bytecode is disabled."""
+        sys.dont_write_bytecode = True
+        self.load()
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_private_dictionaries(self):
+        """Dictionary cache: private dictionaries are loaded on first use."""
+        private_dicts = get_private_dictionaries()
+        self.assertTrue('GEMS_IDEN_01' in private_dicts)
+        self.assertEqual(('LO', '1', 'Full fidelity', ''),
+                         private_dicts['GEMS_IDEN_01']['0009xx01'])
+
+    def test_private_dictionaries_mapping(self):
+        """Dictionary cache: private_dictionaries loads each one lazily."""
+        self.assertTrue('GEMS_IDEN_01' in private_dictionaries)
+        self.assertFalse('Nobody' in private_dictionaries)
+        self.assertEqual(len(get_private_dictionaries()),
+                         len(private_dictionaries))
+        self.assertEqual(('LO', '1', 'Full fidelity', ''),
+                         private_dictionaries['GEMS_IDEN_01']['0009xx01'])
+        self.assertTrue(private_dictionaries['GEMS_IDEN_01'] is
+                        private_dictionaries['GEMS_IDEN_01'])
+
+        private_dictionaries['Nobody'] = {'0011xx01': ('US', '1', 'X', '')}
+        try:
+            self.assertTrue('Nobody' in list(private_dictionaries))
+            self.assertEqual('US', private_dictionary_VR(0x00111001,
+                                                         'Nobody'))
+        finally:
+            del private_dictionaries['Nobody']
+        self.assertFalse('Nobody' in private_dictionaries)
+        self.assertRaises(KeyError, private_dictionary_VR, 0x00111001,
+                          'Nobody')
+
 
 if __name__ == "__main__":
     unittest.main()
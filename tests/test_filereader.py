@@ -41,7 +41,8 @@ except:
 from pydicom.dataset import Dataset, FileDataset
 from pydicom.dataelem import DataElement
 from pydicom.filebase import DicomBytesIO
-from pydicom.filereader import read_file, data_element_generator
+from pydicom.filereader import (read_file, data_element_generator,
+                                iter_sequence_items)
 from pydicom.errors import InvalidDicomError
 from pydicom.dataset import PropertyError
 from pydicom.tag import Tag, TupleTag
@@ -96,6 +97,7 @@ emri_big_endian_name = os.path.join(test_files, "emri_small_big_endian.dcm")
 emri_jpeg_ls_lossless = os.path.join(test_files, "emri_small_jpeg_ls_lossless.dcm")
 emri_jpeg_2k_lossless = os.path.join(test_files, "emri_small_jpeg_2k_lossless.dcm")
 color_3d_jpeg_baseline = os.path.join(test_files, "color3d_jpeg_baseline.dcm")
+dicomdir_name = os.path.join(test_files, "dicomdirtests", "DICOMDIR")
 dir_name = os.path.dirname(sys.argv[0])
 save_dir = os.getcwd()
 
@@ -127,6 +129,13 @@ class ReaderTests(unittest.TestCase):
         self.assertEqual(empty_number_tags_ds.TagSpacingSecondDimension, '')
         self.assertEqual(empty_number_tags_ds.VectorGridData, '')
 
+    def testSharedDictionaryTags(self):
+        """Elements read with the same dictionary tag share one Tag instance"""
+        ct = read_file(ct_name)
+        mr = read_file(mr_name)
+        self.assertTrue(ct.get_item(0x00100010).tag is
+                        mr.get_item(0x00100010).tag)
+
     def testUTF8FileName(self):
         utf8_filename = os.path.join(tempfile.gettempdir(), "ДИКОМ.dcm")
         shutil.copyfile(rtdose_name, utf8_filename)
@@ -134,6 +143,30 @@ class ReaderTests(unittest.TestCase):
         os.remove(utf8_filename)
         self.assertTrue(ds is not None)
 
+    def testSpecificTags(self):
+        """Returns only the elements (and Specific Character Set) asked for"""
+        ds = read_file(ct_name, specific_tags=['PatientName', 0x00280030,
+                                               (0x0020, 0x0032)])
+        self.assertEqual([0x00080005, 0x00100010, 0x00200032, 0x00280030],
+                         sorted(ds.keys()))
+        self.assertEqual('CompressedSamples^CT1', ds.PatientName)
+        self.assertEqual([0.661468, 0.661468], ds.PixelSpacing)
+        self.assertTrue('TransferSyntaxUID' in ds.file_meta)
+
+    def testSpecificTagsSequence(self):
+        """Returns a sequence asked for, skipping over other sequences......"""
+        ds = read_file(rtplan_name, specific_tags=['BeamSequence',
+                                                   'PatientName'])
+        self.assertEqual([0x00100010, 0x300A00B0], sorted(ds.keys()))
+        self.assertEqual(1, len(ds.BeamSequence))
+
+    def testSpecificTagsNone(self):
+        """Reading no specific tags returns only Specific Character Set....."""
+        ds = read_file(ct_name, specific_tags=[])
+        self.assertEqual([0x00080005], list(ds.keys()))
+        ds = read_file(mr_name, specific_tags=[])
+        self.assertEqual([], list(ds.keys()))
+
     def testRTPlan(self):
         """Returns correct values for sample data elements in test RT Plan file"""
         plan = read_file(rtplan_name)
@@ -938,6 +971,59 @@ class FileLikeTests(unittest.TestCase):
         file_like.close()
 
 
+class IterSequenceItemsTests(unittest.TestCase):
+    """Test streaming the items of a sequence with iter_sequence_items"""
+    def testMatchesReadFile(self):
+        """iter_sequence_items: items match those from read_file......"""
+        expected = read_file(dicomdir_name).DirectoryRecordSequence
+        got = list(iter_sequence_items(dicomdir_name,
+                                       'DirectoryRecordSequence'))
+        self.assertEqual(len(got), len(expected))
+        for item, expected_item in zip(got, expected):
+            self.assertEqual(item.DirectoryRecordType,
+                             expected_item.DirectoryRecordType)
+            self.assertEqual(item.file_tell, expected_item.file_tell)
+
+    def testTagAndFileObject(self):
+        """iter_sequence_items: accepts a tag and an open file........"""
+        with open(rtplan_name, 'rb') as f:
+            beams = list(iter_sequence_items(f, (0x300a, 0x00b0)))
+            self.assertFalse(f.closed)
+        self.assertEqual([beam.BeamName for beam in beams],
+                         [beam.BeamName for beam in read_file(rtplan_name).BeamSequence])
+        self.assertEqual(len(beams[0].ControlPointSequence), 2)
+
+    def testEarlyExit(self):
+        """iter_sequence_items: stops reading when iteration stops...."""
+        with open(dicomdir_name, 'rb') as f:
+            items = iter_sequence_items(f, 'DirectoryRecordSequence')
+            first = next(items)
+            position = f.tell()
+            self.assertTrue(position < os.path.getsize(dicomdir_name))
+            self.assertEqual(first.DirectoryRecordType, 'PATIENT')
+            items.close()
+            self.assertEqual(f.tell(), position)
+
+    def testMissingSequence(self):
+        """iter_sequence_items: nothing yielded if no such sequence..."""
+        self.assertEqual(list(iter_sequence_items(ct_name, 'BeamSequence')),
+                         [])
+
+    def testNotASequence(self):
+        """iter_sequence_items: raises ValueError if not a sequence..."""
+        items = iter_sequence_items(rtplan_name, 'PatientName')
+        self.assertRaises(ValueError, list, items)
+
+    def testExplicitVRAndPrivate(self):
+        """iter_sequence_items: explicit VR and private sequences....."""
+        for filename, tag in ((jpeg2000_name, 0x00082112),
+                              (nested_priv_SQ_name, 0x00010001)):
+            expected = read_file(filename)[tag].value
+            got = list(iter_sequence_items(filename, tag))
+            self.assertEqual(len(got), len(expected))
+            self.assertEqual(list(got[0].keys()), list(expected[0].keys()))
+
+
 if __name__ == "__main__":
     # This is called if run alone, but not if loaded through run_tests.py
     # If not run from the directory where the sample images are, then need to switch there
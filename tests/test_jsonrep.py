@@ -0,0 +1,146 @@
+# test_jsonrep.py
+"""unittest cases for pydicom.jsonrep module"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, released under a modified MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+import base64
+import io
+import json
+import os
+import unittest
+
+from pydicom.dataelem import RawDataElement
+from pydicom.dataset import Dataset
+from pydicom.dicomio import read_file
+from pydicom.jsonrep import from_json, to_json
+from pydicom.sequence import Sequence
+
+test_dir = os.path.dirname(__file__)
+test_files = os.path.join(test_dir, 'test_files')
+ct_name = os.path.join(test_files, "CT_small.dcm")
+rtplan_name = os.path.join(test_files, "rtplan.dcm")
+big_endian_name = os.path.join(test_files, "emri_small_big_endian.dcm")
+
+
+class ToJSONTests(unittest.TestCase):
+    def testValues(self):
+        """JSON: values are given as the JSON model requires................"""
+        ds = Dataset()
+        ds.PatientName = 'Citizen^Jan=Ideo^Jan'
+        ds.SOPInstanceUID = '1.2.840.10008.1.2'
+        ds.ImageType = ['ORIGINAL', 'PRIMARY']
+        ds.PixelSpacing = ['0.5', '0.25']
+        ds.Rows = 512
+        ds.SeriesNumber = '3'
+        ds.PatientID = ''
+        ds.FrameIncrementPointer = 0x00181063
+        j = json.loads(to_json(ds))
+        self.assertEqual(j['00100010'],
+                         {'vr': 'PN', 'Value': [{'Alphabetic': 'Citizen^Jan',
+                                                 'Ideographic': 'Ideo^Jan'}]})
+        self.assertEqual(j['00080018']['Value'], ['1.2.840.10008.1.2'])
+        self.assertEqual(j['00080008']['Value'], ['ORIGINAL', 'PRIMARY'])
+        self.assertEqual(j['00280030'], {'vr': 'DS', 'Value': [0.5, 0.25]})
+        self.assertEqual(j['00280010'], {'vr': 'US', 'Value': [512]})
+        self.assertEqual(j['00200011'], {'vr': 'IS', 'Value': [3]})
+        self.assertEqual(j['00100020'], {'vr': 'LO'})
+        self.assertEqual(j['00280009'], {'vr': 'AT', 'Value': ['00181063']})
+
+    def testFile(self):
+        """JSON: a file's elements are all given, except group lengths......"""
+        ds = read_file(rtplan_name)
+        j = json.loads(to_json(ds))
+        tags = ["{0:08X}".format(tag) for tag in sorted(ds.keys())
+                if tag.element != 0]
+        self.assertEqual(list(sorted(j.keys())), tags)
+        beams = j['300A00B0']
+        self.assertEqual(beams['vr'], 'SQ')
+        self.assertEqual(len(beams['Value']), len(ds.BeamSequence))
+
+    def testRawBinaryNotConverted(self):
+        """JSON: binary values are taken from the raw elements.............."""
+        ds = read_file(ct_name)
+        j = json.loads(to_json(ds))
+        self.assertTrue(isinstance(dict.__getitem__(ds, 0x7FE00010),
+                                   RawDataElement))
+        self.assertEqual(j['7FE00010']['vr'], 'OW')
+        self.assertEqual(base64.b64decode(j['7FE00010']['InlineBinary']),
+                         ds.PixelData)
+
+    def testBigEndianSwapped(self):
+        """JSON: big endian words are given in little endian................"""
+        ds = read_file(big_endian_name)
+        j = json.loads(to_json(ds))
+        data = base64.b64decode(j['7FE00010']['InlineBinary'])
+        self.assertEqual(data[:4], ds.PixelData[1::-1] + ds.PixelData[3:1:-1])
+
+    def testBulkDataURI(self):
+        """JSON: large binary values are given by the BulkDataURI handler..."""
+        uris = {}
+
+        def handler(tag, VR, value):
+            uris[tag] = value
+            return "http://host/bulk/{0:08X}".format(tag)
+
+        ds = read_file(ct_name)
+        j = json.loads(to_json(ds, bulk_data_threshold=1024,
+                               bulk_data_uri_handler=handler))
+        self.assertEqual(j['7FE00010'], {'vr': 'OW', 'BulkDataURI':
+                                         'http://host/bulk/7FE00010'})
+        self.assertEqual(uris[0x7FE00010], ds.PixelData)
+        self.assertTrue(all(len(value) > 1024 for value in uris.values()))
+        self.assertTrue('InlineBinary' in j['00431028'])  # Private, small
+
+    def testStream(self):
+        """JSON: writing to a file-like gives the same JSON................."""
+        ds = read_file(rtplan_name)
+        fp = io.StringIO()
+        self.assertEqual(ds.to_json(fp), None)
+        self.assertEqual(fp.getvalue(), to_json(ds))
+
+
+class FromJSONTests(unittest.TestCase):
+    def testRoundTrip(self):
+        """JSON: a dataset read from its JSON has the same values..........."""
+        ds = read_file(rtplan_name)
+        ds2 = from_json(to_json(ds))
+        for tag in ds.keys():
+            if tag.element != 0:
+                self.assertEqual(ds2[tag].VR, ds[tag].VR)
+        self.assertEqual(ds2.PatientName, ds.PatientName)
+        self.assertEqual(ds2.SOPInstanceUID, ds.SOPInstanceUID)
+        self.assertEqual(ds2.BeamSequence[0].BeamName,
+                         ds.BeamSequence[0].BeamName)
+        self.assertEqual(ds2.FractionGroupSequence[0].ReferencedBeamSequence[
+            0].BeamMeterset, ds.FractionGroupSequence[0].ReferencedBeamSequence[
+            0].BeamMeterset)
+
+    def testModel(self):
+        """JSON: values of each kind are read from the JSON model..........."""
+        j = {'00100010': {'vr': 'PN', 'Value': [{'Alphabetic': 'Citizen^Jan',
+                                                 'Phonetic': 'Sit^Jan'}]},
+             '00280030': {'vr': 'DS', 'Value': [0.5, 0.25]},
+             '00280010': {'vr': 'US', 'Value': [512]},
+             '00100020': {'vr': 'LO'},
+             '00280009': {'vr': 'AT', 'Value': ['00181063']},
+             '00089215': {'vr': 'SQ', 'Value': [
+                 {'00080100': {'vr': 'SH', 'Value': ['121322']}}]},
+             '7FE00010': {'vr': 'OW', 'InlineBinary': 'AAECAw=='},
+             '00420011': {'vr': 'OB', 'BulkDataURI': 'http://host/1'}}
+        ds = Dataset.from_json(json.dumps(j),
+                               lambda uri: uri.encode('ascii'))
+        self.assertEqual(ds.PatientName, 'Citizen^Jan==Sit^Jan')
+        self.assertEqual(ds.PixelSpacing, [0.5, 0.25])
+        self.assertEqual(ds.Rows, 512)
+        self.assertEqual(ds.PatientID, '')
+        self.assertEqual(ds.FrameIncrementPointer, 0x00181063)
+        self.assertTrue(isinstance(ds.DerivationCodeSequence, Sequence))
+        self.assertEqual(ds.DerivationCodeSequence[0].CodeValue, '121322')
+        self.assertEqual(ds.PixelData, b'\x00\x01\x02\x03')
+        self.assertEqual(ds.EncapsulatedDocument, b'http://host/1')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,7 @@
 
 import unittest
 from datetime import date
-from pydicom.multival import MultiValue
+from pydicom.multival import MultiValue, LazyMultiValue
 from pydicom.valuerep import DS, DSfloat, DSdecimal, IS
 from pydicom import config
 from pydicom.dataset import Dataset
@@ -73,5 +73,101 @@ class MultiValuetests(unittest.TestCase):
         deepcopy(multival)
 
 
+class LazyMultiValueTests(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def counting_IS(val):
+            self.calls.append(val)
+            return IS(val)
+        self.counting_IS = counting_IS
+
+    def testNoConversionOnCreate(self):
+        """LazyMultiValue: items are not converted on creation............"""
+        multival = LazyMultiValue(self.counting_IS, ['1', '2', '3'])
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(multival), 3)
+        self.assertEqual(multival.unconverted_count, 3)
+
+    def testConvertOnIndex(self):
+        """LazyMultiValue: only the indexed item is converted, and cached.."""
+        multival = LazyMultiValue(self.counting_IS, ['1', '2', '3'])
+        self.assertTrue(isinstance(multival[1], IS))
+        self.assertEqual(multival[1], 2)
+        self.assertEqual(multival[-1], 3)
+        self.assertEqual(self.calls, ['2', '3'])
+        self.assertEqual(multival.unconverted_count, 1)
+
+    def testIterateAndSlice(self):
+        """LazyMultiValue: iteration and slices return converted items...."""
+        multival = LazyMultiValue(self.counting_IS, ['1', '2', '3', '4'])
+        self.assertEqual(multival[1:3], [2, 3])
+        for val in multival:
+            self.assertTrue(isinstance(val, IS))
+        self.assertEqual(list(reversed(multival)), [4, 3, 2, 1])
+        self.assertEqual(len(self.calls), 4)
+
+    def testSetSlice(self):
+        """LazyMultiValue: items set by slice are converted................"""
+        multival = LazyMultiValue(self.counting_IS, ['1', '2', '3', '4'])
+        multival[1:3] = ['7', '8']
+        self.assertEqual(self.calls, ['7', '8'])
+        self.assertEqual(multival[0:3], [1, 7, 8])
+        self.assertTrue(isinstance(list.__getitem__(multival, 2), IS))
+
+    def testEarlyExit(self):
+        """LazyMultiValue: stopping iteration early leaves the rest alone.."""
+        multival = LazyMultiValue(self.counting_IS, ['1', '2', '3'])
+        for val in multival:
+            break
+        self.assertEqual(self.calls, ['1'])
+
+    def testComparisonConvertsAll(self):
+        """LazyMultiValue: equality and membership use converted values..."""
+        multival = LazyMultiValue(IS, ['1', '2', '3'])
+        self.assertEqual(multival, [1, 2, 3])
+        self.assertEqual(multival, LazyMultiValue(IS, ['1', '2', '3']))
+        self.assertTrue(2 in LazyMultiValue(IS, ['1', '2']))
+        self.assertEqual(LazyMultiValue(IS, ['1', '2']).index(2), 1)
+
+    def testModifySameAsMultiValue(self):
+        """LazyMultiValue: append, insert and setitem convert immediately.."""
+        multival = LazyMultiValue(IS, ['1', '2'])
+        multival.append('5')
+        multival.insert(0, '7')
+        multival[1] = '9'
+        self.assertEqual(multival.unconverted_count, 1)
+        self.assertTrue(isinstance(list.__getitem__(multival, 0), IS))
+        self.assertEqual(multival, [7, 9, 2, 5])
+        self.assertEqual(multival.pop(), 5)
+
+    def testStr(self):
+        """LazyMultiValue: str() is the same as for MultiValue............."""
+        self.assertEqual(str(LazyMultiValue(DS, ['1.5', '2'])),
+                         str(MultiValue(DS, ['1.5', '2'])))
+
+    def testDeepCopy(self):
+        """LazyMultiValue: deepcopy keeps unconverted items unconverted...."""
+        multival = LazyMultiValue(self.counting_IS, ['1', '2'])
+        multival[0]
+        copied = deepcopy(multival)
+        self.assertEqual(copied.unconverted_count, 1)
+        self.assertEqual(copied, [1, 2])
+
+    def testReadWithConfig(self):
+        """LazyMultiValue: used for read values if config flag is set....."""
+        from pydicom.values import convert_IS_string
+        original_flag = config.lazy_multivalue_conversion
+        config.lazy_multivalue_conversion = True
+        try:
+            value = convert_IS_string(b'1\\2\\3 ', True)
+        finally:
+            config.lazy_multivalue_conversion = original_flag
+        self.assertTrue(isinstance(value, LazyMultiValue))
+        self.assertEqual(value, [1, 2, 3])
+        value = convert_IS_string(b'1\\2\\3 ', True)
+        self.assertFalse(isinstance(value, LazyMultiValue))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+# test_pydicom_PIL.py
+"""unittest cases for pydicom.contrib.pydicom_PIL"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, released under a modified MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+import unittest
+
+from pydicom.contrib import pydicom_PIL
+from pydicom.dataset import Dataset
+from pydicom.uid import ExplicitVRLittleEndian
+
+have_numpy = pydicom_PIL.have_numpy
+if have_numpy:
+    import numpy
+
+
+def image_dataset(pixels, frames=None, samples=1):
+    """Return a dataset of 8 bit `pixels`, with a window of 100 at 50"""
+    ds = Dataset()
+    ds.file_meta = Dataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.is_little_endian = True
+    ds.is_implicit_VR = False
+    if frames is not None:
+        ds.NumberOfFrames = str(frames)
+    ds.SamplesPerPixel = samples
+    ds.PhotometricInterpretation = 'RGB' if samples == 3 else 'MONOCHROME2'
+    if samples == 3:
+        ds.PlanarConfiguration = 0
+        pixels_shape = pixels.shape[:-1]
+    else:
+        pixels_shape = pixels.shape
+    ds.Rows, ds.Columns = pixels_shape[-2:]
+    ds.BitsAllocated = ds.BitsStored = 8
+    ds.HighBit = 7
+    ds.PixelRepresentation = 0
+    ds.WindowCenter = '50'
+    ds.WindowWidth = '100'
+    ds.PixelData = pixels.astype(numpy.uint8).tobytes()
+    return ds
+
+
+@unittest.skipUnless(have_numpy and pydicom_PIL.have_PIL,
+                     "Numpy or PIL not installed")
+class LUTImageTests(unittest.TestCase):
+    def setUp(self):
+        self.LUTs = pydicom_PIL._LUTs.copy()
+        pydicom_PIL._LUTs.clear()
+
+    def tearDown(self):
+        pydicom_PIL._LUTs.clear()
+        pydicom_PIL._LUTs.update(self.LUTs)
+
+    def testLeastRecentlyUsed(self):
+        """get_LUT_value: the least recently used table is dropped.........."""
+        data = numpy.arange(4, dtype=numpy.uint8)
+        max_LUTs = pydicom_PIL._max_LUTs
+        for level in range(max_LUTs):
+            pydicom_PIL.get_LUT_value(data, 10, level)
+        pydicom_PIL.get_LUT_value(data, 10, 0)  # now the most recently used
+        pydicom_PIL.get_LUT_value(data, 10, max_LUTs)
+        levels = [key[3] for key in pydicom_PIL._LUTs]
+        self.assertEqual(max_LUTs, len(levels))
+        self.assertEqual(list(range(2, max_LUTs)) + [0, max_LUTs],
+                         [int(level) for level in levels])
+
+    def testSingleFrame(self):
+        """get_PIL_image: a single frame, of one or three samples..........."""
+        pixels = numpy.array([[0, 50], [100, 150], [200, 250]])
+        im = pydicom_PIL.get_PIL_image(image_dataset(pixels))
+        self.assertEqual(('L', (2, 3)), (im.mode, im.size))
+        self.assertEqual([0, 129, 255, 255, 255, 255], list(im.getdata()))
+
+        rgb = numpy.dstack([pixels, pixels // 2, pixels // 5])
+        im = pydicom_PIL.get_PIL_image(image_dataset(rgb, samples=3))
+        self.assertEqual(('RGB', (2, 3)), (im.mode, im.size))
+        self.assertEqual((255, 255, 129), im.getpixel((1, 2)))
+
+    def testFrames(self):
+        """get_PIL_images: an image for each frame.........................."""
+        pixels = numpy.array([[[0, 50]], [[100, 0]], [[0, 0]]])
+        images = pydicom_PIL.get_PIL_images(image_dataset(pixels, frames=3))
+        self.assertEqual(3, len(images))
+        self.assertEqual([[0, 129], [255, 0], [0, 0]],
+                         [list(im.getdata()) for im in images])
+        im = pydicom_PIL.get_PIL_image(image_dataset(pixels, frames=3))
+        self.assertEqual([0, 129], list(im.getdata()))
+
+        # A single frame with a frame count
+        images = pydicom_PIL.get_PIL_images(image_dataset(pixels[:1],
+                                                          frames=1))
+        self.assertEqual([[0, 129]], [list(im.getdata()) for im in images])
+
+
+if __name__ == "__main__":
+    unittest.main()
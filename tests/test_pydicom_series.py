@@ -0,0 +1,393 @@
+# test_pydicom_series.py
+"""unittest cases for pydicom.contrib.pydicom_series"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, released under a modified MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+import pydicom
+from pydicom.contrib import pydicom_series
+from pydicom.dataset import Dataset, FileDataset
+from pydicom.uid import ExplicitVRLittleEndian
+
+have_numpy = pydicom_series.have_numpy
+if have_numpy:
+    import numpy
+
+test_dir = os.path.dirname(__file__)
+test_files = os.path.join(test_dir, 'test_files')
+
+
+def write_series(directory, positions, suid='1.2.3.4', rows=4, columns=3,
+                 rescale=None, bits_stored=12, pixel_representation=0,
+                 numbers=None):
+    """Write a series of synthetic slices at `positions` (z coordinates, or
+    (x, y, z) positions) to `directory`, and return their pixel arrays.
+
+    The pixels of slice i are i * 100 plus their index within the slice.
+    """
+    if numbers is None:
+        numbers = range(1, len(positions) + 1)
+    dtype = 'int16' if pixel_representation else 'uint16'
+    pixel_arrays = []
+    for i, (position, number) in enumerate(zip(positions, numbers)):
+        if not isinstance(position, (list, tuple)):
+            position = (0, 0, position)
+        meta = Dataset()
+        meta.MediaStorageSOPClassUID = '1.2.840.10008.5.1.4.1.1.4'
+        meta.MediaStorageSOPInstanceUID = '%s.%d' % (suid, i + 1)
+        meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        filename = os.path.join(directory, '%s_%03d.dcm' % (suid, i))
+        ds = FileDataset(filename, {}, file_meta=meta,
+                         preamble=b'\0' * 128)
+        ds.is_little_endian = True
+        ds.is_implicit_VR = False
+        ds.SOPClassUID = meta.MediaStorageSOPClassUID
+        ds.SOPInstanceUID = meta.MediaStorageSOPInstanceUID
+        ds.Modality = 'MR'
+        ds.SeriesInstanceUID = suid
+        # Number strings are given as str, as they are when read
+        ds.InstanceNumber = str(number)
+        ds.ImagePositionPatient = [str(v) for v in position]
+        ds.ImageOrientationPatient = ['1', '0', '0', '0', '1', '0']
+        ds.SamplesPerPixel = 1
+        ds.PhotometricInterpretation = 'MONOCHROME2'
+        ds.Rows = rows
+        ds.Columns = columns
+        ds.PixelSpacing = ['0.5', '0.5']
+        ds.BitsAllocated = 16
+        ds.BitsStored = bits_stored
+        ds.HighBit = bits_stored - 1
+        ds.PixelRepresentation = pixel_representation
+        if rescale is not None:
+            ds.RescaleSlope, ds.RescaleIntercept = [str(v) for v in rescale]
+        values = [i * 100 + j for j in range(rows * columns)]
+        if have_numpy:
+            pixels = numpy.array(values, dtype=dtype).reshape(rows, columns)
+            ds.PixelData = pixels.tobytes()
+            pixel_arrays.append(pixels)
+        else:
+            ds.PixelData = struct.pack('<%dH' % len(values), *values)
+        ds.save_as(filename)
+    return pixel_arrays
+
+
+def summary(series):
+    """Return the Series Instance UID and SOP Instance UIDs of series"""
+    return [(serie.suid, [ds.SOPInstanceUID for ds in serie._datasets])
+            for serie in series]
+
+
+class ReadFilesTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def testWorkers(self):
+        """read_files: the same series read by any number of workers........"""
+        expected = summary(pydicom_series.read_files(test_files, workers=1))
+        self.assertTrue(expected)
+        for workers in (2, 4):
+            got = summary(pydicom_series.read_files(test_files,
+                                                    workers=workers))
+            self.assertEqual(expected, got)
+
+    @unittest.skipUnless(have_numpy, "Numpy not installed")
+    def testPixelDataFromHeader(self):
+        """read_files: pixel data read from the file for header datasets...."""
+        pixels = write_series(self.directory, [0.0, 2.0, 4.0])
+        serie, = pydicom_series.read_files(self.directory)
+        self.assertFalse(0x7fe00010 in serie._datasets[1])
+
+        # Only the pixel data element is read
+        calls = []
+        read_file = pydicom.read_file
+
+        def recording_read_file(*args, **kwargs):
+            calls.append(kwargs.get('specific_tags'))
+            return read_file(*args, **kwargs)
+        pydicom.read_file = recording_read_file
+        try:
+            volume = serie.get_pixel_array(workers=1)
+        finally:
+            pydicom.read_file = read_file
+        self.assertEqual([[0x7fe00010]] * 3, calls)
+        self.assertTrue(numpy.array_equal(numpy.array(pixels), volume))
+        # The pixel data isn't kept in the header dataset
+        self.assertFalse(0x7fe00010 in serie._datasets[1])
+
+    def testCache(self):
+        """read_files: series taken from the cache are the same............."""
+        write_series(self.directory, [0.0, 2.0, 4.0], rescale=('1', '-1024'),
+                     suid='1.2.840.10008.5.1.4.1.1.2.1')
+        cache = os.path.join(tempfile.mkdtemp(), 'series.cache')
+        self.addCleanup(shutil.rmtree, os.path.dirname(cache))
+        expected = pydicom_series.read_files(self.directory, cache=cache)
+        self.assertTrue(os.path.exists(cache))
+
+        calls = []
+        read_file = pydicom.read_file
+
+        def recording_read_file(*args, **kwargs):
+            calls.append(args[0])
+            return read_file(*args, **kwargs)
+        pydicom.read_file = recording_read_file
+        try:
+            got = pydicom_series.read_files(self.directory, cache=cache)
+        finally:
+            pydicom.read_file = read_file
+        self.assertEqual([], calls)  # all taken from the cache
+
+        self.assertEqual(summary(expected), summary(got))
+        serie, = got
+        # UIDs are cached by value, not by name
+        self.assertEqual('1.2.840.10008.5.1.4.1.1.2.1', serie.suid)
+        for ds in serie._datasets:
+            self.assertEqual('1.2.840.10008.5.1.4.1.1.4', ds.SOPClassUID)
+            self.assertEqual('MR Image Storage', ds.SOPClassUID.name)
+            # The cached elements have the values in the file
+            full = pydicom.read_file(ds.filename)
+            self.assertEqual(18, len(ds))
+            for tag in ds.keys():
+                self.assertEqual(full[tag].value, ds[tag].value)
+        self.assertEqual(expected[0].shape, serie.shape)
+        self.assertEqual(expected[0].sampling, serie.sampling)
+        self.assertEqual(expected[0].info.RescaleIntercept,
+                         serie.info.RescaleIntercept)
+        if have_numpy:
+            self.assertTrue(numpy.array_equal(
+                expected[0].get_pixel_array(), serie.get_pixel_array()))
+
+
+@unittest.skipUnless(have_numpy, "Numpy not installed")
+class SplitStacksTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def stacks(self, positions, numbers=None):
+        """Return the instance numbers of each serie read, and the serie"""
+        write_series(self.directory, positions, numbers=numbers)
+        series = pydicom_series.read_files(self.directory)
+        return [[int(ds.InstanceNumber) for ds in serie._datasets]
+                for serie in series], series
+
+    def testSingleStack(self):
+        """read_files: one stack, sorted along the slice normal............."""
+        stacks, series = self.stacks([6.0, 4.0, 2.0, 0.0])
+        self.assertEqual([[4, 3, 2, 1]], stacks)
+        self.assertEqual([4, 4, 3], series[0].shape)
+        self.assertAlmostEqual(2.0, series[0].sampling[0])
+
+    def testDynamic(self):
+        """read_files: repeated positions stay in the same stack............"""
+        # 4 locations of 3 timepoints each
+        positions = [z for z in (0.0, 1.5, 3.0, 4.5) for t in range(3)]
+        stacks, series = self.stacks(positions)
+        self.assertEqual([list(range(1, 13))], stacks)
+        self.assertAlmostEqual(1.5, series[0].sampling[0])
+
+        # A single location
+        shutil.rmtree(self.directory)
+        os.mkdir(self.directory)
+        stacks, series = self.stacks([2.0] * 3)
+        self.assertEqual([[1, 2, 3]], stacks)
+        self.assertEqual([3, 4, 3], series[0].shape)
+
+    def testGated(self):
+        """read_files: a stack for each pass through the locations.........."""
+        # 3 timepoints of 4 locations each
+        positions = [0.0, 1.5, 3.0, 4.5] * 3
+        stacks, series = self.stacks(positions)
+        self.assertEqual([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]],
+                         stacks)
+        for serie in series:
+            self.assertAlmostEqual(1.5, serie.sampling[0])
+
+    def testBalancedDirections(self):
+        """read_files: as many steps back as forward split once............."""
+        stacks, series = self.stacks([0.0, 1.5, 0.0])
+        self.assertEqual([[1, 2], [3]], stacks)
+
+    def testMultiStack(self):
+        """read_files: stacks split at large steps and orientations........."""
+        stacks, series = self.stacks([0.0, 1.0, 2.0, 3.0, 20.0, 21.0, 22.0])
+        self.assertEqual([[1, 2, 3, 4], [5, 6, 7]], stacks)
+
+        # The last slice in a different orientation
+        shutil.rmtree(self.directory)
+        os.mkdir(self.directory)
+        write_series(self.directory, [0.0, 1.0, 2.0])
+        filename = os.path.join(self.directory, '1.2.3.4_002.dcm')
+        ds = pydicom.read_file(filename)
+        ds.ImageOrientationPatient = ['0', '1', '0', '0', '0', '-1']
+        ds.save_as(filename)
+        series = pydicom_series.read_files(self.directory)
+        self.assertEqual([[1, 2], [3]],
+                         [[int(ds.InstanceNumber) for ds in serie._datasets]
+                          for serie in series])
+
+
+@unittest.skipUnless(have_numpy, "Numpy not installed")
+class PixelArrayTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def dtype(self, **elements):
+        ds = Dataset()
+        for keyword, value in elements.items():
+            setattr(ds, keyword, value)
+        return pydicom_series._getDtype(ds)
+
+    def testDtype(self):
+        """get_pixel_array: data type from the header's range of values....."""
+        self.assertEqual(None, self.dtype(BitsStored=12))
+        self.assertEqual(numpy.uint8, self.dtype(
+            BitsStored=8, RescaleSlope='1', RescaleIntercept='0'))
+        self.assertEqual(numpy.uint16, self.dtype(
+            BitsStored=16, RescaleSlope='1', RescaleIntercept='0'))
+        self.assertEqual(numpy.int16, self.dtype(
+            BitsStored=12, RescaleSlope='1', RescaleIntercept='-1024'))
+        self.assertEqual(numpy.int32, self.dtype(
+            BitsStored=16, PixelRepresentation=1, RescaleSlope='2',
+            RescaleIntercept='0'))
+        self.assertEqual(numpy.uint32, self.dtype(
+            BitsStored=16, RescaleSlope='2', RescaleIntercept='0'))
+        self.assertEqual(numpy.float32, self.dtype(
+            BitsStored=12, RescaleSlope='0.5', RescaleIntercept='0'))
+        self.assertEqual(numpy.float32, self.dtype(
+            BitsStored=12, RescaleSlope='1', RescaleIntercept='0.5'))
+
+    def testVolume(self):
+        """get_pixel_array: slices rescaled into one preallocated volume...."""
+        pixels = write_series(self.directory, [0.0, 1.0, 2.0, 3.0, 4.0],
+                              rescale=('1', '-1024'))
+        serie, = pydicom_series.read_files(self.directory)
+        expected = numpy.array(pixels, dtype=numpy.int16) - 1024
+        for workers in (1, 3):
+            volume = serie.get_pixel_array(workers=workers)
+            self.assertEqual(numpy.int16, volume.dtype)
+            self.assertEqual((5, 4, 3), volume.shape)
+            self.assertTrue(numpy.array_equal(expected, volume))
+
+    def testVolumeFloat(self):
+        """get_pixel_array: a fractional slope gives a float volume........."""
+        pixels = write_series(self.directory, [0.0, 1.0, 2.0],
+                              rescale=('0.5', '10'))
+        serie, = pydicom_series.read_files(self.directory)
+        volume = serie.get_pixel_array()
+        self.assertEqual(numpy.float32, volume.dtype)
+        self.assertTrue(numpy.allclose(numpy.array(pixels) * 0.5 + 10,
+                                       volume))
+
+    def testSingleSlice(self):
+        """get_pixel_array: a series of one slice gives a 2D array.........."""
+        pixels = write_series(self.directory, [0.0], rescale=('1', '-1024'))
+        serie, = pydicom_series.read_files(self.directory)
+        image = serie.get_pixel_array()
+        self.assertEqual(numpy.int16, image.dtype)
+        self.assertTrue(numpy.array_equal(
+            pixels[0].astype(numpy.int16) - 1024, image))
+
+
+@unittest.skipUnless(have_numpy, "Numpy not installed")
+class LazyVolumeTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        pixels = write_series(self.directory, [0.0, 1.0, 2.0, 3.0],
+                              rescale=('1', '-1024'))
+        self.expected = numpy.array(pixels, dtype=numpy.int16) - 1024
+        self.serie, = pydicom_series.read_files(self.directory)
+
+        # Count the slices decoded
+        self.decoded = []
+        self.getPixelData = pydicom_series._getPixelDataFromDataset
+
+        def counting(ds, *args, **kwargs):
+            self.decoded.append(ds.InstanceNumber)
+            return self.getPixelData(ds, *args, **kwargs)
+        pydicom_series._getPixelDataFromDataset = counting
+
+    def tearDown(self):
+        pydicom_series._getPixelDataFromDataset = self.getPixelData
+        shutil.rmtree(self.directory)
+
+    def testIndexing(self):
+        """LazyVolume: indexed like the volume array........................"""
+        vol = self.serie.as_lazy_volume()
+        self.assertEqual((4, 4, 3), vol.shape)
+        self.assertEqual(numpy.int16, vol.dtype)
+        self.assertEqual(4, len(vol))
+        self.assertTrue(numpy.array_equal(self.expected[2], vol[2]))
+        self.assertTrue(numpy.array_equal(self.expected[-1], vol[-1]))
+        self.assertTrue(numpy.array_equal(self.expected[::2, 1:3],
+                                          vol[::2, 1:3]))
+        self.assertTrue(numpy.array_equal(self.expected[[3, 0], 1],
+                                          vol[[3, 0], 1]))
+        self.assertTrue(numpy.array_equal(self.expected, numpy.asarray(vol)))
+        self.assertFalse(vol[1].flags.writeable)
+        self.assertRaises(IndexError, vol.get_slice, 4)
+
+    def testBooleanMask(self):
+        """LazyVolume: a boolean mask selects the slices it marks..........."""
+        vol = self.serie.as_lazy_volume()
+        mask = numpy.array([False, True, False, True])
+        self.assertTrue(numpy.array_equal(self.expected[mask], vol[mask]))
+        self.assertTrue(numpy.array_equal(self.expected[mask, 1:],
+                                          vol[mask, 1:]))
+        self.assertTrue(numpy.array_equal(self.expected[[True] * 4],
+                                          vol[[True] * 4]))
+        self.assertEqual([1, 2, 4, 3], self.decoded)
+        self.assertRaises(IndexError, vol.__getitem__, mask[:3])
+
+    def testLeastRecentlyUsed(self):
+        """LazyVolume: the least recently used slices are dropped..........."""
+        vol = self.serie.as_lazy_volume(cacheSize=2)
+        self.assertEqual([1], self.decoded)  # the first, for the data type
+        vol[1]
+        vol[2]
+        self.assertEqual([1, 2], list(vol._cache))
+        vol[1]  # now more recently used than slice 2
+        vol[3]
+        self.assertEqual([1, 3], list(vol._cache))
+        self.assertEqual([1, 2, 3, 4], self.decoded)
+        vol[2]  # decoded again
+        self.assertEqual([1, 2, 3, 4, 3], self.decoded)
+        self.assertTrue(numpy.array_equal(self.expected[2], vol[2]))
+
+    def testScratchFile(self):
+        """LazyVolume: dropped slices are taken from the scratch file......."""
+        vol = self.serie.as_lazy_volume(cacheSize=1, scratchFile=True)
+        for z in range(4):
+            vol[z]
+        self.assertEqual([3], list(vol._cache))
+        self.assertEqual([1, 2, 3, 4], self.decoded)
+        self.assertTrue(numpy.array_equal(self.expected, numpy.asarray(vol)))
+        self.assertEqual([1, 2, 3, 4], self.decoded)  # none decoded again
+
+        scratchFile = os.path.join(self.directory, 'scratch.dat')
+        vol = self.serie.as_lazy_volume(cacheSize=1, scratchFile=scratchFile)
+        vol[1]
+        vol[2]
+        self.assertTrue(numpy.array_equal(self.expected[1], vol[1]))
+        stored = numpy.memmap(scratchFile, dtype=numpy.int16, mode='r',
+                              shape=(4, 4, 3))
+        self.assertTrue(numpy.array_equal(self.expected[:3], stored[:3]))
+        del stored, vol
+
+
+if __name__ == "__main__":
+    unittest.main()
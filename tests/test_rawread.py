@@ -256,9 +256,13 @@ class RawSequenceTests(unittest.TestCase):
 
         infile = BytesIO(hex2bytes(hexstr))
         de_gen = data_element_generator(infile, is_implicit_VR=False, is_little_endian=False)
-        seq = next(de_gen)
-        # Note seq itself is not a raw data element.
-        #     The parser does parse undefined length SQ
+        raw_seq = next(de_gen)
+        # The undefined length SQ is only skimmed to find its delimiter,
+        #     and is parsed on conversion like a defined length SQ
+        self.assertEqual(raw_seq.length, 0xffffffff)
+        self.assertEqual(raw_seq.VR, 'SQ')
+        seq = convert_value("SQ", raw_seq)
+        self.assertTrue(seq.is_undefined_length)
 
         # The sequence is parsed, but only into raw data elements.
         # They will be converted when asked for. Check some:
@@ -267,6 +271,125 @@ class RawSequenceTests(unittest.TestCase):
         got = seq[1].BeamName
         self.assertTrue(got == 'Beam 2', "Expected Beam Name 'Beam 2', got {0:s}".format(got))
 
+    def testImplVRLittleEndian_NestedUndefinedLengthSeq(self):
+        """Raw read: nested undefined length SQs are skimmed, parsed later......"""
+        hexstr = (
+            "0a 30 B0 00"    # (300a, 00b0) Beam Sequence
+            " ff ff ff ff"    # undefined length
+            " fe ff 00 e0"    # (fffe, e000) Item Tag
+            " ff ff ff ff"    # undefined length item
+            " 0a 30 c0 00"    # (300A, 00C0) Beam Number
+            " 02 00 00 00"    # length
+            " 31 20"          # value '1 '
+            " 0a 30 11 01"    # (300a, 0111) Control Point Sequence
+            " ff ff ff ff"    # undefined length
+            " fe ff 00 e0"    # (fffe, e000) Item Tag
+            " ff ff ff ff"    # undefined length item
+            " 0a 30 12 01"    # (300a, 0112) Control Point Index
+            " 02 00 00 00"    # length
+            " 37 20"          # value '7 '
+            " fe ff 0d e0"    # Item Delimiter
+            " 00 00 00 00"    # zero length
+            " fe ff dd e0"    # SQ delimiter (of Control Point Sequence)
+            " 00 00 00 00"    # zero length
+            " fe ff 0d e0"    # Item Delimiter
+            " 00 00 00 00"    # zero length
+            " fe ff 00 e0"    # (fffe, e000) Item Tag
+            " 0a 00 00 00"    # Item (dataset) Length
+            " 0a 30 c0 00"    # (300A, 00C0) Beam Number
+            " 02 00 00 00"    # length
+            " 32 20"          # value '2 '
+            " fe ff dd e0"    # SQ delimiter (of Beam Sequence)
+            " 00 00 00 00"    # zero length
+            " 08 00 3e 10"    # (0008, 103e) LO "Series Description"
+            " 04 00 00 00"    # length
+            " 53 45 52 20"    # value 'SER '
+        )
+
+        infile = BytesIO(hex2bytes(hexstr))
+        de_gen = data_element_generator(infile, is_implicit_VR=True,
+                                        is_little_endian=True)
+        raw_seq = next(de_gen)
+        self.assertEqual(raw_seq.VR, 'SQ')
+        self.assertEqual(raw_seq.length, 0xffffffff)
+        self.assertEqual(len(raw_seq.value), 86)
+
+        # Reading continues after the outer delimiter, not a nested one
+        elem = next(de_gen)
+        self.assertEqual(elem.tag, 0x0008103e)
+
+        seq = convert_value("SQ", raw_seq)
+        self.assertEqual(len(seq), 2)
+        self.assertEqual(seq[0].BeamNumber, 1)
+        self.assertEqual(seq[1].BeamNumber, 2)
+        self.assertTrue(seq[0].is_undefined_length_sequence_item)
+        control_points = seq[0].ControlPointSequence
+        self.assertEqual(len(control_points), 1)
+        self.assertEqual(control_points[0].ControlPointIndex, 7)
+        self.assertTrue(seq[0][0x300a0111].is_undefined_length)
+
+    def testExplVRLittleEndian_UndefinedLengthUNInSeq(self):
+        """Raw read: undefined length UN in a skimmed SQ read as implicit VR..."""
+        hexstr = (
+            "0a 30 B0 00"    # (300a, 00b0) Beam Sequence
+            " 53 51 00 00"    # SQ, reserved
+            " ff ff ff ff"    # undefined length
+            " fe ff 00 e0"    # (fffe, e000) Item Tag
+            " ff ff ff ff"    # undefined length item
+            " 11 00 10 10"    # (0011, 1010) private element
+            " 55 4e 00 00"    # UN, reserved
+            " ff ff ff ff"    # undefined length
+            " fe ff 00 e0"    # (fffe, e000) Item Tag
+            " ff ff ff ff"    # undefined length item
+            " 11 00 11 10"    # (0011, 1011) private element, implicit VR
+            " 04 00 00 00"    # length
+            " fe ff dd e0"    # value, which looks like an SQ delimiter
+            " fe ff 0d e0"    # Item Delimiter
+            " 00 00 00 00"    # zero length
+            " fe ff dd e0"    # SQ delimiter (of the UN element)
+            " 00 00 00 00"    # zero length
+            " fe ff 0d e0"    # Item Delimiter
+            " 00 00 00 00"    # zero length
+            " fe ff dd e0"    # SQ delimiter (of Beam Sequence)
+            " 00 00 00 00"    # zero length
+            " 08 00 3e 10"    # (0008, 103e) Series Description
+            " 4c 4f 04 00"    # LO, length
+            " 53 45 52 20"    # value 'SER '
+        )
+
+        infile = BytesIO(hex2bytes(hexstr))
+        de_gen = data_element_generator(infile, is_implicit_VR=False,
+                                        is_little_endian=True)
+        raw_seq = next(de_gen)
+        self.assertEqual(raw_seq.VR, 'SQ')
+        self.assertEqual(len(raw_seq.value), 64)
+        elem = next(de_gen)
+        self.assertEqual(elem.tag, 0x0008103e)
+        self.assertEqual(elem.value, b'SER ')
+
+    def testUndefinedLengthSeqDeferred(self):
+        """Raw read: undefined length SQ longer than defer_size is skipped......"""
+        hexstr = (
+            "0a 30 B0 00"    # (300a, 00b0) Beam Sequence
+            " ff ff ff ff"    # undefined length
+            " fe ff 00 e0"    # (fffe, e000) Item Tag
+            " 0a 00 00 00"    # Item (dataset) Length
+            " 0a 30 c0 00"    # (300A, 00C0) Beam Number
+            " 02 00 00 00"    # length
+            " 32 20"          # value '2 '
+            " fe ff dd e0"    # SQ delimiter
+            " 00 00 00 00"    # zero length
+            " 08 00 3e 10"    # (0008, 103e) LO "Series Description"
+            " 04 00 00 00"    # length
+            " 53 45 52 20"    # value 'SER '
+        )
+        infile = BytesIO(hex2bytes(hexstr))
+        de_gen = data_element_generator(infile, is_implicit_VR=True,
+                                        is_little_endian=True, defer_size=8)
+        raw_seq = next(de_gen)
+        self.assertEqual(raw_seq.value, None)
+        self.assertEqual(next(de_gen).value, b'SER ')
+
 
 if __name__ == "__main__":
     # import pydicom
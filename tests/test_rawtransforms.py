@@ -0,0 +1,123 @@
+# test_rawtransforms.py
+"""unittest cases for pydicom.rawtransforms module"""
+# Copyright (c) 2017 Darcy Mason
+# This file is part of pydicom, released under a modified MIT license.
+#    See the file license.txt included with this distribution, also
+#    available at https://github.com/darcymason/pydicom
+
+import os
+import unittest
+
+from pydicom import config
+from pydicom.dataelem import RawDataElement
+from pydicom.dicomio import read_file
+from pydicom.rawtransforms import RawTransforms
+from pydicom.tag import Tag
+
+test_dir = os.path.dirname(__file__)
+test_files = os.path.join(test_dir, 'test_files')
+rtplan_name = os.path.join(test_files, "rtplan.dcm")
+
+
+def raw_element(tag, VR, value, is_implicit_VR=False):
+    return RawDataElement(Tag(tag), VR, len(value), value, 0,
+                          is_implicit_VR, True)
+
+
+class RawTransformsTests(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.transforms = RawTransforms()
+
+    def recorder(self, name):
+        """Return a transform recording its calls and appending to values"""
+        def transform(raw_elem, suffix=b''):
+            self.calls.append((name, raw_elem.tag))
+            return raw_elem._replace(value=raw_elem.value + suffix)
+        return transform
+
+    def testEmpty(self):
+        """RawTransforms: an empty pipeline returns the element as it is...."""
+        raw = raw_element(0x00100010, 'PN', b'Citizen^Jan')
+        self.assertFalse(self.transforms)
+        self.assertTrue(self.transforms(raw) is raw)
+
+    def testDispatchByVR(self):
+        """RawTransforms: transforms only called for their VRs..............."""
+        self.transforms.add(self.recorder('DS'), VRs=['DS'])
+        self.transforms.add(self.recorder('all'))
+        self.transforms(raw_element(0x00280030, 'DS', b'1\\1'))
+        self.transforms(raw_element(0x00100010, 'PN', b'Citizen^Jan'))
+        self.assertEqual([('DS', 0x00280030), ('all', 0x00280030),
+                          ('all', 0x00100010)], self.calls)
+
+    def testImplicitVR(self):
+        """RawTransforms: implicit VRs are looked up in the dictionary......."""
+        self.transforms.add(self.recorder('DS'), VRs=['DS'])
+        self.transforms.add(self.recorder('unknown'), VRs=[None])
+        self.transforms(raw_element(0x00280030, None, b'1\\1', True))
+        self.transforms(raw_element(0x00100010, None, b'Citizen^Jan', True))
+        self.transforms(raw_element(0x00091001, None, b'1,2', True))
+        self.assertEqual([('DS', 0x00280030), ('unknown', 0x00091001)],
+                         self.calls)
+
+    def testDispatchByTag(self):
+        """RawTransforms: tags and VRs must both match if both given........."""
+        self.transforms.add(self.recorder('tag'), tags=[(0x0010, 0x0010)])
+        self.transforms.add(self.recorder('tag and VR'), VRs=['LO'],
+                            tags=[0x00100010, 0x00100020])
+        self.transforms(raw_element(0x00100010, 'PN', b'Citizen^Jan'))
+        self.transforms(raw_element(0x00100020, 'LO', b'12345'))
+        self.transforms(raw_element(0x00100030, 'DA', b'20000101'))
+        self.assertEqual([('tag', 0x00100010), ('tag and VR', 0x00100020)],
+                         self.calls)
+
+    def testOrderAndReplace(self):
+        """RawTransforms: applied in order; adding again replaces............"""
+        first = self.recorder('first')
+        self.transforms.add(first, VRs=['LO'], suffix=b'1')
+        self.transforms.add(self.recorder('second'), suffix=b'2')
+        raw = self.transforms(raw_element(0x00100020, 'LO', b'ID'))
+        self.assertEqual(b'ID12', raw.value)
+
+        self.transforms.add(first, suffix=b'3')
+        self.assertEqual(2, len(self.transforms))
+        raw = self.transforms(raw_element(0x00100010, 'PN', b'N'))
+        self.assertEqual(b'N32', raw.value)
+
+        self.transforms.remove(first)
+        self.assertFalse(first in self.transforms)
+        raw = self.transforms(raw_element(0x00100020, 'LO', b'ID'))
+        self.assertEqual(b'ID2', raw.value)
+
+    def testReadFile(self):
+        """RawTransforms: given to read_file, applied in sequence items......"""
+        def upper(raw_elem):
+            return raw_elem._replace(value=raw_elem.value.upper())
+        self.transforms.add(upper, VRs=['LO'])
+        ds = read_file(rtplan_name, raw_transforms=self.transforms)
+        self.assertEqual('ID00001', ds.PatientID)
+        self.assertEqual('Last^First^mid^pre', ds.PatientName)
+        beam = ds.BeamSequence[0]
+        self.assertEqual(beam.Manufacturer.upper(), beam.Manufacturer)
+
+        ds = read_file(rtplan_name)
+        self.assertNotEqual(ds.BeamSequence[0].Manufacturer.upper(),
+                            ds.BeamSequence[0].Manufacturer)
+
+    def testGlobalTransforms(self):
+        """RawTransforms: config.raw_transforms unless others are given......"""
+        def upper(raw_elem):
+            return raw_elem._replace(value=raw_elem.value.upper())
+        config.raw_transforms.add(upper, tags=[0x00100010])
+        try:
+            ds = read_file(rtplan_name)
+            self.assertEqual('LAST^FIRST^MID^PRE', ds.PatientName)
+            ds = read_file(rtplan_name, raw_transforms=self.transforms)
+            self.assertEqual('Last^First^mid^pre', ds.PatientName)
+        finally:
+            config.raw_transforms.remove(upper)
+
+
+if __name__ == "__main__":
+    unittest.main()
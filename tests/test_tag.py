@@ -161,6 +161,15 @@ class TestBaseTag(unittest.TestCase):
             BaseTag(0x00010002) == 'eraa'
         self.assertRaises(TypeError, test_raise)
 
+    def test_eq_out_of_range_raises(self):
+        """Test __eq__ raises TypeError when comparing to an invalid tag."""
+        def test_raise():
+            BaseTag(0x00010002) == (0x10000, 0x0002)
+        self.assertRaises(TypeError, test_raise)
+        def test_raise():
+            BaseTag(0x00010002) == -1
+        self.assertRaises(TypeError, test_raise)
+
     def test_ne_same_class(self):
         """Test __ne__ of two classes with same type."""
         self.assertFalse(BaseTag(0x00000000) != BaseTag(0x00000000))
@@ -234,6 +243,11 @@ class TestTag(unittest.TestCase):
         # Must be positive
         self.assertRaises(ValueError, Tag, -1)
 
+    def test_tag_single_tag(self):
+        """Test creating a Tag from a BaseTag returns the same tag."""
+        tag = BaseTag(0x00100010)
+        self.assertTrue(Tag(tag) is tag)
+
     def test_tag_single_tuple(self):
         """Test creating a Tag from a single tuple."""
         self.assertEqual(Tag((0x0000, 0x0000)), BaseTag(0x00000000))
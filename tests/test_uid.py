@@ -5,8 +5,13 @@
 #    See the file license.txt included with this distribution, also
 #    available at https://github.com/darcymason/pydicom
 
+import pickle
 import unittest
+from pydicom import compat
+from pydicom import uid as uid_module
 from pydicom.uid import UID, generate_uid, pydicom_root_UID, InvalidUID
+from pydicom.uid import UIDSet, UncompressedPixelTransferSyntaxes
+from pydicom.uid import UncompressedPixelTransferSyntaxSet
 
 
 class UIDtests(unittest.TestCase):
@@ -41,6 +46,12 @@ class UIDtests(unittest.TestCase):
         self.assertEqual(uid, '1.2.840.10008.1.2',
                          "UID equality failed on number string")
 
+    def testCompareUIDByName(self):
+        """UID: comparing against a UID holding a name............"""
+        uid = UID('1.2.840.10008.1.2')
+        self.assertEqual(uid, UID('Implicit VR Little Endian'))
+        self.assertNotEqual(uid, UID('Explicit VR Little Endian'))
+
     def testCompareNumber(self):
         """UID: comparing against a number give False............."""
         # From issue 96
@@ -60,8 +71,90 @@ class UIDtests(unittest.TestCase):
         uid = UID('1.2.3')
         self.assertNotEqual(uid, None, "Comparison to a number returned True")
 
+    def testCompareSharedName(self):
+        """UID: comparing by a name shared by two UIDs............"""
+        self.assertEqual(UID('1.2.840.10008.5.1.4.1.1.6.1'),
+                         'Ultrasound Image Storage')
+        self.assertEqual(UID('1.2.840.10008.5.1.4.1.1.6'),
+                         'Ultrasound Image Storage')
+        self.assertNotEqual(UID('1.2.840.10008.5.1.4.1.1.6'),
+                            'Ultrasound Multi-frame Image Storage')
+
+    def testMatches(self):
+        """UID: matches accepts a UID or a name..................."""
+        uid = UID('1.2.840.10008.1.2')
+        self.assertTrue(uid.matches('1.2.840.10008.1.2'))
+        self.assertTrue(uid.matches('Implicit VR Little Endian'))
+        self.assertFalse(uid.matches('Explicit VR Little Endian'))
+        self.assertFalse(uid.matches('1.2.840.10008.1.2.1'))
+        self.assertTrue(UID('1.2.3').matches('1.2.3'))
+        self.assertFalse(UID('1.2.3').matches(None))
+
+    def testUIDSet(self):
+        """UID: set membership by UID or by name.................."""
+        self.assertTrue(isinstance(UncompressedPixelTransferSyntaxes, list))
+        syntaxes = UncompressedPixelTransferSyntaxSet
+        self.assertTrue(isinstance(syntaxes, UIDSet))
+        self.assertEqual(set(UncompressedPixelTransferSyntaxes), syntaxes)
+        self.assertTrue(UID('1.2.840.10008.1.2.2') in syntaxes)
+        self.assertTrue('1.2.840.10008.1.2.2' in syntaxes)
+        self.assertTrue('Explicit VR Big Endian' in syntaxes)
+        self.assertFalse('1.2.840.10008.1.2.4.50' in syntaxes)
+        self.assertFalse('JPEG Baseline (Process 1)' in syntaxes)
+        self.assertFalse(None in syntaxes)
+        self.assertFalse([] in syntaxes)
+
     def testTransferSyntaxes(self):
-        pass
+        """UID: transfer syntax properties........................"""
+        uid = UID('1.2.840.10008.1.2.2')  # Explicit VR Big Endian
+        self.assertTrue(uid.is_transfer_syntax)
+        self.assertFalse(uid.is_implicit_VR)
+        self.assertFalse(uid.is_little_endian)
+        self.assertFalse(uid.is_deflated)
+        uid = UID('1.2.840.10008.1.2.1.99')  # Deflated Explicit VR LE
+        self.assertFalse(uid.is_implicit_VR)
+        self.assertTrue(uid.is_little_endian)
+        self.assertTrue(uid.is_deflated)
+        uid = UID('1.2.840.10008.5.1.4.1.1.2')  # CT Image Storage
+        self.assertFalse(uid.is_transfer_syntax)
+        self.assertFalse(hasattr(uid, 'is_little_endian'))
+
+    def testUnknownUID(self):
+        """UID: unknown UID properties............................"""
+        uid = UID('1.2.3')
+        self.assertEqual('1.2.3', uid.name)
+        self.assertEqual(None, uid.type)
+        self.assertEqual(None, uid.info)
+        self.assertEqual(None, uid.is_retired)
+        self.assertFalse(uid.is_transfer_syntax)
+
+    def testInterned(self):
+        """UID: equal UIDs are the same instance.................."""
+        uid = UID('1.2.3.4.5')
+        self.assertTrue(UID('1.2.3.4.5') is uid)
+        self.assertTrue(UID('1.2.3.4.5 ') is uid)
+        self.assertFalse(hasattr(uid, '__dict__'))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertTrue(pickle.loads(pickle.dumps(uid, protocol)) is uid)
+
+    @unittest.skipUnless(compat.in_py2, "UIDs are weakly referenced")
+    def testInternedLimit(self):
+        """UID: Python 2 holds the most recently used interned UIDs."""
+        interned = uid_module._interned_uids
+        max_interned = uid_module._max_interned_uids
+        uid_module._interned_uids = interned.__class__()
+        uid_module._max_interned_uids = 2
+        try:
+            uids = [UID('1.2.3.4.5.%d' % i) for i in range(2)]
+            self.assertTrue(UID('1.2.3.4.5.0') is uids[0])
+            UID('1.2.3.4.5.2')  # evicts 1.2.3.4.5.1, the least recently used
+            self.assertEqual(['1.2.3.4.5.0', '1.2.3.4.5.2'],
+                             list(uid_module._interned_uids))
+            self.assertTrue(UID('1.2.3.4.5.0') is uids[0])
+            self.assertFalse(UID('1.2.3.4.5.1') is uids[1])
+        finally:
+            uid_module._interned_uids = interned
+            uid_module._max_interned_uids = max_interned
 
     def testGenerateUID(self):
         '''
@@ -7,19 +7,29 @@
 
 from io import BytesIO
 import os
+import shutil
+import tempfile
 import unittest
 
 from pydicom import compat
 from pydicom import config
 from pydicom import filereader
+from pydicom.rawtransforms import RawTransforms
 from pydicom.util import fixer
 from pydicom.util import hexutil
+from pydicom.util.catalog import Catalog
+from pydicom.util.extract import extract_table, have_numpy
 from pydicom import valuerep
 
 
 test_dir = os.path.dirname(__file__)
 raw_hex_module = os.path.join(test_dir, '_write_stds.py')
 raw_hex_code = open(raw_hex_module, "rb").read()
+test_files = os.path.join(test_dir, 'test_files')
+ct_name = os.path.join(test_files, "CT_small.dcm")
+mr_name = os.path.join(test_files, "MR_small.dcm")
+rtplan_name = os.path.join(test_files, "rtplan.dcm")
+missing_name = os.path.join(test_files, "no_such_file.dcm")
 
 
 class DataElementCallbackTests(unittest.TestCase):
@@ -58,6 +68,224 @@ class DataElementCallbackTests(unittest.TestCase):
         msg = "Expected {0}, got {1}".format(expected, got)
         self.assertEqual(expected, got, msg)
 
+    def testSeparatorPerRead(self):
+        """util.fix_separator: Transform given to a single read.............."""
+        transforms = RawTransforms()
+        fixer.fix_separator(b",", transforms=transforms)
+        self.assertFalse(config.raw_transforms)
+        ds = filereader.read_dataset(self.bytesio, is_little_endian=True,
+                                     is_implicit_VR=True,
+                                     raw_transforms=transforms)
+        expected = [valuerep.DSfloat(x) for x in ["2", "4", "8", "16"]]
+        got = ds.ROIContourSequence[0].ContourSequence[0].ContourData
+        self.assertEqual(expected, got)
+
+
+class ExtractTableTests(unittest.TestCase):
+    """Test util.extract.extract_table"""
+    paths = [ct_name, mr_name, missing_name, rtplan_name]
+    tags = ['PatientName', 0x00280010, 'PixelSpacing', (0x0009, 0x1001)]
+
+    def as_lists(self, batch):
+        """Return the columns of `batch` as lists, with None if missing"""
+        if have_numpy:
+            return dict((name, column.tolist())
+                        for name, column in batch.items())
+        return dict(batch)
+
+    def testColumns(self):
+        """extract_table: Columns of values keyed by keyword or tag.........."""
+        batches = list(extract_table(self.paths, self.tags))
+        self.assertEqual(1, len(batches))
+        names = ['PatientName', 'Rows', 'PixelSpacing', 0x00091001]
+        self.assertEqual(names, list(batches[0].keys()))
+        columns = self.as_lists(batches[0])
+        self.assertEqual(['CompressedSamples^CT1', 'CompressedSamples^MR1',
+                          None, 'Last^First^mid^pre'],
+                         columns['PatientName'])
+        self.assertEqual([128, 64, None, None], columns['Rows'])
+        self.assertEqual([[0.661468, 0.661468], [0.3125, 0.3125]],
+                         columns['PixelSpacing'][:2])
+        self.assertEqual(['GE_GENESIS_FF', None, None, None],
+                         columns[0x00091001])
+
+    def testBatches(self):
+        """extract_table: Files are yielded in batches of batch_size........."""
+        batches = list(extract_table(iter(self.paths), self.tags,
+                                     batch_size=3))
+        self.assertEqual([3, 1], [len(batch['Rows']) for batch in batches])
+        self.assertEqual('Last^First^mid^pre',
+                         self.as_lists(batches[1])['PatientName'][0])
+
+    def testWorkers(self):
+        """extract_table: Reading with worker processes gives same table....."""
+        expected = [self.as_lists(batch) for batch in
+                    extract_table(self.paths, self.tags, batch_size=2)]
+        got = [self.as_lists(batch) for batch in
+               extract_table(self.paths, self.tags, workers=2, batch_size=2)]
+        self.assertEqual(expected, got)
+
+    def testUIDColumn(self):
+        """extract_table: UIDs are given as their values, not names.........."""
+        batch = next(extract_table(self.paths, ['SOPClassUID']))
+        column = self.as_lists(batch)['SOPClassUID']
+        self.assertEqual(['1.2.840.10008.5.1.4.1.1.2',
+                          '1.2.840.10008.5.1.4.1.1.4', None,
+                          '1.2.840.10008.5.1.4.1.1.481.5'], column)
+        self.assertTrue(type(column[0]) is str)
+
+    def testVariableMultiplicity(self):
+        """extract_table: Elements of VM 1-n keep all their values..........."""
+        directory = tempfile.mkdtemp()
+        try:
+            ds = filereader.read_file(mr_name)
+            ds.WindowCenter = ['600', '700']
+            two_values_name = os.path.join(directory, "two_values.dcm")
+            ds.save_as(two_values_name)
+            batch = next(extract_table([ct_name, mr_name, two_values_name],
+                                       ['WindowCenter']))
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual([None, 600.0, [600.0, 700.0]],
+                         self.as_lists(batch)['WindowCenter'])
+        if have_numpy:
+            self.assertEqual(object, batch['WindowCenter'].dtype)
+            self.assertEqual([True, False, False],
+                             batch['WindowCenter'].mask.tolist())
+
+    def testMalformedFile(self):
+        """extract_table: A malformed file only gives missing values........."""
+        directory = tempfile.mkdtemp()
+        try:
+            with open(ct_name, "rb") as f:
+                data = f.read()
+            # An unknown VR for PatientName
+            index = data.index(b"\x10\x00\x10\x00PN")
+            bad_name = os.path.join(directory, "bad_VR.dcm")
+            with open(bad_name, "wb") as f:
+                f.write(data[:index + 4] + b"ZZ" + data[index + 6:])
+            paths = [ct_name, bad_name, mr_name]
+            for workers in (1, 2):
+                batch = next(extract_table(paths, self.tags, workers=workers))
+                columns = self.as_lists(batch)
+                self.assertEqual(['CompressedSamples^CT1', None,
+                                  'CompressedSamples^MR1'],
+                                 columns['PatientName'])
+                self.assertEqual([128, None, 64], columns['Rows'])
+        finally:
+            shutil.rmtree(directory)
+
+    def testInvalidTags(self):
+        """extract_table: Unknown keywords and sequences raise ValueError...."""
+        self.assertRaises(ValueError, list,
+                          extract_table(self.paths, ['NotAKeyword']))
+        self.assertRaises(ValueError, list,
+                          extract_table(self.paths, ['BeamSequence']))
+
+    @unittest.skipUnless(have_numpy, "Numpy not installed")
+    def testNumpyColumns(self):
+        """extract_table: Numeric VRs give numeric masked arrays............."""
+        batch = next(extract_table(self.paths, self.tags))
+        self.assertEqual('uint16', batch['Rows'].dtype)
+        self.assertEqual([False, False, True, True],
+                         batch['Rows'].mask.tolist())
+        self.assertEqual((4, 2), batch['PixelSpacing'].shape)
+        self.assertEqual('float64', batch['PixelSpacing'].dtype)
+        self.assertEqual(object, batch['PatientName'].dtype)
+
+
+class CatalogTests(unittest.TestCase):
+    """Test util.catalog.Catalog"""
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.tree = os.path.join(self.directory, "tree")
+        os.makedirs(os.path.join(self.tree, "sub"))
+        for name in (ct_name, mr_name):
+            shutil.copy(name, self.tree)
+        shutil.copy(rtplan_name, os.path.join(self.tree, "sub"))
+        with open(os.path.join(self.tree, "readme.txt"), "w") as f:
+            f.write("Not DICOM")
+        self.db_name = os.path.join(self.directory, "catalog.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.tree, name)
+
+    def testUpdate(self):
+        """Catalog: Catalogs the DICOM files in a tree......................"""
+        with Catalog(self.db_name, tags=["Modality"]) as catalog:
+            self.assertEqual(4, catalog.update([self.tree]))
+            self.assertEqual([self.path("CT_small.dcm"),
+                              self.path("MR_small.dcm"),
+                              self.path(os.path.join("sub", "rtplan.dcm"))],
+                             catalog.paths())
+            self.assertEqual([self.path("MR_small.dcm")],
+                             catalog.paths(Modality="MR"))
+            self.assertEqual([self.path("CT_small.dcm")],
+                             catalog.paths(PatientID="1CT1"))
+            datasets = list(catalog.datasets(Modality="CT"))
+            self.assertEqual("CompressedSamples^CT1", datasets[0].PatientName)
+
+    def testQueryByUID(self):
+        """Catalog: UIDs are catalogued and queried by their values........."""
+        ct = filereader.read_file(ct_name, stop_before_pixels=True)
+        with Catalog(self.db_name, tags=["SOPClassUID"]) as catalog:
+            catalog.update([self.tree])
+            self.assertEqual([self.path("CT_small.dcm")],
+                             catalog.paths(
+                                 SOPClassUID="1.2.840.10008.5.1.4.1.1.2"))
+            self.assertEqual([self.path("CT_small.dcm")],
+                             catalog.paths(SOPClassUID=ct.SOPClassUID))
+            self.assertEqual([self.path("CT_small.dcm")],
+                             catalog.paths(
+                                 SOPInstanceUID=ct.SOPInstanceUID))
+            self.assertEqual([], catalog.paths(SOPClassUID="CT Image Storage"))
+
+    def testPixelDataOffset(self):
+        """Catalog: Records the file offset of the Pixel Data value........."""
+        with Catalog(self.db_name) as catalog:
+            catalog.update([self.tree])
+            rows = catalog.connection.execute(
+                "SELECT path, pixel_data_offset FROM files")
+            offsets = dict(rows)
+        self.assertEqual(None, offsets[self.path(os.path.join("sub",
+                                                              "rtplan.dcm"))])
+        pixel_data = filereader.read_file(ct_name).PixelData
+        with open(self.path("CT_small.dcm"), "rb") as f:
+            f.seek(offsets[self.path("CT_small.dcm")])
+            self.assertEqual(pixel_data, f.read(len(pixel_data)))
+
+    def testIncrementalUpdate(self):
+        """Catalog: Only reads new and changed files again.................."""
+        with Catalog(self.db_name) as catalog:
+            catalog.update([self.tree])
+        with Catalog(self.db_name) as catalog:
+            self.assertEqual(0, catalog.update([self.tree]))
+            os.remove(self.path("MR_small.dcm"))
+            stat = os.stat(self.path("CT_small.dcm"))
+            os.utime(self.path("CT_small.dcm"),
+                     (stat.st_atime, stat.st_mtime + 10))
+            self.assertEqual(1, catalog.update([self.tree]))
+            self.assertEqual([self.path("CT_small.dcm"),
+                              self.path(os.path.join("sub", "rtplan.dcm"))],
+                             catalog.paths())
+
+    def testAddTags(self):
+        """Catalog: Reads all files again when tags are added..............."""
+        with Catalog(self.db_name) as catalog:
+            catalog.update([self.tree])
+        with Catalog(self.db_name, tags=["Rows"]) as catalog:
+            self.assertEqual(4, catalog.update([self.tree]))
+            self.assertEqual([self.path("MR_small.dcm")],
+                             catalog.paths(Rows=64))
+
+    def testInvalidCriteria(self):
+        """Catalog: Querying an element not catalogued raises ValueError...."""
+        with Catalog(self.db_name) as catalog:
+            self.assertRaises(ValueError, catalog.paths, Modality="CT")
+
 
 if __name__ == "__main__":
     unittest.main()